@@ -0,0 +1,87 @@
+import argparse
+import sys
+import time
+
+from utils import backup
+
+# Backups incrementales de las sesiones desde la línea de comandos.
+#
+# Usa las mismas credenciales que la app (.streamlit/secrets.toml). Los
+# backups se guardan en ./backups o en STUDY_TRACKER_BACKUP_DIR.
+#
+# Uso:
+#   python backup_sessions.py create
+#   python backup_sessions.py list
+#   python backup_sessions.py restore [SNAPSHOT] [--replace]
+
+
+def cmd_create(args) -> int:
+    start = time.perf_counter()
+    summary = backup.create_backup(full=args.full)
+    elapsed = (time.perf_counter() - start) * 1000
+    if summary is None:
+        print("❌ Backup failed")
+        return 1
+    if summary.get('unchanged'):
+        print(f"✅ No changes since {summary['id']} ({elapsed:.0f} ms)")
+        return 0
+
+    kind = "full" if summary['full'] else "incremental"
+    print(f"✅ Snapshot {summary['id']} ({kind}) in {elapsed:.0f} ms: "
+          f"{summary['row_count']} rows, {summary['changed']} changed, "
+          f"{summary['removed']} removed, {summary['new_objects']} new objects")
+    return 0
+
+
+def cmd_list(args) -> int:
+    snapshots = backup.list_backups()
+    if not snapshots:
+        print("⚠️ No backups yet")
+        return 0
+    for s in snapshots:
+        kind = "full" if s['full'] else "incr"
+        print(f"{s['id']}  {kind:<4}  rows={s['row_count']:<7} changed={s['changed']:<7} removed={s['removed']}")
+    return 0
+
+
+def cmd_restore(args) -> int:
+    print(f"📥 Restoring {args.snapshot or 'latest snapshot'}...")
+    try:
+        result = backup.restore_backup(args.snapshot, replace=args.replace)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"✅ Restored {result['restored']} sessions from {result['snapshot']}")
+    if args.replace:
+        print(f"🗑️ Removed {result['removed']} sessions not in the snapshot")
+    if result['defaulted']:
+        print(f"ℹ️ {result['defaulted']} unrecognized category/difficulty/focus values were set to the default")
+    if result['failed_batches']:
+        print(f"❌ Failed batches: {result['failed_batches']}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Incremental, content-addressed backups of study sessions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="Write a new snapshot")
+    create.add_argument("--full", action="store_true", help="Write a full snapshot")
+    create.set_defaults(func=cmd_create)
+
+    listing = commands.add_parser("list", help="List snapshots")
+    listing.set_defaults(func=cmd_list)
+
+    restore = commands.add_parser("restore", help="Bulk-load a snapshot into Supabase")
+    restore.add_argument("snapshot", nargs="?", help="Snapshot ID (default: latest)")
+    restore.add_argument("--replace", action="store_true",
+                         help="Also delete sessions that are not in the snapshot")
+    restore.set_defaults(func=cmd_restore)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+import argparse
+import sys
+import time
+
+from utils import data_manager, exporter
+
+# Exportación del historial completo desde la línea de comandos.
+#
+# Lee Supabase página a página y escribe el archivo a medida que llegan las
+# sesiones, así que la memoria no crece con el tamaño del historial.
+# Usa las mismas credenciales que la app (.streamlit/secrets.toml).
+#
+# Uso:
+#   python export_sessions.py csv
+#   python export_sessions.py markdown --output articulos.zip
+#   python export_sessions.py jsonl --output - | gzip > historial.jsonl.gz
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stream the full study history to a file")
+    parser.add_argument("format", choices=exporter.FORMATS, help="Output format")
+    parser.add_argument("--output", help="Output file, or - for stdout (default: study_sessions.<ext>)")
+    parser.add_argument("--page-size", type=int, default=data_manager.EXPORT_PAGE_SIZE,
+                        help="Rows fetched per request")
+    args = parser.parse_args()
+
+    output = args.output or exporter.export_filename(args.format)
+    to_stdout = output == "-"
+    log = sys.stderr if to_stdout else sys.stdout
+
+    count = 0
+
+    def counted():
+        nonlocal count
+        for session in data_manager.iter_sessions(args.page_size):
+            count += 1
+            yield session
+
+    start = time.perf_counter()
+    stream = sys.stdout.buffer if to_stdout else open(output, "wb")
+    try:
+        for data in exporter.export_sessions(counted(), args.format):
+            stream.write(data)
+    except Exception as e:
+        print(f"❌ Export failed after {count} sessions: {e}", file=log)
+        return 1
+    finally:
+        if not to_stdout:
+            stream.close()
+
+    target = "stdout" if to_stdout else output
+    print(f"✅ Exported {count} sessions to {target} in {time.perf_counter() - start:.1f}s", file=log)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+import argparse
+import sys
+import time
+
+from utils import importer
+
+# Importación masiva de sesiones desde la línea de comandos.
+#
+# Usa las mismas credenciales que la app (.streamlit/secrets.toml).
+#
+# Uso:
+#   python import_sessions.py historial.csv
+#   python import_sessions.py export.parquet --chunk-size 5000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk import study sessions from CSV, JSON-lines or Parquet")
+    parser.add_argument("path", help="File to import")
+    parser.add_argument("--format", choices=importer.FORMATS, help="Override format detection by extension")
+    parser.add_argument("--chunk-size", type=int, default=importer.DEFAULT_CHUNK_SIZE,
+                        help="Rows per chunk and per upsert")
+    args = parser.parse_args()
+
+    print(f"🚀 Importing {args.path}...")
+    start = time.perf_counter()
+    try:
+        result = importer.import_sessions(
+            args.path, fmt=args.format, chunk_size=args.chunk_size,
+            progress=lambda rows: print(f"  - {rows} rows read")
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"\n🏁 Import complete in {time.perf_counter() - start:.1f}s")
+    print(f"✅ Imported: {result['imported']}")
+    print(f"⚠️ Rejected: {result['rejected']}")
+    print(f"ℹ️ Defaulted enum values: {result['defaulted']}")
+    print(f"❌ Failed batches: {result['failed_batches']}")
+    for error in result['errors']:
+        print(f"  - {error}")
+
+    return 1 if result['failed_batches'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from utils.enums import Category, Difficulty, FocusLevel
+from utils.exporter import FORMATS as EXPORT_FORMATS
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Prueba de carga con usuarios concurrentes.
+#
+# Cada usuario virtual recorre las páginas con AppTest de Streamlit, sin
+# navegador: abre el dashboard, registra una sesión con el formulario, busca
+# en el historial, abre la sesión encontrada y la borra. Todo corre contra el backend local
+# (utils/local_backend.py) para no tocar Supabase.
+#
+# Uso:
+#   python load_test.py --users 10 --iterations 5 --sessions 500
+#   python load_test.py --backend sqlite:///load_test.db
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+DASHBOARD_PAGE = os.path.join(ROOT, "pages", "1_Dashboard.py")
+FORM_PAGE = os.path.join(ROOT, "pages", "2_New_session.py")
+HISTORY_PAGE = os.path.join(ROOT, "pages", "3_History.py")
+
+# Claves canónicas, como las guarda el formulario
+CATEGORIES = Category.keys()
+DIFFICULTIES = Difficulty.keys()
+FOCUS_LEVELS = FocusLevel.keys()
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Pico de memoria residente del proceso, en MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo da en KB, macOS en bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def seed_sessions(backend: str, count: int) -> None:
+    """Cargar sesiones sintéticas en el backend local."""
+    from utils.local_backend import create_local_client
+
+    start = date.today() - timedelta(days=count)
+    rows = [
+        {
+            'id': f"seed_{i:06d}",
+            'day': i + 1,
+            'date': (start + timedelta(days=i)).strftime("%Y-%m-%d"),
+            'category': CATEGORIES[i % len(CATEGORIES)],
+            # Token único por sesión para que la búsqueda devuelva solo esa
+            'topic': f"Seed topic s{i:06d} {CATEGORIES[i % len(CATEGORIES)]}",
+            'duration': f"{1 + i % 3} hours",
+            'daily_win': f"Win {i}",
+            'key_learnings': "Window functions, CTEs and indexes " * 3,
+            'resources': "Docs",
+            'difficulty': DIFFICULTIES[i % len(DIFFICULTIES)],
+            'focus_level': FOCUS_LEVELS[i % len(FOCUS_LEVELS)],
+            'obstacles': "",
+            'next_steps': "",
+            'practical_application': "",
+            'created_at': (start + timedelta(days=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+    create_local_client(backend).table("study_sessions").upsert(rows).execute()
+
+
+class Recorder:
+    """Latencias por flujo, compartidas entre usuarios virtuales."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.user_errors: Dict[int, int] = {}
+
+    def run(self, flow: str, at, user_id: int) -> bool:
+        """Ejecutar un rerun de AppTest y registrar su latencia; False si falló."""
+        start = time.perf_counter()
+        try:
+            at.run()
+            if at.exception:
+                print(f"❌ {flow} (user {user_id}): {at.exception[0].message}")
+            elif not at.main.children:
+                # AppTest no reporta los errores de compilación: la página sale vacía
+                print(f"❌ {flow} (user {user_id}): the script rendered nothing")
+            failed = bool(at.exception) or not at.main.children
+        except Exception as e:
+            print(f"❌ {flow} (user {user_id}): {e}")
+            failed = True
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.latencies.setdefault(flow, []).append(elapsed)
+        if failed:
+            self._count_error(flow, user_id)
+        return not failed
+
+    def fail(self, flow: str, user_id: int, reason) -> None:
+        """Registrar un fallo que no es de un rerun (widget ausente, excepción)."""
+        print(f"❌ {flow} (user {user_id}): {reason}")
+        self._count_error(flow, user_id)
+
+    def _count_error(self, flow: str, user_id: int) -> None:
+        with self._lock:
+            self.errors[flow] = self.errors.get(flow, 0) + 1
+            self.user_errors[user_id] = self.user_errors.get(user_id, 0) + 1
+
+
+def _by_label(widgets, label: str):
+    """Widget con esa etiqueta, o None si la página no lo dibujó."""
+    return next((w for w in widgets if w.label == label), None)
+
+
+def _by_key(widgets, key: str):
+    """Widget con esa clave, o None si la página no lo dibujó."""
+    return next((w for w in widgets if w.key == key), None)
+
+
+def _select_option(widget, position: int) -> None:
+    """
+    Elegir la opción que ocupa esa posición (el índice de la clave o del miembro).
+
+    AppTest busca la opción elegida por str(valor) entre las que se muestran,
+    y la app las muestra con format_func (etiquetas): se le pasa la etiqueta
+    mostrada en esa posición, y la app recibe la clave o el miembro.
+    """
+    widget.set_value(widget.options[position])
+
+
+def _select_member(widget, member) -> None:
+    """Elegir un miembro de utils/enums.py en un widget con sus etiquetas."""
+    _select_option(widget, list(type(member)).index(member))
+
+
+def _select_export_format(at, fmt: str = "csv") -> None:
+    """Fijar el formato de exportación por clave antes de cada rerun del historial."""
+    widget = _by_key(at.selectbox, "export_format")
+    if widget is not None:
+        _select_option(widget, EXPORT_FORMATS.index(fmt))
+
+
+def share_test_runtime() -> None:
+    """
+    Hacer que AppTest se pueda usar desde varios hilos a la vez.
+
+    AppTest guarda dos cosas en variables globales de Streamlit:
+    - Runtime._instance: crea un runtime simulado en cada rerun y al terminar
+      lo deja en None, lo que rompe los reruns que aún están en marcha en
+      otros hilos ("Runtime hasn't been created!"). Se instala uno
+      compartido, igual al que crea AppTest, y se apunta el Runtime que ve
+      AppTest a una clase aparte para que no lo pise.
+    - La caché de páginas de source_util, que guarda las páginas del primer
+      script que la llena: otro usuario acababa ejecutando esa página en
+      lugar de la suya. Se calculan las páginas de cada script sin caché.
+
+    Además cada AppTest compila su script con una ScriptCache propia, y en
+    CPython 3.11 compilar en varios hilos a la vez puede fallar ("AST
+    constructor recursion depth mismatch") sin que AppTest lo reporte. Como
+    en el servidor real, todos comparten una sola ScriptCache.
+    """
+    from unittest.mock import MagicMock
+
+    from streamlit import source_util
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    app_test.Runtime = type("PerRunRuntime", (), {"_instance": None})
+
+    get_pages = source_util.get_pages
+
+    def get_script_pages(main_script_path: str):
+        # Con el lock de la caché: AppTest también la guarda y restaura con él
+        with source_util._pages_cache_lock:
+            source_util._cached_pages = None
+            return get_pages(main_script_path)
+
+    source_util.get_pages = get_script_pages
+
+    script_cache = ScriptCache()
+    local_script_runner.ScriptCache = lambda: script_cache
+
+
+def run_flows(user_id: int, iteration: int, iterations: int, recorder: Recorder, timeout: float) -> None:
+    """Una iteración de los flujos; se corta en el primer paso que falla."""
+    from streamlit.testing.v1 import AppTest
+
+    # Abrir el dashboard
+    at = AppTest.from_file(DASHBOARD_PAGE, default_timeout=timeout)
+    recorder.run("dashboard", at, user_id)
+
+    # Registrar una sesión con el formulario
+    at = AppTest.from_file(FORM_PAGE, default_timeout=timeout)
+    if recorder.run("form_open", at, user_id):
+        topic = f"Load test user {user_id} iteration {iteration}"
+        fields = {
+            "Topic studied (*)": (_by_label(at.text_input, "Topic studied (*)"), topic),
+            "Duration (*)": (_by_label(at.text_input, "Duration (*)"), "1 hour"),
+            "Daily win (*)": (_by_label(at.text_area, "Daily win (*)"), "Finished the load test flow"),
+        }
+        # Los enumerados se eligen por miembro, variando con la iteración
+        choices = {
+            "Categoría (*)": (_by_label(at.selectbox, "Categoría (*)"), list(Category)[iteration % len(Category)]),
+            "Difficulty (*)": (_by_label(at.select_slider, "Difficulty (*)"),
+                               list(Difficulty)[iteration % len(Difficulty)]),
+            "Focus level": (_by_label(at.select_slider, "Focus level"), list(FocusLevel)[iteration % len(FocusLevel)]),
+        }
+        missing = [label for label, (widget, _) in {**fields, **choices}.items() if widget is None]
+        if missing or not at.button:
+            recorder.fail("form_submit", user_id, f"form widgets not found: {missing or ['submit']}")
+        else:
+            for widget, value in fields.values():
+                widget.input(value)
+            for widget, member in choices.values():
+                _select_member(widget, member)
+            at.button[0].click()
+            recorder.run("form_submit", at, user_id)
+
+    # Buscar en el historial
+    at = AppTest.from_file(HISTORY_PAGE, default_timeout=timeout)
+    if not recorder.run("history_open", at, user_id):
+        return
+    n = user_id * iterations + iteration
+    target = f"seed_{n:06d}"
+    search = _by_label(at.text_input, "🔍 Buscar:")
+    if search is None:
+        recorder.fail("history_search", user_id, "search box not found")
+        return
+    search.input(f"s{n:06d}")
+    _select_export_format(at)
+    if not recorder.run("history_search", at, user_id):
+        return
+
+    # Abrir la sesión encontrada: el detalle solo se dibuja al abrirla
+    open_button = _by_key(at.button, f"open_{target}")
+    if open_button is None:
+        recorder.fail("history_search", user_id, f"{target} not found")
+        return
+    open_button.click()
+    _select_export_format(at)
+    if not recorder.run("history_expand", at, user_id):
+        return
+
+    # Borrarla
+    delete_button = _by_key(at.button, f"delete_{target}")
+    if delete_button is None:
+        recorder.fail("history_expand", user_id, f"delete button for {target} not found")
+        return
+    delete_button.click()
+    _select_export_format(at)
+    recorder.run("history_delete", at, user_id)
+
+
+def virtual_user(user_id: int, iterations: int, recorder: Recorder, timeout: float) -> None:
+    """Recorrer los flujos de la app como lo haría un usuario real."""
+    for iteration in range(iterations):
+        # Un fallo inesperado se registra y el usuario sigue con la siguiente iteración
+        try:
+            run_flows(user_id, iteration, iterations, recorder, timeout)
+        except Exception as e:
+            recorder.fail("iteration", user_id, f"{type(e).__name__}: {e}")
+
+
+def report(recorder: Recorder, wall_time: float) -> None:
+    total = sum(len(v) for v in recorder.latencies.values())
+    errors = sum(recorder.errors.values())
+
+    print(f"\n📊 {total} reruns in {wall_time:.1f}s -> {total / wall_time:.1f} reruns/s, {errors} errors")
+    print(f"{'flow':<16}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>8}")
+    every = []
+    for flow, values in recorder.latencies.items():
+        every.extend(values)
+        print(f"{flow:<16}{len(values):>6}"
+              f"{_percentile(values, 50) * 1000:>10.0f}{_percentile(values, 95) * 1000:>10.0f}"
+              f"{_percentile(values, 99) * 1000:>10.0f}{max(values) * 1000:>10.0f}"
+              f"{recorder.errors.get(flow, 0):>8}")
+    if every:
+        print(f"{'all':<16}{len(every):>6}"
+              f"{_percentile(every, 50) * 1000:>10.0f}{_percentile(every, 95) * 1000:>10.0f}"
+              f"{_percentile(every, 99) * 1000:>10.0f}{max(every) * 1000:>10.0f}{errors:>8}"
+              f"   mean {statistics.mean(every) * 1000:.0f} ms")
+
+    if recorder.user_errors:
+        failed = ", ".join(f"user {u}: {n}" for u, n in sorted(recorder.user_errors.items()))
+        print(f"👤 Errors by user: {failed}")
+
+    peak = _peak_rss_mb()
+    if peak is not None:
+        print(f"🧠 Peak RSS: {peak:.0f} MB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Concurrent-user load test with Streamlit AppTest")
+    parser.add_argument("--users", type=int, default=5, help="Concurrent virtual users")
+    parser.add_argument("--iterations", type=int, default=3, help="Flow iterations per user")
+    parser.add_argument("--sessions", type=int, default=200, help="Sessions seeded before the run")
+    parser.add_argument("--backend", default="memory", help="memory or sqlite:///path.db")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-rerun timeout in seconds")
+    args = parser.parse_args()
+
+    if args.sessions < args.users * args.iterations:
+        parser.error("--sessions must be at least users * iterations (one delete per iteration)")
+
+    # Backend local y cachés aisladas para no tocar Supabase ni la caché real
+    work_dir = tempfile.mkdtemp(prefix="study_tracker_load_")
+    os.environ["STUDY_TRACKER_BACKEND"] = args.backend
+    os.environ["STUDY_TRACKER_CACHE_DIR"] = os.path.join(work_dir, "cache")
+    os.environ["STUDY_TRACKER_JOURNAL_DIR"] = os.path.join(work_dir, "offline")
+    sys.path.insert(0, ROOT)
+
+    print(f"🚀 Seeding {args.sessions} sessions into '{args.backend}'...")
+    seed_sessions(args.backend, args.sessions)
+
+    share_test_runtime()
+    print(f"👥 Running {args.users} users x {args.iterations} iterations...")
+    recorder = Recorder()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.users) as pool:
+        futures = [pool.submit(virtual_user, u, args.iterations, recorder, args.timeout)
+                   for u in range(args.users)]
+        for user_id, future in enumerate(futures):
+            try:
+                future.result()
+            except Exception as e:
+                recorder.fail("user", user_id, f"{type(e).__name__}: {e}")
+    wall_time = time.perf_counter() - start
+
+    report(recorder, wall_time)
+    return 1 if recorder.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,41 +1,113 @@
+import argparse
+import hashlib
+import json
 import sqlite3
 import toml
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 from supabase import create_client
+from utils.resilience import CircuitBreaker
 
-def migrate_data():
+DEFAULT_DB_FILE = os.path.join(os.path.dirname(__file__), "study_sessions.db")
+DEFAULT_CHECKPOINT = os.path.join(os.path.dirname(__file__), "migrate_checkpoint.json")
+
+# Rows per upsert request
+DEFAULT_BATCH_SIZE = 500
+# Parallel uploaders; Supabase rate-limits aggressive clients
+DEFAULT_WORKERS = 4
+
+TABLE = "study_sessions"
+
+# Columns managed by Postgres that are not part of the checksum
+SERVER_COLUMNS = {"updated_at"}
+
+
+def _normalize(column: str, value):
+    """Render a value the same way whether it came from SQLite or Postgres."""
+    if value is None:
+        return None
+    if column == "created_at":
+        try:
+            # Postgres adds a timezone to timestamps that SQLite stored naive
+            return datetime.fromisoformat(str(value)).replace(tzinfo=None).isoformat()
+        except ValueError:
+            return str(value)
+    return str(value)
+
+
+def batch_checksum(rows: List[Dict], columns: List[str]) -> str:
     """
-    Migrate data from local SQLite database to Supabase.
+    Content checksum of a batch, independent of row and key order.
+
+    Args:
+        rows: Rows of the batch
+        columns: Columns to include
+
+    Returns:
+        str: sha256 hex digest
     """
-    print("🚀 Starting migration from SQLite to Supabase...")
-    
-    # 1. Connect to SQLite
-    db_file = os.path.join(os.path.dirname(__file__), "study_sessions.db")
-    if not os.path.exists(db_file):
-        print(f"❌ SQLite database not found at {db_file}")
-        return
+    digest = hashlib.sha256()
+    for row in sorted(rows, key=lambda r: str(r["id"])):
+        canonical = {c: _normalize(c, row.get(c)) for c in columns}
+        digest.update(json.dumps(canonical, sort_keys=True).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def iter_batches(db_file: str, batch_size: int) -> Iterator[Tuple[int, List[Dict]]]:
+    """
+    Stream SQLite rows in batches without loading the whole table.
 
+    The order is fixed by rowid, so batch numbers are stable between runs
+    with the same batch size.
+    """
+    conn = sqlite3.connect(db_file)
+    conn.row_factory = sqlite3.Row
     try:
-        conn = sqlite3.connect(db_file)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.execute("SELECT * FROM sessions")
-        rows = cursor.fetchall()
-        sessions = [dict(row) for row in rows]
+        cursor = conn.execute("SELECT * FROM sessions ORDER BY rowid")
+        index = 0
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield index, [dict(row) for row in rows]
+            index += 1
+    finally:
         conn.close()
-        print(f"✅ Found {len(sessions)} sessions in SQLite.")
-    except Exception as e:
-        print(f"❌ Error reading SQLite: {e}")
-        return
 
-    if not sessions:
-        print("⚠️ No sessions to migrate.")
-        return
 
-    # 2. Connect to Supabase
+def load_checkpoint(path: str, db_file: str, batch_size: int) -> Dict:
+    """Load the checkpoint of a previous run, or start a new one."""
+    fresh = {"db_file": os.path.abspath(db_file), "batch_size": batch_size, "batches": {}}
+    if not os.path.exists(path):
+        return fresh
+
+    with open(path, "r", encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("db_file") != fresh["db_file"] or checkpoint.get("batch_size") != batch_size:
+        print("⚠️ Checkpoint belongs to another database or batch size; starting over.")
+        return fresh
+
+    print(f"♻️ Resuming: {len(checkpoint['batches'])} batches already migrated.")
+    return checkpoint
+
+
+def save_checkpoint(path: str, checkpoint: Dict) -> None:
+    """Write the checkpoint atomically so a killed run never leaves it half-written."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def connect_supabase():
     secrets_file = os.path.join(os.path.dirname(__file__), ".streamlit", "secrets.toml")
     if not os.path.exists(secrets_file):
         print(f"❌ Secrets file not found at {secrets_file}")
-        return
+        return None
 
     try:
         secrets = toml.load(secrets_file)
@@ -46,42 +118,202 @@ def migrate_data():
         else:
             url = secrets["SUPABASE_URL"]
             key = secrets["SUPABASE_KEY"]
-            
+
         supabase = create_client(url, key)
         print("✅ Connected to Supabase.")
+        return supabase
     except Exception as e:
         print(f"❌ Error connecting to Supabase: {e}")
-        return
-
-    # 3. Insert data
-    print("📤 Uploading sessions to Supabase...")
-    success_count = 0
-    error_count = 0
-    
-    for session in sessions:
+        return None
+
+
+def _print_error(prefix: str, e: Exception) -> None:
+    print(f"  ❌ {prefix}")
+    print(f"     Error type: {type(e)}")
+    print(f"     Error details: {e}")
+    for attr in ("code", "details", "message"):
+        if hasattr(e, attr):
+            print(f"     {attr.capitalize()}: {getattr(e, attr)}")
+
+
+def upload_batches(supabase, db_file: str, batch_size: int, workers: int,
+                   checkpoint_path: str, checkpoint: Dict) -> Tuple[int, int]:
+    """
+    Upsert every batch not yet in the checkpoint, with a bounded thread pool.
+
+    At most 2 * workers batches are held in memory at a time.
+
+    Returns:
+        Tuple[int, int]: (rows migrated in this run, failed batches)
+    """
+    breaker = CircuitBreaker()
+    done = checkpoint["batches"]
+    migrated_rows = 0
+    failed_batches = 0
+
+    def upload(index: int, rows: List[Dict]) -> Tuple[int, List[Dict]]:
+        breaker.call(supabase.table(TABLE).upsert(rows).execute)
+        return index, rows
+
+    def settle(future, index: int, rows: List[Dict], checksum: str) -> None:
+        nonlocal migrated_rows, failed_batches
         try:
-            # Clean up data if necessary (e.g. ensure types match)
-            # Supabase expects standard JSON types
-            
-            # Upsert to avoid duplicates if running multiple times
-            supabase.table("study_sessions").upsert(session).execute()
-            success_count += 1
-            print(f"  - Migrated session {session.get('day')}: {session.get('topic')}")
+            future.result()
         except Exception as e:
-            error_count += 1
-            print(f"  ❌ Failed to migrate session {session.get('id')}")
-            print(f"     Error type: {type(e)}")
-            print(f"     Error details: {e}")
-            if hasattr(e, 'code'):
-                print(f"     Code: {e.code}")
-            if hasattr(e, 'details'):
-                print(f"     Details: {e.details}")
-            if hasattr(e, 'message'):
-                print(f"     Message: {e.message}")
-
-    print("\n🏁 Migration complete!")
-    print(f"✅ Successfully migrated: {success_count}")
-    print(f"❌ Failed: {error_count}")
+            failed_batches += 1
+            _print_error(f"Failed to migrate batch {index} ({len(rows)} rows)", e)
+            return
+        done[str(index)] = {
+            "rows": len(rows),
+            "first_id": rows[0]["id"],
+            "last_id": rows[-1]["id"],
+            "sha256": checksum,
+        }
+        save_checkpoint(checkpoint_path, checkpoint)
+        migrated_rows += len(rows)
+        print(f"  - Batch {index}: {len(rows)} rows ({rows[0]['id']} … {rows[-1]['id']})")
+
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index, rows in iter_batches(db_file, batch_size):
+            columns = [c for c in rows[0].keys() if c not in SERVER_COLUMNS]
+            checksum = batch_checksum(rows, columns)
+
+            previous = done.get(str(index))
+            if previous and previous["sha256"] == checksum:
+                continue
+
+            in_flight.append((pool.submit(upload, index, rows), index, rows, checksum))
+            # Backpressure: wait for the oldest batch before reading more
+            while len(in_flight) >= 2 * workers:
+                settle(*in_flight.popleft())
+
+        while in_flight:
+            settle(*in_flight.popleft())
+
+    return migrated_rows, failed_batches
+
+
+def verify_migration(supabase, db_file: str, batch_size: int, workers: int,
+                     checkpoint: Dict) -> bool:
+    """
+    Compare source and target batch by batch, then the total row count.
+
+    Each batch is re-read from SQLite and fetched back from Supabase by ID;
+    both sides must produce the checksum stored in the checkpoint.
+    """
+    print("\n🔍 Verifying migration...")
+
+    def verify(index: int, rows: List[Dict]) -> Optional[str]:
+        columns = [c for c in rows[0].keys() if c not in SERVER_COLUMNS]
+        expected = checkpoint["batches"].get(str(index), {}).get("sha256")
+        if batch_checksum(rows, columns) != expected:
+            return f"batch {index}: source changed since it was migrated"
+
+        response = supabase.table(TABLE).select(", ".join(columns)).in_(
+            "id", [r["id"] for r in rows]).execute()
+        if len(response.data) != len(rows):
+            return f"batch {index}: {len(response.data)} of {len(rows)} rows found in Supabase"
+        if batch_checksum(response.data, columns) != expected:
+            return f"batch {index}: content differs in Supabase"
+        return None
+
+    source_rows = 0
+    problems = []
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for index, rows in iter_batches(db_file, batch_size):
+            source_rows += len(rows)
+            in_flight.append(pool.submit(verify, index, rows))
+            while len(in_flight) >= 2 * workers:
+                problem = in_flight.popleft().result()
+                if problem:
+                    problems.append(problem)
+        while in_flight:
+            problem = in_flight.popleft().result()
+            if problem:
+                problems.append(problem)
+
+    target_rows = supabase.table(TABLE).select("id", count="exact").limit(1).execute().count
+    print(f"  - Rows: SQLite {source_rows}, Supabase {target_rows}")
+    if target_rows is not None and target_rows < source_rows:
+        problems.append(f"Supabase has {target_rows} rows, SQLite has {source_rows}")
+
+    for problem in problems:
+        print(f"  ❌ {problem}")
+    if not problems:
+        print("✅ Every batch matches its checksum.")
+    return not problems
+
+
+def migrate_data(db_file: str = DEFAULT_DB_FILE, batch_size: int = DEFAULT_BATCH_SIZE,
+                 workers: int = DEFAULT_WORKERS, checkpoint_path: str = DEFAULT_CHECKPOINT,
+                 restart: bool = False, verify: bool = True) -> bool:
+    """
+    Migrate data from local SQLite database to Supabase.
+
+    Rows are streamed in batches and upserted by a small pool of workers.
+    Progress is checkpointed after every batch, so a killed run resumes
+    where it stopped; upserts make re-sending a batch harmless.
+    """
+    print("🚀 Starting migration from SQLite to Supabase...")
+
+    # 1. Check SQLite
+    if not os.path.exists(db_file):
+        print(f"❌ SQLite database not found at {db_file}")
+        return False
+
+    try:
+        conn = sqlite3.connect(db_file)
+        total = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+        conn.close()
+        print(f"✅ Found {total} sessions in SQLite.")
+    except Exception as e:
+        print(f"❌ Error reading SQLite: {e}")
+        return False
+
+    if not total:
+        print("⚠️ No sessions to migrate.")
+        return True
+
+    # 2. Connect to Supabase
+    supabase = connect_supabase()
+    if supabase is None:
+        return False
+
+    # 3. Upload batches
+    if restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    checkpoint = load_checkpoint(checkpoint_path, db_file, batch_size)
+
+    print(f"📤 Uploading in batches of {batch_size} with {workers} workers...")
+    migrated_rows, failed_batches = upload_batches(
+        supabase, db_file, batch_size, workers, checkpoint_path, checkpoint
+    )
+
+    print("\n🏁 Upload complete!")
+    print(f"✅ Migrated in this run: {migrated_rows} rows")
+    print(f"❌ Failed batches: {failed_batches}")
+    if failed_batches:
+        print("↩️ Run the script again to retry the failed batches.")
+        return False
+
+    # 4. Verify
+    if verify:
+        return verify_migration(supabase, db_file, batch_size, workers, checkpoint)
+    return True
+
 
 if __name__ == "__main__":
-    migrate_data()
+    parser = argparse.ArgumentParser(description="Migrate study sessions from SQLite to Supabase")
+    parser.add_argument("--db", default=DEFAULT_DB_FILE, help="SQLite database file")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per upsert")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel uploaders")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="Checkpoint file for resuming")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start over")
+    parser.add_argument("--no-verify", action="store_true", help="Skip the final verification")
+    args = parser.parse_args()
+
+    ok = migrate_data(args.db, args.batch_size, args.workers, args.checkpoint,
+                      restart=args.restart, verify=not args.no_verify)
+    raise SystemExit(0 if ok else 1)
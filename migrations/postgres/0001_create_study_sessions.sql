@@ -0,0 +1,23 @@
+-- Tabla de sesiones de estudio.
+--
+-- Con "if not exists" la migración también sirve para una base de Supabase
+-- creada antes desde la interfaz: la tabla existente se conserva y solo se
+-- registra la versión.
+
+create table if not exists study_sessions (
+    id text primary key,
+    day integer,
+    date date not null,
+    category text,
+    topic text,
+    duration text,
+    daily_win text,
+    key_learnings text,
+    resources text,
+    difficulty text,
+    focus_level text,
+    obstacles text,
+    next_steps text,
+    practical_application text,
+    created_at timestamptz not null default now()
+);
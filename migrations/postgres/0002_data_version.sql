@@ -0,0 +1,38 @@
+-- Sonda barata de cambios para study_sessions.
+--
+-- study_sessions_version() devuelve (row_count, max_updated_at). Cualquier
+-- insert, update o delete cambia al menos uno de los dos valores, así que
+-- la app solo vuelve a descargar la tabla cuando la versión se mueve.
+
+-- Marca de tiempo de la última modificación de cada fila
+alter table study_sessions
+    add column if not exists updated_at timestamptz not null default now();
+
+create or replace function study_sessions_set_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at := now();
+    return new;
+end;
+$$;
+
+drop trigger if exists study_sessions_set_updated_at on study_sessions;
+create trigger study_sessions_set_updated_at
+    before insert or update on study_sessions
+    for each row execute function study_sessions_set_updated_at();
+
+-- max(updated_at) se resuelve leyendo el extremo del índice
+create index if not exists study_sessions_updated_at_idx
+    on study_sessions (updated_at);
+
+create or replace function study_sessions_version()
+returns table (row_count bigint, max_updated_at timestamptz)
+language sql
+stable
+as $$
+    select count(*), max(updated_at) from study_sessions;
+$$;
+
+grant execute on function study_sessions_version() to anon, authenticated;
@@ -0,0 +1,29 @@
+-- Renumeración de días en una sola sentencia.
+--
+-- renumber_study_sessions() asigna day = 1, 2, 3... por fecha (created_at
+-- desempata) y solo toca las filas cuyo día cambia. Sustituye al bucle de
+-- updates fila a fila de recalculate_days() tras importaciones masivas.
+-- Devuelve el número de filas actualizadas.
+
+create or replace function renumber_study_sessions()
+returns integer
+language plpgsql
+as $$
+declare
+    changed integer;
+begin
+    update study_sessions s
+    set day = ordered.new_day
+    from (
+        select id, row_number() over (order by date, created_at) as new_day
+        from study_sessions
+    ) ordered
+    where s.id = ordered.id
+      and s.day is distinct from ordered.new_day;
+
+    get diagnostics changed = row_count;
+    return changed;
+end;
+$$;
+
+grant execute on function renumber_study_sessions() to anon, authenticated;
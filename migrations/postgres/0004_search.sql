@@ -0,0 +1,84 @@
+-- Búsqueda de texto completo en Postgres para el historial.
+--
+-- search_vector combina los campos de texto de cada sesión, sin acentos,
+-- con las configuraciones spanish e english (el tema pesa más que la
+-- victoria del día, y esta más que el resto). Es una columna generada, así
+-- que se mantiene sola en cada insert/update, y el índice GIN hace que la
+-- búsqueda no dependa del tamaño de la tabla.
+--
+-- search_sessions(query, max_results) devuelve los IDs ordenados por
+-- relevancia con un fragmento resaltado (**así**) de cada sesión.
+
+create extension if not exists unaccent;
+
+-- unaccent() no es immutable; una columna generada lo necesita. La
+-- extensión puede estar en otro esquema que public (Supabase la instala en
+-- extensions), así que la función y el diccionario se califican con el
+-- esquema donde está instalada.
+do $do$
+declare
+    ext_schema text;
+begin
+    select n.nspname into strict ext_schema
+    from pg_extension e
+    join pg_namespace n on n.oid = e.extnamespace
+    where e.extname = 'unaccent';
+
+    execute format($f$
+        create or replace function study_sessions_unaccent(value text)
+        returns text
+        language sql
+        immutable
+        parallel safe
+        strict
+        as $$
+            select %1$I.unaccent(%2$L::regdictionary, value);
+        $$
+    $f$, ext_schema, format('%I.unaccent', ext_schema));
+end;
+$do$;
+
+alter table study_sessions
+    add column if not exists search_vector tsvector generated always as (
+        setweight(to_tsvector('spanish', study_sessions_unaccent(coalesce(topic, ''))), 'A') ||
+        setweight(to_tsvector('english', study_sessions_unaccent(coalesce(topic, ''))), 'A') ||
+        setweight(to_tsvector('spanish', study_sessions_unaccent(coalesce(daily_win, ''))), 'B') ||
+        setweight(to_tsvector('english', study_sessions_unaccent(coalesce(daily_win, ''))), 'B') ||
+        setweight(to_tsvector('spanish', study_sessions_unaccent(concat_ws(' ',
+            key_learnings, resources, obstacles, next_steps, practical_application))), 'C') ||
+        setweight(to_tsvector('english', study_sessions_unaccent(concat_ws(' ',
+            key_learnings, resources, obstacles, next_steps, practical_application))), 'C')
+    ) stored;
+
+create index if not exists study_sessions_search_idx
+    on study_sessions using gin (search_vector);
+
+create or replace function search_sessions(query text, max_results integer default 50)
+returns table (id text, rank real, snippet text)
+language sql
+stable
+as $$
+    with q as (
+        select websearch_to_tsquery('spanish', study_sessions_unaccent(query))
+            || websearch_to_tsquery('english', study_sessions_unaccent(query)) as tsq
+    ),
+    hits as (
+        select s.id::text as id,
+               ts_rank_cd(s.search_vector, q.tsq) as rank,
+               concat_ws(' … ', s.topic, s.daily_win, s.key_learnings, s.resources,
+                         s.obstacles, s.next_steps, s.practical_application) as body
+        from study_sessions s, q
+        where s.search_vector @@ q.tsq
+        order by rank desc
+        limit max_results
+    )
+    -- ts_headline es caro: solo para las filas devueltas
+    select hits.id,
+           hits.rank,
+           ts_headline('spanish', study_sessions_unaccent(hits.body), q.tsq,
+                       'StartSel=**, StopSel=**, MaxWords=20, MinWords=8, MaxFragments=2, FragmentDelimiter=" … "')
+    from hits, q
+    order by hits.rank desc;
+$$;
+
+grant execute on function search_sessions(text, integer) to anon, authenticated;
@@ -0,0 +1,18 @@
+-- Índices de las consultas frecuentes.
+--
+-- Todas las lecturas ordenan por date y recalculate_days() por
+-- (date, created_at): el primer índice sirve ambos órdenes sin ordenar la
+-- tabla. Las lecturas filtradas (utils/session_filter.py) de las vistas
+-- parciales del historial piden rangos de fechas, las últimas N sesiones
+-- (order date desc, created_at desc, limit N) o una categoría o dificultad
+-- dentro de un rango. Con estos índices Postgres lee solo las filas
+-- devueltas en lugar de recorrer la tabla y ordenarla.
+
+create index if not exists study_sessions_date_idx
+    on study_sessions (date, created_at);
+
+create index if not exists study_sessions_category_date_idx
+    on study_sessions (category, date);
+
+create index if not exists study_sessions_difficulty_date_idx
+    on study_sessions (difficulty, date);
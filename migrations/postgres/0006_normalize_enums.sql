@@ -0,0 +1,99 @@
+-- Valores canónicos de categoría, dificultad y concentración.
+--
+-- El formulario guardaba la dificultad en inglés y la concentración en
+-- español, y otros scripts e importaciones escribían variantes ("Medio",
+-- "fácil", "3"). Esta migración deja cada fila con la clave canónica de
+-- utils/enums.py (los mismos alias que acepta parse()); lo que no se
+-- reconoce toma el valor por defecto del importador, y un texto vacío pasa a
+-- NULL. Antes de cambiarlo, el texto original de cada fila reescrita se
+-- copia a category_original, difficulty_original o focus_level_original,
+-- así no se pierde nada. Después las restricciones check impiden guardar
+-- otros valores.
+--
+-- La app guarda en memoria y en la tabla columnar el código entero de cada
+-- valor y muestra la etiqueta en español; en la base se mantiene la clave
+-- para no cambiar la API de PostgREST ni el índice de búsqueda.
+
+alter table study_sessions add column if not exists category_original text;
+alter table study_sessions add column if not exists difficulty_original text;
+alter table study_sessions add column if not exists focus_level_original text;
+
+update study_sessions
+set category_original = category,
+    category = case regexp_replace(lower(study_sessions_unaccent(btrim(category))), '\.0$', '')
+        when '' then null
+        when 'data analysis' then 'Data Analysis'
+        when 'analisis de datos' then 'Data Analysis'
+        when 'data analytics' then 'Data Analysis'
+        when 'analisis' then 'Data Analysis'
+        when '1' then 'Data Analysis'
+        when 'physics' then 'Physics'
+        when 'fisica' then 'Physics'
+        when '2' then 'Physics'
+        when 'statistics' then 'Statistics'
+        when 'estadistica' then 'Statistics'
+        when '3' then 'Statistics'
+        when 'sql' then 'SQL'
+        when '4' then 'SQL'
+        when 'visualization' then 'Visualization'
+        when 'visualizacion' then 'Visualization'
+        when '5' then 'Visualization'
+        else 'Mixed'
+    end
+where category is not null
+  and category not in ('Data Analysis', 'Physics', 'Statistics', 'SQL', 'Visualization', 'Mixed');
+
+update study_sessions
+set difficulty_original = difficulty,
+    difficulty = case regexp_replace(lower(study_sessions_unaccent(btrim(difficulty))), '\.0$', '')
+        when '' then null
+        when 'easy' then 'Easy'
+        when 'facil' then 'Easy'
+        when 'muy facil' then 'Easy'
+        when 'very easy' then 'Easy'
+        when '1' then 'Easy'
+        when 'hard' then 'Hard'
+        when 'dificil' then 'Hard'
+        when '3' then 'Hard'
+        when 'very hard' then 'Very Hard'
+        when 'muy dificil' then 'Very Hard'
+        when '4' then 'Very Hard'
+        else 'Medium'
+    end
+where difficulty is not null
+  and difficulty not in ('Easy', 'Medium', 'Hard', 'Very Hard');
+
+update study_sessions
+set focus_level_original = focus_level,
+    focus_level = case regexp_replace(lower(study_sessions_unaccent(btrim(focus_level))), '\.0$', '')
+        when '' then null
+        when 'muy bajo' then 'Muy bajo'
+        when 'very low' then 'Muy bajo'
+        when '1' then 'Muy bajo'
+        when 'bajo' then 'Bajo'
+        when 'low' then 'Bajo'
+        when '2' then 'Bajo'
+        when 'alto' then 'Alto'
+        when 'alta' then 'Alto'
+        when 'high' then 'Alto'
+        when '4' then 'Alto'
+        when 'excelente' then 'Excelente'
+        when 'excellent' then 'Excelente'
+        when 'muy alto' then 'Excelente'
+        when '5' then 'Excelente'
+        else 'Medio'
+    end
+where focus_level is not null
+  and focus_level not in ('Muy bajo', 'Bajo', 'Medio', 'Alto', 'Excelente');
+
+alter table study_sessions drop constraint if exists study_sessions_category_check;
+alter table study_sessions add constraint study_sessions_category_check
+    check (category in ('Data Analysis', 'Physics', 'Statistics', 'SQL', 'Visualization', 'Mixed'));
+
+alter table study_sessions drop constraint if exists study_sessions_difficulty_check;
+alter table study_sessions add constraint study_sessions_difficulty_check
+    check (difficulty in ('Easy', 'Medium', 'Hard', 'Very Hard'));
+
+alter table study_sessions drop constraint if exists study_sessions_focus_level_check;
+alter table study_sessions add constraint study_sessions_focus_level_check
+    check (focus_level in ('Muy bajo', 'Bajo', 'Medio', 'Alto', 'Excelente'));
@@ -0,0 +1,51 @@
+-- search_sessions() devuelve las sesiones encontradas, no solo sus IDs.
+--
+-- La versión de 0004 devolvía (id, rank, snippet) y el historial tenía que
+-- descargar la tabla completa para mostrar los resultados. Ahora devuelve
+-- las columnas de cada sesión (sin search_vector) más rank y snippet,
+-- ordenadas por relevancia, y el historial las muestra tal cual. El tipo de
+-- retorno cambia, así que no basta con "create or replace".
+
+drop function if exists search_sessions(text, integer);
+
+create function search_sessions(query text, max_results integer default 50)
+returns table (
+    id text, day integer, date date, category text, topic text, duration text,
+    daily_win text, key_learnings text, resources text, difficulty text,
+    focus_level text, obstacles text, next_steps text, practical_application text,
+    created_at timestamptz, updated_at timestamptz, rank real, snippet text
+)
+language sql
+stable
+as $$
+    with q as (
+        select websearch_to_tsquery('spanish', study_sessions_unaccent(query))
+            || websearch_to_tsquery('english', study_sessions_unaccent(query)) as tsq
+    ),
+    hits as (
+        select s.id,
+               ts_rank_cd(s.search_vector, q.tsq) as rank
+        from study_sessions s, q
+        where s.search_vector @@ q.tsq
+        order by rank desc
+        limit max_results
+    )
+    -- ts_headline es caro: solo para las filas devueltas
+    select s.id::text, s.day, s.date, s.category, s.topic, s.duration,
+           s.daily_win, s.key_learnings, s.resources, s.difficulty,
+           s.focus_level, s.obstacles, s.next_steps, s.practical_application,
+           s.created_at, s.updated_at,
+           hits.rank,
+           ts_headline('spanish',
+                       study_sessions_unaccent(concat_ws(' … ', s.topic, s.daily_win, s.key_learnings,
+                                                         s.resources, s.obstacles, s.next_steps,
+                                                         s.practical_application)),
+                       q.tsq,
+                       'StartSel=**, StopSel=**, MaxWords=20, MinWords=8, MaxFragments=2, FragmentDelimiter=" … "')
+    from hits
+    join study_sessions s on s.id = hits.id
+    cross join q
+    order by hits.rank desc;
+$$;
+
+grant execute on function search_sessions(text, integer) to anon, authenticated;
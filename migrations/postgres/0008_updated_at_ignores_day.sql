@@ -0,0 +1,29 @@
+-- updated_at solo cambia cuando cambia el contenido de la sesión.
+--
+-- El trigger de 0002 ponía updated_at := now() en cualquier update, también
+-- en la renumeración de day que hace renumber_study_sessions() tras cada
+-- alta o baja. Cada renumeración aparecía entonces como un conflicto en la
+-- cola offline (que compara updated_at) y cada backup incremental volvía a
+-- guardar todas las filas renumeradas. day se deriva de la fecha y nunca lo
+-- escribe el usuario, así que ya no cuenta como cambio; search_vector es
+-- generada y en un trigger before todavía no está calculada.
+--
+-- La versión de los datos (study_sessions_version) sigue moviéndose: la
+-- renumeración siempre va detrás de un alta, una baja o un cambio de fecha,
+-- que sí cambian row_count o max(updated_at).
+
+create or replace function study_sessions_set_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    if tg_op = 'INSERT'
+       or (to_jsonb(new) - 'day' - 'updated_at' - 'search_vector')
+          is distinct from (to_jsonb(old) - 'day' - 'updated_at' - 'search_vector') then
+        new.updated_at := now();
+    else
+        new.updated_at := old.updated_at;
+    end if;
+    return new;
+end;
+$$;
@@ -0,0 +1,23 @@
+-- Tabla de sesiones del backend local (utils/local_backend.py).
+--
+-- Mismas columnas que en Postgres. updated_at no tiene trigger: el backend
+-- local lo asigna en cada escritura.
+
+CREATE TABLE IF NOT EXISTS study_sessions (
+    id TEXT PRIMARY KEY,
+    day INTEGER,
+    date TEXT NOT NULL,
+    category TEXT,
+    topic TEXT,
+    duration TEXT,
+    daily_win TEXT,
+    key_learnings TEXT,
+    resources TEXT,
+    difficulty TEXT,
+    focus_level TEXT,
+    obstacles TEXT,
+    next_steps TEXT,
+    practical_application TEXT,
+    created_at TEXT,
+    updated_at TEXT NOT NULL
+);
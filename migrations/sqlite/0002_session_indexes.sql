@@ -0,0 +1,14 @@
+-- Índices de las consultas frecuentes, los mismos que en Postgres
+-- (postgres/0002_data_version.sql y postgres/0005_session_indexes.sql).
+
+CREATE INDEX IF NOT EXISTS study_sessions_updated_at_idx
+    ON study_sessions (updated_at);
+
+CREATE INDEX IF NOT EXISTS study_sessions_date_idx
+    ON study_sessions (date, created_at);
+
+CREATE INDEX IF NOT EXISTS study_sessions_category_date_idx
+    ON study_sessions (category, date);
+
+CREATE INDEX IF NOT EXISTS study_sessions_difficulty_date_idx
+    ON study_sessions (difficulty, date);
@@ -0,0 +1,87 @@
+-- Valores canónicos de categoría, dificultad y concentración, igual que
+-- postgres/0006_normalize_enums.sql, también con el texto original en las
+-- columnas *_original. SQLite no puede añadir restricciones check a una
+-- tabla existente: aquí solo se normalizan las filas.
+-- lower() de SQLite solo cambia letras ASCII, por eso van las variantes
+-- con y sin tilde.
+
+ALTER TABLE study_sessions ADD COLUMN category_original TEXT;
+ALTER TABLE study_sessions ADD COLUMN difficulty_original TEXT;
+ALTER TABLE study_sessions ADD COLUMN focus_level_original TEXT;
+
+UPDATE study_sessions
+SET category_original = category,
+    category = CASE lower(trim(category))
+        WHEN '' THEN NULL
+        WHEN 'data analysis' THEN 'Data Analysis'
+        WHEN 'análisis de datos' THEN 'Data Analysis'
+        WHEN 'analisis de datos' THEN 'Data Analysis'
+        WHEN 'data analytics' THEN 'Data Analysis'
+        WHEN 'análisis' THEN 'Data Analysis'
+        WHEN 'analisis' THEN 'Data Analysis'
+        WHEN '1' THEN 'Data Analysis'
+        WHEN 'physics' THEN 'Physics'
+        WHEN 'física' THEN 'Physics'
+        WHEN 'fisica' THEN 'Physics'
+        WHEN '2' THEN 'Physics'
+        WHEN 'statistics' THEN 'Statistics'
+        WHEN 'estadística' THEN 'Statistics'
+        WHEN 'estadistica' THEN 'Statistics'
+        WHEN '3' THEN 'Statistics'
+        WHEN 'sql' THEN 'SQL'
+        WHEN '4' THEN 'SQL'
+        WHEN 'visualization' THEN 'Visualization'
+        WHEN 'visualización' THEN 'Visualization'
+        WHEN 'visualizacion' THEN 'Visualization'
+        WHEN '5' THEN 'Visualization'
+        ELSE 'Mixed'
+    END
+WHERE category IS NOT NULL
+  AND category NOT IN ('Data Analysis', 'Physics', 'Statistics', 'SQL', 'Visualization', 'Mixed');
+
+UPDATE study_sessions
+SET difficulty_original = difficulty,
+    difficulty = CASE lower(trim(difficulty))
+        WHEN '' THEN NULL
+        WHEN 'easy' THEN 'Easy'
+        WHEN 'fácil' THEN 'Easy'
+        WHEN 'facil' THEN 'Easy'
+        WHEN 'muy fácil' THEN 'Easy'
+        WHEN 'muy facil' THEN 'Easy'
+        WHEN 'very easy' THEN 'Easy'
+        WHEN '1' THEN 'Easy'
+        WHEN 'hard' THEN 'Hard'
+        WHEN 'difícil' THEN 'Hard'
+        WHEN 'dificil' THEN 'Hard'
+        WHEN '3' THEN 'Hard'
+        WHEN 'very hard' THEN 'Very Hard'
+        WHEN 'muy difícil' THEN 'Very Hard'
+        WHEN 'muy dificil' THEN 'Very Hard'
+        WHEN '4' THEN 'Very Hard'
+        ELSE 'Medium'
+    END
+WHERE difficulty IS NOT NULL
+  AND difficulty NOT IN ('Easy', 'Medium', 'Hard', 'Very Hard');
+
+UPDATE study_sessions
+SET focus_level_original = focus_level,
+    focus_level = CASE lower(trim(focus_level))
+        WHEN '' THEN NULL
+        WHEN 'muy bajo' THEN 'Muy bajo'
+        WHEN 'very low' THEN 'Muy bajo'
+        WHEN '1' THEN 'Muy bajo'
+        WHEN 'bajo' THEN 'Bajo'
+        WHEN 'low' THEN 'Bajo'
+        WHEN '2' THEN 'Bajo'
+        WHEN 'alto' THEN 'Alto'
+        WHEN 'alta' THEN 'Alto'
+        WHEN 'high' THEN 'Alto'
+        WHEN '4' THEN 'Alto'
+        WHEN 'excelente' THEN 'Excelente'
+        WHEN 'excellent' THEN 'Excelente'
+        WHEN 'muy alto' THEN 'Excelente'
+        WHEN '5' THEN 'Excelente'
+        ELSE 'Medio'
+    END
+WHERE focus_level IS NOT NULL
+  AND focus_level NOT IN ('Muy bajo', 'Bajo', 'Medio', 'Alto', 'Excelente');
@@ -0,0 +1,20 @@
+from utils.profiler import profiled
+from views import layout
+from views.session_form import show_session_form
+
+# Página del formulario de sesión. No descarga el historial.
+
+
+@profiled
+def main():
+    layout.setup_page("New Session")
+    layout.render_header()
+    
+    layout.render_sidebar_progress()
+    layout.render_data_status()
+    
+    show_session_form()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+from utils.profiler import profiled
+from views import layout
+from views.history import load_history_sessions, show_history
+
+# Página del historial de sesiones.
+
+
+@profiled
+def main():
+    layout.setup_page("History")
+    layout.render_header()
+    
+    sessions, complete, search_results = load_history_sessions()
+    # Con una vista parcial la barra lateral solo consulta el total
+    layout.render_sidebar_progress(sessions if complete else None)
+    layout.render_data_status()
+    
+    show_history(sessions, complete, search_results)
+
+
+if __name__ == "__main__":
+    main()
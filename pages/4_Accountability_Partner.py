@@ -0,0 +1,22 @@
+from utils import async_data_manager
+from utils.profiler import profiled
+from views import layout
+from views.accountability import show_accountability_partner
+
+# Página del accountability partner.
+
+
+@profiled
+def main():
+    layout.setup_page("Accountability Partner")
+    layout.render_header()
+    
+    sessions = async_data_manager.load_page_sessions()
+    layout.render_sidebar_progress(sessions)
+    layout.render_data_status()
+    
+    show_accountability_partner(sessions)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+from utils.profiler import profiled
+from views import layout
+from views.data_import import show_import
+
+# Página de importación masiva. No descarga el historial.
+
+
+@profiled
+def main():
+    layout.setup_page("Import")
+    layout.render_header()
+    
+    layout.render_sidebar_progress()
+    layout.render_data_status()
+    
+    show_import()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import asyncio
+import contextvars
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+from utils import data_manager
+
+"""
+Variante asíncrona de la capa de datos.
+
+Permite lanzar consultas independientes a Supabase en paralelo, con un
+límite de concurrencia, para que una página que necesita varias lecturas
+pague un solo viaje de red. Cada consulta corre en un hilo a través de
+data_manager, así que usa el mismo circuit breaker, los reintentos, la
+caché single-flight, el lock entre procesos y la lectura en CSV que la
+ruta síncrona.
+
+Las corrutinas corren en un event loop persistente en segundo plano, así
+no se crea un loop nuevo en cada rerun.
+"""
+
+# Máximo de consultas simultáneas por página
+MAX_CONCURRENT_QUERIES = 4
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# Contexto del script de Streamlit que lanzó la corrutina, para los hilos
+# de trabajo (st.cache_resource avisa si se llama sin él)
+_script_ctx: contextvars.ContextVar = contextvars.ContextVar("script_ctx", default=None)
+
+# Clave de la descarga en frío en las cachés de data_manager. Aún no tiene
+# versión validada, así que no comparte entrada con "sessions"
+PAGE_SESSIONS_KEY = "page_sessions"
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Arrancar (una vez por proceso) el event loop en segundo plano."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever, name="async-data-manager", daemon=True)
+            thread.start()
+    return _loop
+
+
+def run_async(coro: Awaitable) -> Any:
+    """
+    Ejecutar una corrutina desde código síncrono (el script de Streamlit).
+
+    Args:
+        coro: Corrutina a ejecutar
+
+    Returns:
+        Any: Resultado de la corrutina
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+
+    async def _with_script_ctx() -> Any:
+        _script_ctx.set(ctx)
+        return await coro
+
+    return asyncio.run_coroutine_threadsafe(_with_script_ctx(), _get_loop()).result()
+
+
+async def _to_thread(func: Callable[..., Any], *args: Any) -> Any:
+    """asyncio.to_thread con el contexto del script en el hilo de trabajo."""
+    ctx = _script_ctx.get()
+
+    def _run() -> Any:
+        if ctx is None:
+            return func(*args)
+        thread = threading.current_thread()
+        add_script_run_ctx(thread, ctx)
+        try:
+            return func(*args)
+        finally:
+            # Los hilos del pool se reutilizan: no dejarles un contexto viejo
+            setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+
+    return await asyncio.to_thread(_run)
+
+
+async def _execute(build_query: Callable[[Any], Any]) -> Any:
+    """
+    Ejecutar una consulta en un hilo con data_manager.execute_query (circuit
+    breaker y reintentos).
+
+    Args:
+        build_query: Función que recibe un cliente y devuelve la consulta
+            lista para .execute()
+
+    Returns:
+        Any: Respuesta de Supabase
+    """
+    client = data_manager.init_supabase()
+    if not client:
+        raise RuntimeError("Cliente de Supabase no disponible")
+    return await _to_thread(data_manager.execute_query, build_query(client))
+
+
+async def gather_limited(*aws: Awaitable, limit: int = MAX_CONCURRENT_QUERIES) -> List[Any]:
+    """
+    Esperar varias corrutinas en paralelo con un máximo de concurrencia.
+
+    Args:
+        *aws: Corrutinas a ejecutar
+        limit: Número máximo de corrutinas activas a la vez
+
+    Returns:
+        List[Any]: Resultados en el mismo orden
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(aw: Awaitable) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_bounded(aw) for aw in aws))
+
+
+async def fetch_sessions_async() -> List[Mapping]:
+    """
+    Descargar todas las sesiones ordenadas por fecha (CSV o JSON).
+
+    Varias páginas abiertas en frío a la vez comparten una sola descarga
+    (ver data_manager.fetch_sessions_shared).
+    """
+    return await _to_thread(data_manager.fetch_sessions_shared, PAGE_SESSIONS_KEY)
+
+
+async def fetch_sessions_count_async() -> int:
+    """Contar las sesiones sin descargar la tabla."""
+    return await _to_thread(data_manager.fetch_sessions_count)
+
+
+async def fetch_data_version_async() -> Optional[Tuple[int, Optional[str]]]:
+    """
+    Consultar la versión de los datos con data_manager.get_data_version().
+
+    Solo un error que no es transitorio (la RPC no existe) desactiva la RPC;
+    un corte de red o un 5xx no la descarta para siempre.
+
+    Returns:
+        Optional[Tuple[int, Optional[str]]]: Versión, o None si no se pudo
+        consultar
+    """
+    return await _to_thread(data_manager.get_data_version)
+
+
+def _version_matches(rows: List[Dict], version: Optional[Tuple[int, Optional[str]]]) -> bool:
+    """
+    Comprobar que filas y versión, leídas en paralelo, son coherentes.
+
+    Si hubo una escritura entre ambas consultas no coinciden y las filas no
+    deben quedar en caché con esa versión.
+    """
+    if version is None:
+        return False
+    row_count, max_updated_at = version
+    rows_max = max((r['updated_at'] for r in rows if r.get('updated_at')), default=None)
+    return row_count == len(rows) and rows_max == max_updated_at
+
+
+async def _load_page_data_async() -> Tuple[List[Dict], Optional[Tuple[int, Optional[str]]]]:
+    """Descargar sesiones y versión en paralelo."""
+    rows, version = await gather_limited(fetch_sessions_async(), fetch_data_version_async())
+    return rows, version
+
+
+def load_page_sessions() -> Sequence[Mapping]:
+    """
+    Cargar las sesiones de una página en un solo viaje de red.
+
+    Si la caché está vigente no hace ninguna petición, y si solo hay que
+    revalidar la versión delega en data_manager.load_sessions(). En frío,
+    descarga sesiones y versión en paralelo en lugar de una tras otra, y deja
+    ambas en la caché de data_manager para los siguientes reruns.
+
+    Returns:
+        Sequence[Mapping]: Instantánea inmutable de las sesiones
+    """
+    cached = data_manager.get_cached_sessions()
+    if cached is not None:
+        return cached
+
+    if (data_manager.has_cached_sessions() or not data_manager.version_rpc_available()
+            or not data_manager.is_backend_available()):
+        # Basta revalidar la versión, sin RPC no se puede validar la descarga
+        # paralela, o el backend está caído y toca servir datos guardados:
+        # en todos los casos la ruta síncrona es la adecuada
+        return data_manager.load_sessions()
+
+    try:
+        rows, version = run_async(_load_page_data_async())
+    except Exception as e:
+        print(f"Error en la carga concurrente, usando la ruta síncrona: {e}")
+        return data_manager.load_sessions()
+
+    if _version_matches(rows, version):
+        return data_manager.prime_sessions_cache(rows, version)
+
+    # Sin versión fiable: usar la ruta normal, que consulta la versión primero
+    return data_manager.load_sessions()
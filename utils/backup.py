@@ -0,0 +1,376 @@
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from utils import data_manager
+from utils.enums import FIELD_DEFAULTS, FIELD_ENUMS
+
+"""
+Backups incrementales de study_sessions con deduplicación por contenido.
+
+Estructura del directorio de backups (STUDY_TRACKER_BACKUP_DIR, por defecto
+./backups):
+
+- objects/ab/cdef...: cada fila comprimida con gzip, con su sha256 como
+  nombre. Una fila que no cambia se escribe una sola vez en toda la historia.
+- snapshots/<id>.json.gz: manifiesto de cada snapshot. Uno completo lista
+  todas las filas (id -> hash); uno incremental solo las que cambiaron desde
+  su padre y los IDs borrados. Cada FULL_SNAPSHOT_EVERY snapshots se escribe
+  uno completo para que la cadena a resolver sea corta.
+- state.sqlite: índice id -> hash del último snapshot, para que un backup
+  incremental solo toque las filas que cambiaron.
+
+Un backup incremental pide a Supabase la versión de los datos y solo las
+filas con updated_at posterior al último snapshot (ver
+migrations/postgres/0002_data_version.sql). Solo recorre los IDs si el número de filas indica que hubo borrados.
+"""
+
+BACKUP_DIR_ENV = "STUDY_TRACKER_BACKUP_DIR"
+DEFAULT_BACKUP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backups")
+
+# Cada cuántos snapshots se escribe uno completo
+FULL_SNAPSHOT_EVERY = 20
+
+# Sesiones por upsert al restaurar
+RESTORE_BATCH_SIZE = 500
+
+# Columnas que gestiona Postgres y no forman parte del contenido (search_vector
+# es la columna generada de la búsqueda; no se puede escribir)
+SERVER_COLUMNS = ("updated_at", "search_vector")
+
+
+def _canonical(row: Mapping) -> bytes:
+    """Serialización estable de una fila, sin columnas del servidor."""
+    content = {k: v for k, v in row.items() if k not in SERVER_COLUMNS}
+    return json.dumps(content, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _restorable(row: Mapping) -> Tuple[Dict, int]:
+    """
+    Fila de un snapshot lista para upsert.
+
+    Quita las columnas del servidor (los snapshots antiguos guardaban
+    search_vector) y lleva categoría, dificultad y concentración a su clave
+    canónica como el importador: un snapshot anterior a la migración
+    normalize_enums puede tener variantes que las restricciones check
+    rechazan.
+
+    Returns:
+        Tuple[Dict, int]: Fila y cuántos valores no reconocidos tomaron el
+        valor por defecto
+    """
+    content = {k: v for k, v in row.items() if k not in SERVER_COLUMNS}
+    defaulted = 0
+    for field, enum in FIELD_ENUMS.items():
+        if field not in content:
+            continue
+        member = enum.parse(content[field])
+        if isinstance(member, enum):
+            content[field] = member.key
+        elif member is None:
+            content[field] = None
+        else:
+            content[field] = FIELD_DEFAULTS[field].key
+            defaulted += 1
+    return content, defaulted
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class BackupRepository:
+    """Almacén de objetos y manifiestos de un directorio de backups."""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.environ.get(BACKUP_DIR_ENV, DEFAULT_BACKUP_DIR)
+        self.objects_dir = os.path.join(self.root, "objects")
+        self.snapshots_dir = os.path.join(self.root, "snapshots")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        self._state = None
+
+    # Objetos
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def put_object(self, row: Mapping) -> Tuple[str, bool]:
+        """
+        Guardar una fila si su contenido no existe ya.
+
+        Returns:
+            Tuple[str, bool]: sha256 del contenido y si se escribió un objeto nuevo
+        """
+        content = _canonical(row)
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return digest, False
+        _write_atomic(path, gzip.compress(content, mtime=0))
+        return digest, True
+
+    def get_object(self, digest: str) -> Dict:
+        with open(self._object_path(digest), "rb") as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    # Manifiestos
+    def snapshots(self) -> List[str]:
+        """IDs de los snapshots, del más antiguo al más reciente."""
+        return sorted(name[:-len(".json.gz")] for name in os.listdir(self.snapshots_dir)
+                      if name.endswith(".json.gz"))
+
+    def latest(self) -> Optional[str]:
+        snapshots = self.snapshots()
+        return snapshots[-1] if snapshots else None
+
+    def read_manifest(self, snapshot_id: str) -> Dict:
+        with open(os.path.join(self.snapshots_dir, f"{snapshot_id}.json.gz"), "rb") as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    def write_manifest(self, manifest: Dict) -> None:
+        data = gzip.compress(json.dumps(manifest, separators=(",", ":")).encode("utf-8"), mtime=0)
+        _write_atomic(os.path.join(self.snapshots_dir, f"{manifest['id']}.json.gz"), data)
+
+    def resolve(self, snapshot_id: str) -> Dict[str, str]:
+        """
+        Reconstruir el índice id -> hash completo de un snapshot.
+
+        Recorre la cadena de padres hasta el último snapshot completo y
+        aplica los incrementales en orden.
+        """
+        chain = []
+        current = snapshot_id
+        while current is not None:
+            manifest = self.read_manifest(current)
+            chain.append(manifest)
+            current = None if manifest['full'] else manifest['parent']
+
+        index: Dict[str, str] = {}
+        for manifest in reversed(chain):
+            for session_id in manifest['removed']:
+                index.pop(session_id, None)
+            index.update(manifest['rows'])
+        return index
+
+    # Índice del último snapshot
+    def _state_conn(self) -> sqlite3.Connection:
+        if self._state is None:
+            self._state = sqlite3.connect(os.path.join(self.root, "state.sqlite"), isolation_level=None)
+            self._state.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            self._state.execute("CREATE TABLE IF NOT EXISTS rows (id TEXT PRIMARY KEY, hash TEXT NOT NULL)")
+        return self._state
+
+    def state_index(self, snapshot_id: str) -> sqlite3.Connection:
+        """
+        Conexión al índice id -> hash de snapshot_id, reconstruido si no es el guardado.
+        """
+        conn = self._state_conn()
+        row = conn.execute("SELECT value FROM meta WHERE name = 'snapshot'").fetchone()
+        if row is None or row[0] != snapshot_id:
+            index = self.resolve(snapshot_id)
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM rows")
+            conn.executemany("INSERT INTO rows (id, hash) VALUES (?, ?)", index.items())
+            conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('snapshot', ?)", (snapshot_id,))
+            conn.execute("COMMIT")
+        return conn
+
+    def advance_state(self, manifest: Dict) -> None:
+        """Aplicar un manifiesto recién escrito al índice del último snapshot."""
+        conn = self._state_conn()
+        conn.execute("BEGIN")
+        if manifest['full']:
+            conn.execute("DELETE FROM rows")
+        conn.executemany("DELETE FROM rows WHERE id = ?", ((i,) for i in manifest['removed']))
+        conn.executemany("INSERT OR REPLACE INTO rows (id, hash) VALUES (?, ?)", manifest['rows'].items())
+        conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('snapshot', ?)", (manifest['id'],))
+        conn.execute("COMMIT")
+
+
+def _new_snapshot_id() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+
+def create_backup(repo: Optional[BackupRepository] = None, full: bool = False) -> Optional[Dict]:
+    """
+    Crear un snapshot de study_sessions.
+
+    Args:
+        repo: Directorio de backups; por defecto BackupRepository()
+        full: Forzar un snapshot completo aunque haya uno anterior
+
+    Returns:
+        Optional[Dict]: Manifiesto escrito (sin la lista de filas), el del
+        último snapshot con unchanged=True si no hubo cambios, o None si falló
+    """
+    repo = repo or BackupRepository()
+    parent_id = repo.latest()
+    parent = repo.read_manifest(parent_id) if parent_id else None
+
+    # Sin caché: una versión de hace unos segundos podría ocultar cambios
+    version = data_manager.get_data_version(fresh=True)
+    version = list(version) if version is not None else None
+
+    if parent is not None and not full and version is not None and parent['version'] == version:
+        return {**_summary(parent), 'unchanged': True}
+
+    # Sin versión (migración 0002_data_version no aplicada) no hay marca de agua
+    incremental = (parent is not None and not full and version is not None
+                   and parent['version'] and parent['version'][1] is not None
+                   and parent['depth'] + 1 < FULL_SNAPSHOT_EVERY)
+
+    try:
+        if incremental:
+            manifest = _incremental_manifest(repo, parent, version)
+        else:
+            manifest = _full_manifest(repo, parent_id, version)
+    except Exception as e:
+        print(f"Error al crear el backup: {e}")
+        return None
+
+    repo.write_manifest(manifest)
+    repo.advance_state(manifest)
+    return _summary(manifest)
+
+
+def _full_manifest(repo: BackupRepository, parent_id: Optional[str], version: Optional[List]) -> Dict:
+    rows = {}
+    new_objects = 0
+    for session in data_manager.iter_sessions():
+        rows[session['id']], created = repo.put_object(session)
+        new_objects += created
+
+    return {
+        'id': _new_snapshot_id(),
+        'parent': parent_id,
+        'full': True,
+        'depth': 0,
+        'version': version,
+        'row_count': len(rows),
+        'new_objects': new_objects,
+        'rows': rows,
+        'removed': [],
+    }
+
+
+def _incremental_manifest(repo: BackupRepository, parent: Dict, version: List) -> Dict:
+    index = repo.state_index(parent['id'])
+
+    def known_hash(session_id: str) -> Optional[str]:
+        row = index.execute("SELECT hash FROM rows WHERE id = ?", (session_id,)).fetchone()
+        return row[0] if row else None
+
+    rows = {}
+    new_ids = 0
+    new_objects = 0
+    for session in data_manager.iter_sessions(updated_since=parent['version'][1]):
+        digest = hashlib.sha256(_canonical(session)).hexdigest()
+        previous = known_hash(session['id'])
+        if previous == digest:
+            continue
+        new_ids += previous is None
+        rows[session['id']], created = repo.put_object(session)
+        new_objects += created
+
+    # Las altas solo suben el contador: si no cuadra, hubo borrados
+    row_count = parent['row_count'] + new_ids
+    removed = []
+    if version[0] != row_count:
+        current_ids = {s['id'] for s in data_manager.iter_sessions(columns="id")}
+        removed = [r[0] for r in index.execute("SELECT id FROM rows") if r[0] not in current_ids]
+        row_count -= len(removed)
+
+    return {
+        'id': _new_snapshot_id(),
+        'parent': parent['id'],
+        'full': False,
+        'depth': parent['depth'] + 1,
+        'version': version,
+        'row_count': row_count,
+        'new_objects': new_objects,
+        'rows': rows,
+        'removed': removed,
+    }
+
+
+def _summary(manifest: Dict) -> Dict:
+    return {
+        'id': manifest['id'],
+        'full': manifest['full'],
+        'row_count': manifest['row_count'],
+        'changed': len(manifest['rows']),
+        'removed': len(manifest['removed']),
+        'new_objects': manifest['new_objects'],
+    }
+
+
+def list_backups(repo: Optional[BackupRepository] = None) -> List[Dict]:
+    """Resumen de todos los snapshots, del más antiguo al más reciente."""
+    repo = repo or BackupRepository()
+    return [_summary(repo.read_manifest(snapshot_id)) for snapshot_id in repo.snapshots()]
+
+
+def _batches(items: Iterable, size: int) -> Iterable[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def restore_backup(snapshot_id: Optional[str] = None, repo: Optional[BackupRepository] = None,
+                   replace: bool = False, batch_size: int = RESTORE_BATCH_SIZE) -> Dict:
+    """
+    Cargar en Supabase el contenido de un snapshot.
+
+    Args:
+        snapshot_id: Snapshot a restaurar; por defecto el último
+        repo: Directorio de backups
+        replace: Borrar también las sesiones que no están en el snapshot
+        batch_size: Sesiones por upsert
+
+    Returns:
+        Dict: restored, removed, defaulted (valores no reconocidos que
+        tomaron el valor por defecto) y failed_batches
+    """
+    repo = repo or BackupRepository()
+    snapshot_id = snapshot_id or repo.latest()
+    if snapshot_id is None:
+        raise ValueError("No hay backups")
+
+    index = repo.resolve(snapshot_id)
+    result = {'snapshot': snapshot_id, 'restored': 0, 'removed': 0, 'defaulted': 0, 'failed_batches': 0}
+
+    for digests in _batches(index.values(), batch_size):
+        rows = []
+        for digest in digests:
+            row, defaulted = _restorable(repo.get_object(digest))
+            rows.append(row)
+            result['defaulted'] += defaulted
+        if data_manager.upsert_sessions_batch(rows):
+            result['restored'] += len(rows)
+        else:
+            result['failed_batches'] += 1
+
+    if replace:
+        extra = (s['id'] for s in data_manager.iter_sessions(columns="id") if s['id'] not in index)
+        for ids in _batches(extra, batch_size):
+            if data_manager.delete_sessions_batch(ids):
+                result['removed'] += len(ids)
+            else:
+                result['failed_batches'] += 1
+
+    data_manager.recalculate_days()
+    data_manager.invalidate_sessions_cache()
+    return result
@@ -0,0 +1,224 @@
+import threading
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.enums import FIELD_ENUMS, CodedEnum
+from utils.facets import duration_minutes
+from utils.models import Session, as_session
+
+"""
+Almacén columnar de las sesiones para análisis y estadísticas.
+
+Cada instantánea se convierte una sola vez en una pyarrow.Table: fechas como
+date32, created_at como timestamp, la duración ya en minutos y categoría,
+dificultad, concentración y tema codificados como diccionario (un entero por
+fila y cada valor guardado una vez). En categoría, dificultad y concentración
+el índice es el código del enumerado menos uno (utils/enums.py), así que
+agrupar es un np.bincount sobre esos enteros. Los gráficos y las métricas
+cuentan y suman con pyarrow.compute o sobre vistas de NumPy/pandas de esas
+columnas, sin recorrer las sesiones ni crear un DataFrame por gráfico.
+"""
+
+SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("day", pa.int32()),
+    ("date", pa.date32()),
+    ("created_at", pa.timestamp("us", tz="UTC")),
+    ("category", pa.dictionary(pa.int16(), pa.string())),
+    ("difficulty", pa.dictionary(pa.int16(), pa.string())),
+    ("focus_level", pa.dictionary(pa.int16(), pa.string())),
+    ("topic", pa.dictionary(pa.int32(), pa.string())),
+    ("duration_minutes", pa.int32()),
+])
+
+_CATEGORICAL = ("topic",)
+
+
+def _typed(value, kind):
+    """El valor si ya es del tipo esperado (Session lo parseó); si no, None."""
+    return value if isinstance(value, kind) else None
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Las marcas sin zona se toman como UTC, igual que en Postgres
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _enum_column(values: Sequence[Any], enum: Type[CodedEnum]) -> pa.DictionaryArray:
+    """
+    Columna enumerada con diccionario fijo: las claves en orden de código.
+
+    Los textos que no son del enumerado (datos sin normalizar) se añaden al
+    final del diccionario para no perderlos.
+    """
+    keys = enum.keys()
+    codes = {member: int(member) - 1 for member in enum}
+    codes[None] = codes[""] = -1
+    indices = np.fromiter((codes.get(value, -2) for value in values), dtype=np.int16, count=len(values))
+
+    extra: Dict[str, int] = {}
+    for position in np.flatnonzero(indices == -2):
+        indices[position] = len(keys) + extra.setdefault(values[position], len(extra))
+    return pa.DictionaryArray.from_arrays(pa.array(indices, mask=indices < 0),
+                                          pa.array(keys + list(extra), type=pa.string()))
+
+
+def _code_counts(array: pa.DictionaryArray) -> np.ndarray:
+    """Sesiones por índice del diccionario (sin contar los nulos)."""
+    codes = array.indices.to_numpy(zero_copy_only=False)
+    valid = ~np.asarray(array.is_null())
+    return np.bincount(codes[valid].astype(np.int64), minlength=len(array.dictionary))
+
+
+def build_table(sessions: Sequence[Mapping]) -> pa.Table:
+    """
+    Convertir una instantánea de sesiones en una tabla columnar.
+
+    Args:
+        sessions: Sesiones (Session o dict)
+
+    Returns:
+        pa.Table: Tabla con el esquema SCHEMA
+    """
+    records: List[Session] = [as_session(s) for s in sessions]
+    columns = {
+        "id": pa.array([s.id for s in records], type=pa.string()),
+        "day": pa.array([s.day if isinstance(s.day, int) else None for s in records], type=pa.int32()),
+        "date": pa.array([_typed(s.date, date) for s in records], type=pa.date32()),
+        "created_at": pa.array([_utc(_typed(s.created_at, datetime)) for s in records],
+                               type=SCHEMA.field("created_at").type),
+    }
+    # Interpretar cada texto de duración distinto una sola vez
+    durations = pa.array([s.duration for s in records], type=pa.string()).dictionary_encode()
+    minutes = pa.array([duration_minutes(v) for v in durations.dictionary.to_pylist()], type=pa.int32())
+    columns["duration_minutes"] = minutes.take(durations.indices)
+    for name, enum in FIELD_ENUMS.items():
+        columns[name] = _enum_column([getattr(s, name) for s in records], enum)
+    for name in _CATEGORICAL:
+        values = pa.array([getattr(s, name) or None for s in records], type=pa.string())
+        columns[name] = values.dictionary_encode()
+    return pa.table([columns[field.name] for field in SCHEMA], schema=SCHEMA)
+
+
+class ColumnarStore:
+    """Tabla de una instantánea y las consultas que usan gráficos y métricas."""
+
+    def __init__(self, sessions: Sequence[Mapping]):
+        self.sessions = sessions
+        self.table = build_table(sessions)
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def column(self, name: str) -> pa.Array:
+        """Columna como un único array (sin copiar si ya tiene un solo bloque)."""
+        return self.table.column(name).combine_chunks()
+
+    def to_numpy(self, name: str) -> np.ndarray:
+        """
+        Vista de NumPy de una columna.
+
+        Las columnas numéricas y de fecha sin nulos no se copian; las
+        categóricas devuelven los códigos del diccionario.
+        """
+        array = self.column(name)
+        if pa.types.is_dictionary(array.type):
+            array = array.indices
+        return array.to_numpy(zero_copy_only=array.null_count == 0 and not pa.types.is_boolean(array.type))
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None):
+        """
+        DataFrame de pandas con las columnas pedidas.
+
+        Las categóricas llegan como pandas.Categorical (códigos + valores) y
+        las numéricas sin nulos comparten memoria con la tabla.
+        """
+        table = self.table.select(list(columns)) if columns else self.table
+        return table.to_pandas(date_as_object=False)
+
+    def value_counts(self, name: str, default: str = "Sin especificar") -> List[Tuple[str, int]]:
+        """
+        Cuántas sesiones tiene cada valor de una columna, de más a menos.
+
+        Args:
+            name: Columna categórica
+            default: Etiqueta para las sesiones sin valor
+
+        Returns:
+            List[Tuple[str, int]]: (valor, sesiones)
+        """
+        array = self.column(name)
+        if pa.types.is_dictionary(array.type):
+            # Contar sobre los códigos enteros y traducir solo los distintos
+            counts = _code_counts(array)
+            labels = array.dictionary.to_pylist()
+            result = [(labels[i], int(c)) for i, c in enumerate(counts) if c]
+        else:
+            result = [(item["values"], item["counts"]) for item in pc.value_counts(array).to_pylist()
+                      if item["values"] is not None]
+        missing = array.null_count
+        if missing:
+            result.append((default, missing))
+        return sorted(result, key=lambda item: -item[1])
+
+    def enum_counts(self, name: str) -> List[Tuple[Any, int]]:
+        """
+        Sesiones por valor de una columna enumerada, en orden de código.
+
+        Args:
+            name: "category", "difficulty" o "focus_level"
+
+        Returns:
+            List[Tuple[Any, int]]: (miembro, sesiones) solo de los valores
+            presentes; los textos sin normalizar van después con el texto
+            y las sesiones sin valor al final con None
+        """
+        enum = FIELD_ENUMS[name]
+        array = self.column(name)
+        counts = _code_counts(array)
+        values = list(enum) + array.dictionary.to_pylist()[len(enum):]
+        result = [(values[i], int(c)) for i, c in enumerate(counts) if c]
+        if array.null_count:
+            result.append((None, array.null_count))
+        return result
+
+    def weekday_counts(self) -> List[Tuple[int, int]]:
+        """Sesiones por día de la semana (0 = lunes), solo los que tienen alguna."""
+        weekdays = pc.day_of_week(self.column("date")).drop_null().to_numpy()
+        counts = np.bincount(weekdays, minlength=7)
+        return [(w, int(c)) for w, c in enumerate(counts) if c]
+
+    def sorted_dates(self) -> np.ndarray:
+        """Fechas de las sesiones ordenadas (datetime64[D]), sin las que faltan."""
+        dates = self.column("date").drop_null()
+        return np.sort(dates.to_numpy(zero_copy_only=False))
+
+    def total_minutes(self) -> int:
+        """Suma de las duraciones que se pudieron interpretar."""
+        total = pc.sum(self.column("duration_minutes")).as_py()
+        return int(total or 0)
+
+
+_lock = threading.Lock()
+_current: Optional[ColumnarStore] = None
+
+
+def get_store(sessions: Sequence[Mapping]) -> ColumnarStore:
+    """
+    Almacén columnar de una instantánea.
+
+    load_sessions() devuelve la misma instantánea mientras no cambie la
+    versión de los datos, así que la tabla se construye una vez por versión y
+    todos los gráficos y métricas la comparten.
+    """
+    global _current
+    with _lock:
+        if _current is None or _current.sessions is not sessions:
+            _current = ColumnarStore(sessions)
+        return _current
@@ -1,23 +1,28 @@
 import re
-from typing import Dict
-from datetime import datetime
+from typing import Mapping, Union
+from datetime import date, datetime
+
+from utils.models import session_date
 
 """
 Módulo para generación de contenido: posts sociales y artículos de Medium.
 """
 
-def format_date_spanish(date_str: str) -> str:
+def format_date_spanish(date_str: Union[str, date]) -> str:
     """
     Formatear fecha en formato español legible.
     
     Args:
-        date_str: Fecha en formato ISO (YYYY-MM-DD)
+        date_str: Fecha en formato ISO (YYYY-MM-DD) o ya convertida a date
         
     Returns:
         str: Fecha formateada en español
     """
     try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        if isinstance(date_str, date):
+            date_obj = date_str
+        else:
+            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
         
         months_es = {
             1: 'enero', 2: 'febrero', 3: 'marzo', 4: 'abril',
@@ -38,7 +43,7 @@ def format_date_spanish(date_str: str) -> str:
         return date_str
 
 
-def generate_social_post(session: Dict, language: str = "es") -> str:
+def generate_social_post(session: Mapping, language: str = "es") -> str:
     """
     Generar post para redes sociales (Twitter/LinkedIn).
     
@@ -91,7 +96,7 @@ def generate_social_post(session: Dict, language: str = "es") -> str:
     return post
 
 
-def generate_medium_article(session: Dict) -> str:
+def generate_medium_article(session: Mapping) -> str:
     """
     Generar borrador de artículo para Medium.
     
@@ -114,7 +119,7 @@ def generate_medium_article(session: Dict) -> str:
     next_steps = session.get('next_steps', 'Por definir')
     practical_application = session.get('practical_application', 'Por definir')
     
-    formatted_date = format_date_spanish(date)
+    formatted_date = format_date_spanish(session_date(session) or date)
     
     # Crear emoji según categoría
     category_emoji = {
@@ -191,7 +196,7 @@ category: {category}
     return article
 
 
-def get_social_post_summary(session: Dict) -> str:
+def get_social_post_summary(session: Mapping) -> str:
     """
     Obtener un resumen corto para previsualizar el post.
     
@@ -208,7 +213,7 @@ def get_social_post_summary(session: Dict) -> str:
     return f"Día {day}/100 | {category} | {topic}"
 
 
-def get_session_preview(session: Dict) -> str:
+def get_session_preview(session: Mapping) -> str:
     """
     Generar vista previa compacta de una sesión.
     
@@ -224,7 +229,7 @@ def get_session_preview(session: Dict) -> str:
     duration = session.get('duration', 'Sin duración')
     category = session.get('category', 'General')
     
-    formatted_date = format_date_spanish(date)
+    formatted_date = format_date_spanish(session_date(session) or date)
     
     preview = f"""
 ### Día {day} | {formatted_date}
@@ -1,50 +1,729 @@
 import os
+import hashlib
+import time
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Any, Callable, Iterator, List, Dict, Mapping, Optional, Sequence, Tuple
+import httpx
 import streamlit as st
 from supabase import create_client, Client
+from utils.resilience import CircuitBreaker, CircuitOpenError, is_transient
+from utils.session_cache import SharedCache, freeze_sessions
+from utils.shared_store import SharedStore, DEFAULT_CACHE_DIR
+from utils.write_queue import WriteJournal, OP_UPSERT, OP_DELETE, coalesce
+from utils.local_backend import create_local_client
+from utils.search_index import get_index as get_search_index
+from utils.session_filter import SessionFilter
+from utils.facets import duration_minutes
+from utils.models import FIELDS, session_created_at, session_date
 
 """
 Módulo para manejo de datos de sesiones de estudio.
 Maneja guardado/carga de datos desde Supabase.
+
+Las lecturas pasan por dos niveles de caché: una en memoria del proceso
+(utils/session_cache.py) y otra en disco compartida por todos los procesos
+de la máquina (utils/shared_store.py).
+
+Las llamadas a Supabase se reintentan ante errores transitorios y pasan por
+un circuit breaker (utils/resilience.py). Si el backend no responde, las
+lecturas sirven la última instantánea buena marcada como desactualizada y
+las escrituras se guardan en una cola local (utils/write_queue.py) que se
+reenvía al volver la conexión.
+
+La descarga completa de la tabla se pide en CSV y se interpreta con
+pyarrow (utils/bulk_read.py); STUDY_TRACKER_BULK_READ=json vuelve a JSON.
+
+Con STUDY_TRACKER_BACKEND=memory o sqlite:///ruta.db se usa un backend
+local en SQLite (utils/local_backend.py) en lugar de Supabase, para pruebas
+de carga y desarrollo sin conexión.
 """
 
+# Variable de entorno para usar el backend local en lugar de Supabase
+BACKEND_ENV = "STUDY_TRACKER_BACKEND"
+
+
+def using_local_backend() -> bool:
+    """Indicar si la app usa el backend local en lugar de Supabase."""
+    return bool(os.environ.get(BACKEND_ENV))
+
+
+def _get_credentials() -> Tuple[str, str]:
+    """Leer URL y token de Supabase desde st.secrets."""
+    if using_local_backend():
+        # Identifica la caché y la cola offline del backend local
+        return os.environ[BACKEND_ENV], ""
+    # Soporta tanto formato [supabase] como variables directas
+    if "supabase" in st.secrets:
+        return st.secrets["supabase"]["DB_URL"], st.secrets["supabase"]["DB_TOKEN"]
+    return st.secrets["DB_URL"], st.secrets["DB_TOKEN"]
+
+
+# Conexiones HTTP keep-alive reutilizadas por todas las consultas
+HTTP_TIMEOUT = 10.0
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60)
+
+# Circuit breaker compartido por todas las llamadas del proceso
+_breaker = CircuitBreaker()
+
+
+def _client_options():
+    """Opciones del cliente con un pool de conexiones propio, si se soporta."""
+    try:
+        from supabase import ClientOptions
+    except ImportError:
+        from supabase.lib.client_options import ClientOptions
+    
+    try:
+        http_client = httpx.Client(timeout=HTTP_TIMEOUT, limits=HTTP_POOL_LIMITS)
+        return ClientOptions(postgrest_client_timeout=HTTP_TIMEOUT, httpx_client=http_client)
+    except TypeError:
+        # supabase-py anterior a httpx_client: usa su propio pool keep-alive
+        return ClientOptions(postgrest_client_timeout=HTTP_TIMEOUT)
+
+
+@st.cache_resource
+def _create_client() -> Client:
+    """
+    Crear el cliente de Supabase una vez por proceso.
+    
+    Si falla lanza excepción, y st.cache_resource no guarda el error: el
+    siguiente intento vuelve a crear el cliente.
+    """
+    if using_local_backend():
+        return create_local_client(os.environ[BACKEND_ENV])
+    url, key = _get_credentials()
+    return create_client(url, key, options=_client_options())
+
+
 # Inicializar cliente de Supabase
+def init_supabase() -> Optional[Client]:
+    try:
+        return _create_client()
+    except Exception as e:
+        print(f"Error al conectar con Supabase: {e}")
+        _mark_degraded(e)
+        return None
+
+
+def _execute(query) -> Any:
+    """
+    Ejecutar una consulta con reintentos y circuit breaker.
+    
+    Args:
+        query: Consulta de supabase-py lista para .execute()
+        
+    Returns:
+        Any: Respuesta de Supabase
+    """
+    return _breaker.call(query.execute)
+
+
+def execute_query(query) -> Any:
+    """
+    Ejecutar una consulta de otro módulo con el circuit breaker de la capa
+    de datos (ver utils/async_data_manager.py).
+    
+    Args:
+        query: Consulta de supabase-py lista para .execute()
+        
+    Returns:
+        Any: Respuesta de Supabase
+    """
+    return _execute(query)
+
+
+def is_backend_available() -> bool:
+    """Indicar si Supabase se considera disponible (circuito no abierto)."""
+    return not _breaker.is_open
+
+
+# Última instantánea buena y estado de la última lectura
+_last_good: Optional[Tuple[Sequence[Mapping], float]] = None
+_last_error: Optional[str] = None
+
+
+def _mark_degraded(error: Exception) -> None:
+    global _last_error
+    _last_error = str(error) or type(error).__name__
+
+
+def _mark_healthy(sessions: Sequence[Mapping]) -> None:
+    global _last_good, _last_error
+    _last_error = None
+    if _last_good is None or _last_good[0] is not sessions:
+        _last_good = (sessions, time.time())
+
+
+def _stale_sessions() -> Optional[Sequence[Mapping]]:
+    """
+    Última instantánea buena, de memoria o de la caché en disco.
+    
+    Returns:
+        Optional[Sequence[Mapping]]: Sesiones desactualizadas, o None
+    """
+    global _last_good
+    if _last_good is not None:
+        return _last_good[0]
+    
+    store = _get_store()
+    latest = store.get_latest("sessions") if store is not None else None
+    if latest is None:
+        return None
+    rows, stored_at = latest
+    _last_good = (freeze_sessions(rows), stored_at)
+    return _last_good[0]
+
+
+def get_data_status() -> Dict:
+    """
+    Estado de los datos servidos en la última lectura.
+    
+    Returns:
+        Dict: {'stale': bool, 'as_of': Optional[datetime], 'error': Optional[str]}
+        stale es True cuando se están mostrando datos guardados porque
+        Supabase no respondió
+    """
+    stale = _last_error is not None
+    as_of = datetime.fromtimestamp(_last_good[1]) if stale and _last_good else None
+    return {'stale': stale, 'as_of': as_of, 'error': _last_error}
+
+
+# Segundos que los datos leídos permanecen en caché entre reruns.
+# Las escrituras de esta app invalidan la caché al momento.
+SESSIONS_CACHE_TTL = 300
+
+# Caché del proceso: la comparten todas las pestañas y usuarios del servidor
+_cache = SharedCache()
+
+# Directorio de la caché compartida entre procesos del mismo servidor
+SHARED_CACHE_DIR = os.environ.get("STUDY_TRACKER_CACHE_DIR", DEFAULT_CACHE_DIR)
+
+_store: Optional[SharedStore] = None
+# Última generación de la caché compartida vista por este proceso
+_seen_generation: Optional[int] = None
+
+# Segundos entre sondeos de versión. Dentro de este intervalo los reruns
+# no hacen ninguna petición; después basta una consulta mínima.
+DATA_VERSION_PROBE_TTL = 15
+
+# Se desactiva si la RPC study_sessions_version no está instalada
+_version_rpc_available = True
+
+# Se desactiva si la RPC renumber_study_sessions no está instalada
+_renumber_rpc_available = True
+
+# Se desactiva si la RPC search_sessions no está instalada
+_search_rpc_available = True
+
+# Resultados como máximo de una búsqueda en Supabase
+SEARCH_RESULTS_LIMIT = 200
+
+# Columnas de una sesión en las lecturas. Sin "*": la tabla también tiene
+# search_vector (columna generada de la búsqueda), que no hace falta descargar
+SESSION_COLUMNS = ",".join(FIELDS)
+
+# Formato de la descarga completa: "csv" (utils/bulk_read.py) o "json"
+BULK_READ_ENV = "STUDY_TRACKER_BULK_READ"
+
+# Se desactiva si PostgREST no puede devolver la tabla en CSV
+_bulk_read_available = True
+
+
+def _get_store() -> Optional[SharedStore]:
+    """
+    Abrir la caché compartida del proyecto de Supabase configurado.
+    
+    Returns:
+        Optional[SharedStore]: Almacén compartido, o None si no se puede abrir
+    """
+    global _store
+    if _store is None:
+        try:
+            url, _ = _get_credentials()
+            # Un archivo por proyecto para no mezclar datos de distintas bases
+            project = hashlib.sha1(url.encode()).hexdigest()[:12]
+            _store = SharedStore(os.path.join(SHARED_CACHE_DIR, f"sessions_{project}.sqlite"))
+        except Exception as e:
+            print(f"Caché compartida no disponible: {e}")
+            return None
+    return _store
+
+
+# Directorio del diario de escrituras offline. No usa el directorio temporal
+# porque las escrituras pendientes deben sobrevivir a un reinicio.
+JOURNAL_DIR = os.environ.get(
+    "STUDY_TRACKER_JOURNAL_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".offline")
+)
+
+_journal: Optional[WriteJournal] = None
+
+
+def _get_journal() -> Optional[WriteJournal]:
+    """
+    Abrir el diario de escrituras offline del proyecto configurado.
+    
+    Returns:
+        Optional[WriteJournal]: Diario, o None si no se puede abrir
+    """
+    global _journal
+    if _journal is None:
+        try:
+            url, _ = _get_credentials()
+            project = hashlib.sha1(url.encode()).hexdigest()[:12]
+            _journal = WriteJournal(os.path.join(JOURNAL_DIR, f"writes_{project}.sqlite"))
+        except Exception as e:
+            print(f"Cola de escrituras offline no disponible: {e}")
+            return None
+    return _journal
+
+
+def _sync_shared_generation() -> None:
+    """Vaciar la caché en memoria si otro proceso escribió datos."""
+    global _seen_generation
+    
+    store = _get_store()
+    if store is None:
+        return
+    
+    generation = store.generation()
+    if generation != _seen_generation:
+        if _seen_generation is not None:
+            _cache.invalidate()
+        _seen_generation = generation
+
+
+def _shared_load(key: str, loader: Callable[[], Any], ttl: float, version: Any = None) -> Any:
+    """
+    Cargar un valor a través de la caché compartida entre procesos.
+    
+    Si otro proceso ya lo descargó se lee del disco. Si no, un lock de
+    archivo garantiza que solo un proceso consulte Supabase.
+    
+    Args:
+        key: Nombre del valor
+        loader: Función que consulta Supabase
+        ttl: Segundos que el valor se considera vigente
+        version: Versión de los datos
+        
+    Returns:
+        Any: Valor serializable a JSON
+    """
+    store = _get_store()
+    if store is None:
+        return loader()
+    
+    value = store.get(key, ttl, version)
+    if value is not None:
+        return value
+    
+    with store.lock(key):
+        # Otro proceso pudo haberlo cargado mientras esperábamos el lock
+        value = store.get(key, ttl, version)
+        if value is not None:
+            return value
+        
+        value = loader()
+        store.put(key, value, version)
+    return value
+
+
+def _probe_data_version() -> Tuple[int, Optional[str]]:
+    """
+    Consultar la versión de los datos: (row_count, max(updated_at)).
+    
+    Usa la RPC study_sessions_version (ver
+    migrations/postgres/0002_data_version.sql) y, si no existe, una consulta
+    de una sola fila con count exacto.
+    """
+    global _version_rpc_available
+    
+    supabase = init_supabase()
+    if not supabase:
+        raise RuntimeError("Cliente de Supabase no disponible")
+    
+    if _version_rpc_available:
+        try:
+            response = _execute(supabase.rpc("study_sessions_version"))
+            row = response.data[0] if isinstance(response.data, list) else response.data
+            return (row['row_count'], row['max_updated_at'])
+        except Exception as e:
+            if is_transient(e) or not is_backend_available():
+                raise
+            print(f"RPC study_sessions_version no disponible: {e}")
+            _version_rpc_available = False
+    
+    response = _execute(
+        supabase.table("study_sessions")
+        .select("updated_at", count="exact")
+        .order("updated_at", desc=True)
+        .limit(1)
+    )
+    max_updated_at = response.data[0]['updated_at'] if response.data else None
+    return (response.count, max_updated_at)
+
+
+def version_rpc_available() -> bool:
+    """Indicar si la RPC study_sessions_version está instalada (o aún no falló)."""
+    return _version_rpc_available
+
+
+def get_data_version(fresh: bool = False) -> Optional[Tuple[int, Optional[str]]]:
+    """
+    Obtener la versión actual de los datos en Supabase.
+    
+    Args:
+        fresh: Consultar a Supabase sin pasar por las cachés (por ejemplo
+            para decidir si un backup tiene cambios)
+    
+    Returns:
+        Optional[Tuple[int, Optional[str]]]: (row_count, max_updated_at), o
+        None si no se pudo consultar (las cachés usan entonces solo el TTL)
+    """
+    _sync_shared_generation()
+    
+    try:
+        if fresh:
+            return _probe_data_version()
+        return _cache.get(
+            "data_version",
+            # JSON devuelve listas; la versión debe ser hashable
+            lambda: tuple(_shared_load("data_version", _probe_data_version, DATA_VERSION_PROBE_TTL)),
+            ttl=DATA_VERSION_PROBE_TTL
+        )
+    except Exception as e:
+        print(f"Error al consultar la versión de datos: {e}")
+        return None
+
+
 @st.cache_resource
-def init_supabase() -> Client:
+def _bulk_http_client() -> httpx.Client:
+    """Cliente HTTP keep-alive para las descargas en CSV, uno por proceso."""
+    return httpx.Client(timeout=HTTP_TIMEOUT, limits=HTTP_POOL_LIMITS)
+
+
+def _fetch_sessions_csv() -> Optional[List[Mapping]]:
+    """
+    Descargar todas las sesiones en CSV (ver utils/bulk_read.py).
+    
+    Returns:
+        Optional[List[Mapping]]: Sesiones, o None si la lectura en CSV está
+        desactivada o no disponible y hay que usar JSON
+    """
+    global _bulk_read_available
+    if (not _bulk_read_available or using_local_backend()
+            or os.environ.get(BULK_READ_ENV, "csv").lower() != "csv"):
+        return None
+    
     try:
-        # Intentar obtener credenciales de st.secrets
-        # Soporta tanto formato [supabase] como variables directas
-        if "supabase" in st.secrets:
-            url = st.secrets["supabase"]["DB_URL"]
-            key = st.secrets["supabase"]["DB_TOKEN"]
-        else:
-            url = st.secrets["DB_URL"]
-            key = st.secrets["DB_TOKEN"]
-            
-        return create_client(url, key)
+        from utils import bulk_read
+        url, key = _get_credentials()
+        return _breaker.call(lambda: bulk_read.fetch_sessions(url, key, _bulk_http_client()))
     except Exception as e:
-        st.error(f"Error al conectar con Supabase: {e}")
-        st.warning("Asegúrate de configurar .streamlit/secrets.toml correctamente.")
+        if is_transient(e) or not is_backend_available():
+            raise
+        print(f"Lectura en CSV no disponible, se usa JSON: {e}")
+        _bulk_read_available = False
         return None
 
-def load_sessions() -> List[Dict]:
+
+def _fetch_sessions() -> List[Mapping]:
+    """
+    Descargar todas las sesiones desde Supabase.
+    
+    Primero en CSV, que pyarrow interpreta sin crear un dict por fila; si
+    no está disponible, en JSON con supabase-py.
+    
+    Lanza excepción si falla para que un error no quede guardado en caché.
+    """
+    sessions = _fetch_sessions_csv()
+    if sessions is not None:
+        return sessions
+    
+    supabase = init_supabase()
+    if not supabase:
+        raise RuntimeError("Cliente de Supabase no disponible")
+        
+    response = _execute(supabase.table("study_sessions").select(SESSION_COLUMNS).order("date", desc=False))
+    return response.data
+
+
+def fetch_sessions_shared(key: str, ttl: float = DATA_VERSION_PROBE_TTL) -> List[Mapping]:
+    """
+    Descargar todas las sesiones sin validar antes la versión.
+    
+    Pasa por la caché single-flight y el lock entre procesos, así varias
+    páginas abiertas en frío a la vez hacen una sola descarga. La carga en
+    paralelo (utils/async_data_manager.py) la valida después con la versión.
+    
+    Args:
+        key: Clave en las cachés; distinta de la de load_sessions(), que solo
+            guarda descargas con versión validada
+        ttl: Segundos que la descarga se considera vigente
+        
+    Returns:
+        List[Mapping]: Sesiones ordenadas por fecha
+    """
+    return _cache.get(key, lambda: _shared_load(key, _fetch_sessions, ttl), ttl=ttl)
+
+
+def fetch_sessions_count() -> int:
+    """Contar las sesiones en Supabase sin descargar la tabla."""
+    supabase = init_supabase()
+    if not supabase:
+        raise RuntimeError("Cliente de Supabase no disponible")
+    
+    # Usar count exacto es más eficiente; limit(1) evita descargar la tabla
+    response = _execute(supabase.table("study_sessions").select("id", count="exact").limit(1))
+    return response.count if response.count is not None else len(response.data)
+
+
+def invalidate_sessions_cache() -> None:
+    """Vaciar las cachés de lectura tras una escritura, en todos los procesos."""
+    global _seen_generation
+    
+    _cache.invalidate()
+    
+    store = _get_store()
+    if store is not None:
+        _seen_generation = store.invalidate()
+
+
+def get_cached_sessions() -> Optional[Sequence[Mapping]]:
+    """
+    Devolver las sesiones en caché si siguen vigentes, sin hacer peticiones.
+    
+    Returns:
+        Optional[Sequence[Mapping]]: Instantánea vigente, o None
+    """
+    _sync_shared_generation()
+    
+    version = _cache.peek("data_version", DATA_VERSION_PROBE_TTL)
+    sessions = _cache.peek("sessions", SESSIONS_CACHE_TTL)
+    if version is not None and sessions is not None and sessions[1] == version[0]:
+        return sessions[0]
+    
+    # Otro proceso pudo haberlas descargado ya
+    store = _get_store()
+    if store is None:
+        return None
+    shared_version = store.get("data_version", DATA_VERSION_PROBE_TTL)
+    if shared_version is None:
+        return None
+    shared_version = tuple(shared_version)
+    rows = store.get("sessions", SESSIONS_CACHE_TTL, shared_version)
+    if rows is None:
+        return None
+    
+    frozen = freeze_sessions(rows)
+    _cache.put("data_version", shared_version)
+    _cache.put("sessions", frozen, shared_version)
+    return frozen
+
+
+def has_cached_sessions() -> bool:
+    """Indicar si hay sesiones en memoria, aunque haya que revalidar su versión."""
+    return _cache.peek("sessions", SESSIONS_CACHE_TTL) is not None
+
+
+def prime_sessions_cache(rows: List[Dict], version: Optional[Tuple[int, Optional[str]]]) -> Sequence[Mapping]:
+    """
+    Guardar en caché sesiones y versión descargadas por otra vía.
+    
+    Args:
+        rows: Filas de sesiones tal como las devuelve Supabase
+        version: Versión consultada junto con las filas
+        
+    Returns:
+        Sequence[Mapping]: Instantánea inmutable de las sesiones
+    """
+    sessions = freeze_sessions(rows)
+    _cache.put("data_version", version)
+    _cache.put("sessions", sessions, version)
+    
+    store = _get_store()
+    if store is not None:
+        store.put("data_version", version)
+        store.put("sessions", rows, version)
+    
+    _mark_healthy(sessions)
+    return sessions
+
+
+def load_sessions() -> Sequence[Mapping]:
     """
     Cargar todas las sesiones desde Supabase.
     
+    El resultado se guarda en caché en memoria y en disco compartido por los
+    procesos del servidor, así que interactuar con widgets no vuelve a
+    consultar Supabase. Solo se vuelve a descargar la tabla cuando la versión
+    de datos cambia, y las lecturas simultáneas comparten una sola descarga.
+    
+    Si Supabase no responde se devuelve la última instantánea buena y
+    get_data_status() lo indica como datos desactualizados.
+    
     Returns:
-        List[Dict]: Lista de sesiones, o lista vacía si no hay datos
+        Sequence[Mapping]: Instantánea inmutable de las sesiones (tupla de
+        mappings de solo lectura), o lista vacía si no hay datos
     """
+    # Reenviar primero lo que quedó pendiente mientras no había conexión
+    if pending_writes_count() > 0 and is_backend_available():
+        replay_pending_writes()
+    
     try:
+        version = get_data_version()
+        sessions = _cache.get(
+            "sessions",
+            lambda: freeze_sessions(_shared_load("sessions", _fetch_sessions, SESSIONS_CACHE_TTL, version)),
+            ttl=SESSIONS_CACHE_TTL,
+            version=version
+        )
+    except Exception as e:
+        print(f"Error al cargar sesiones: {e}")
+        _mark_degraded(e)
+        # Modo degradado: mejor datos desactualizados que una lista vacía
+        stale = _stale_sessions()
+        return stale if stale is not None else []
+    
+    _mark_healthy(sessions)
+    return sessions
+
+
+def load_filtered_sessions(session_filter: SessionFilter) -> Sequence[Mapping]:
+    """
+    Cargar solo las sesiones que cumplen un filtro.
+    
+    Si la instantánea completa ya está en caché se filtra en memoria, sin
+    peticiones. Si no, el filtro se traduce a cláusulas de PostgREST y
+    Supabase devuelve únicamente esas filas. La última lectura filtrada se
+    guarda en caché hasta que cambie la versión de los datos.
+    
+    Args:
+        session_filter: Rango de fechas, categoría, dificultad, orden y límite
+        
+    Returns:
+        Sequence[Mapping]: Instantánea inmutable de las sesiones filtradas, en
+        el orden del filtro (de la última instantánea buena si Supabase no
+        responde), o lista vacía si no hay datos
+    """
+    cached = get_cached_sessions()
+    if cached is not None:
+        return tuple(session_filter.apply(cached))
+    
+    def _fetch_filtered() -> Sequence[Mapping]:
         supabase = init_supabase()
         if not supabase:
-            return []
-            
-        response = supabase.table("study_sessions").select("*").order("date", desc=False).execute()
-        return response.data
+            raise RuntimeError("Cliente de Supabase no disponible")
+        query = session_filter.to_query(supabase.table("study_sessions").select(SESSION_COLUMNS))
+        return freeze_sessions(_execute(query).data)
+    
+    try:
+        # Una sola entrada: la vista actual sobrevive a los reruns
+        return _cache.get("filtered_sessions", _fetch_filtered, ttl=SESSIONS_CACHE_TTL,
+                          version=(get_data_version(), session_filter))
     except Exception as e:
-        print(f"Error al cargar sesiones: {e}")
-        return []
+        print(f"Error al cargar sesiones filtradas: {e}")
+        _mark_degraded(e)
+        stale = _stale_sessions()
+        return tuple(session_filter.apply(stale)) if stale is not None else []
+
+
+def load_sessions_table():
+    """
+    Cargar las sesiones como tabla columnar para análisis.
+    
+    La tabla (pyarrow.Table con categorías codificadas como diccionario) se
+    construye una vez por instantánea y se comparte entre gráficos y
+    métricas; ver utils/columnar.py para vistas de NumPy y pandas.
+    
+    Returns:
+        pyarrow.Table: Sesiones de load_sessions() en columnas
+    """
+    from utils import columnar
+    return columnar.get_store(load_sessions()).table
+
+
+# Filas por página al recorrer la tabla completa
+EXPORT_PAGE_SIZE = 1000
+
+
+def iter_sessions(page_size: int = EXPORT_PAGE_SIZE, columns: str = SESSION_COLUMNS,
+                  updated_since: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Recorrer todas las sesiones de Supabase página a página.
+    
+    Usa paginación por clave (id > último id visto), así que la memoria no
+    depende del tamaño del historial y cada página es una consulta indexada.
+    No pasa por la caché. Las sesiones salen ordenadas por id.
+    
+    Args:
+        page_size: Filas por consulta
+        columns: Columnas a leer (siempre debe incluir id)
+        updated_since: Solo sesiones con updated_at >= este valor
+        
+    Returns:
+        Iterator[Dict]: Sesiones una a una
+    """
+    supabase = init_supabase()
+    if not supabase:
+        raise RuntimeError("Cliente de Supabase no disponible")
+    
+    last_id = None
+    while True:
+        query = supabase.table("study_sessions").select(columns).order("id").limit(page_size)
+        if updated_since is not None:
+            query = query.gte("updated_at", updated_since)
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        rows = _execute(query).data
+        yield from rows
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]['id']
+
+
+def search_sessions_remote(query: str, limit: int = SEARCH_RESULTS_LIMIT) -> Optional[List[Dict]]:
+    """
+    Buscar sesiones con el índice de texto completo de Postgres.
+    
+    Usa la RPC search_sessions (ver migrations/postgres/0004_search.sql), que
+    resuelve la búsqueda con un índice GIN sin descargar la tabla. La última búsqueda se
+    guarda en caché hasta que cambie la versión de los datos.
+    
+    Args:
+        query: Texto de búsqueda
+        limit: Número máximo de resultados
+        
+    Returns:
+        Optional[List[Dict]]: Sesiones encontradas (columnas de la sesión más
+        rank y snippet, el fragmento con las coincidencias entre **), de la
+        más relevante a la menos; None si la RPC no está instalada o
+        Supabase no responde
+    """
+    global _search_rpc_available
+    if not _search_rpc_available or not query.strip():
+        return None
+    
+    supabase = init_supabase()
+    if not supabase:
+        return None
+    
+    def _run_search() -> List[Dict]:
+        response = _execute(supabase.rpc("search_sessions", {"query": query, "max_results": limit}))
+        return response.data or []
+    
+    try:
+        # Una sola entrada: la búsqueda actual sobrevive a los reruns
+        return _cache.get("search", _run_search, ttl=SESSIONS_CACHE_TTL,
+                          version=(get_data_version(), query, limit))
+    except Exception as e:
+        if is_transient(e) or not is_backend_available():
+            print(f"Error al buscar en Supabase: {e}")
+        else:
+            print(f"RPC search_sessions no disponible: {e}")
+            _search_rpc_available = False
+        return None
 
 
 def recalculate_days() -> bool:
@@ -52,17 +731,32 @@ def recalculate_days() -> bool:
     Recalcular los números de día basados en la fecha.
     Ordena por fecha y asigna día 1, 2, 3...
     
+    Usa la RPC renumber_study_sessions (ver
+    migrations/postgres/0003_renumber_days.sql), que lo hace en una sola
+    sentencia, y si no existe actualiza fila a fila.
+    
     Returns:
         bool: True si se actualizó correctamente
     """
+    global _renumber_rpc_available
     try:
         supabase = init_supabase()
         if not supabase:
             return False
+        
+        if _renumber_rpc_available:
+            try:
+                _execute(supabase.rpc("renumber_study_sessions"))
+                return True
+            except Exception as e:
+                if is_transient(e) or not is_backend_available():
+                    raise
+                print(f"RPC renumber_study_sessions no disponible: {e}")
+                _renumber_rpc_available = False
             
         # Obtener todas las sesiones ordenadas por fecha
         # Usamos created_at como tie-breaker para fechas iguales
-        response = supabase.table("study_sessions").select("id, day, date, created_at").order("date", desc=False).order("created_at", desc=False).execute()
+        response = _execute(supabase.table("study_sessions").select("id, day, date, created_at").order("date", desc=False).order("created_at", desc=False))
         sessions = response.data
         
         if not sessions:
@@ -102,7 +796,7 @@ def recalculate_days() -> bool:
             # PERO si es un update, Postgres no valida nulls de otras columnas.
             
             for update in updates:
-                supabase.table("study_sessions").update({"day": update['day']}).eq("id", update['id']).execute()
+                _execute(supabase.table("study_sessions").update({"day": update['day']}).eq("id", update['id']))
                 
         return True
     except Exception as e:
@@ -110,32 +804,241 @@ def recalculate_days() -> bool:
         return False
 
 
-def save_session(session_data: Dict) -> bool:
+def _should_queue(error: Exception) -> bool:
+    """Indicar si una escritura fallida debe guardarse para reenviarla."""
+    return isinstance(error, CircuitOpenError) or is_transient(error)
+
+
+def _queue_write(op: str, session_id: str, payload: Optional[Dict] = None,
+                 base_updated_at: Optional[str] = None) -> bool:
+    """
+    Guardar una escritura en el diario offline.
+    
+    Returns:
+        bool: True si quedó guardada
+    """
+    journal = _get_journal()
+    if journal is None:
+        return False
+    try:
+        journal.append(op, session_id, payload, base_updated_at)
+        print(f"📴 Escritura guardada offline ({op} {session_id})")
+        return True
+    except Exception as e:
+        print(f"Error al guardar escritura offline: {e}")
+        return False
+
+
+def pending_writes_count() -> int:
+    """
+    Obtener el número de escrituras pendientes de enviar a Supabase.
+    
+    Returns:
+        int: Escrituras en la cola offline
+    """
+    journal = _get_journal()
+    try:
+        return journal.pending_count() if journal is not None else 0
+    except Exception as e:
+        print(f"Error al leer la cola offline: {e}")
+        return 0
+
+
+def get_write_conflicts() -> List[Dict]:
+    """
+    Obtener las escrituras offline que no se aplicaron por conflicto.
+    
+    Returns:
+        List[Dict]: Conflictos con session_id, op, payload y reason
+    """
+    journal = _get_journal()
+    try:
+        return journal.conflicts() if journal is not None else []
+    except Exception as e:
+        print(f"Error al leer conflictos: {e}")
+        return []
+
+
+def dismiss_write_conflicts() -> None:
+    """Descartar los conflictos ya revisados por el usuario."""
+    journal = _get_journal()
+    if journal is not None:
+        journal.clear_conflicts()
+
+
+def replay_pending_writes() -> Dict[str, int]:
+    """
+    Reenviar a Supabase las escrituras guardadas offline.
+    
+    Agrupa las ediciones de una misma sesión en una sola, comprueba en una
+    consulta si el servidor cambió esas sesiones mientras tanto, y envía los
+    upserts y deletes restantes en un request cada uno. Los días se
+    recalculan una sola vez al final.
+    
+    Returns:
+        Dict[str, int]: {'applied': n, 'conflicts': n}
+    """
+    summary = {'applied': 0, 'conflicts': 0}
+    
+    journal = _get_journal()
+    supabase = init_supabase()
+    if journal is None or not supabase or not is_backend_available():
+        return summary
+    
+    with journal.lock():
+        pending = journal.pending()
+        if not pending:
+            return summary
+        
+        writes = coalesce(pending)
+        last_seq = pending[-1]['seq']
+        
+        try:
+            ids = [w['session_id'] for w in writes]
+            response = _execute(supabase.table("study_sessions").select("id, updated_at").in_("id", ids))
+            server = {row['id']: row.get('updated_at') for row in response.data}
+            
+            upserts, deletes = [], []
+            for write in writes:
+                session_id = write['session_id']
+                base = write['base_updated_at']
+                
+                if base is not None and session_id not in server:
+                    if write['op'] == OP_UPSERT:
+                        journal.record_conflict(write, None, "La sesión fue eliminada en el servidor")
+                        summary['conflicts'] += 1
+                    # Un delete de algo ya eliminado no necesita enviarse
+                    continue
+                if base is not None and server[session_id] != base:
+                    journal.record_conflict(write, server[session_id], "La sesión fue modificada en el servidor")
+                    summary['conflicts'] += 1
+                    continue
+                
+                if write['op'] == OP_UPSERT:
+                    upserts.append(write['payload'])
+                else:
+                    deletes.append(session_id)
+            
+            if upserts:
+                _execute(supabase.table("study_sessions").upsert(upserts))
+            if deletes:
+                _execute(supabase.table("study_sessions").delete().in_("id", deletes))
+        except Exception as e:
+            print(f"Error al reenviar escrituras offline: {e}")
+            if _should_queue(e):
+                # Sigue sin conexión: se reintentará más tarde
+                return summary
+            # El servidor rechaza el lote: apartarlo para no reintentarlo siempre
+            for write in writes:
+                journal.record_conflict(write, None, f"Error al aplicar: {e}")
+            journal.remove_through(last_seq)
+            summary['conflicts'] = len(writes)
+            return summary
+        
+        journal.remove_through(last_seq)
+        summary['applied'] = len(upserts) + len(deletes)
+    
+    print(f"🔄 Cola offline reenviada: {summary['applied']} aplicadas, {summary['conflicts']} conflictos")
+    recalculate_days()
+    invalidate_sessions_cache()
+    return summary
+
+
+def save_session(session_data: Dict, base_updated_at: Optional[str] = None) -> bool:
     """
     Guardar una sesión en Supabase (insertar o actualizar).
     
+    Si Supabase no está disponible la sesión se guarda en la cola offline y
+    se envía cuando vuelva la conexión (ver pending_writes_count()).
+    
     Args:
         session_data: Datos de la sesión a guardar
+        base_updated_at: updated_at de la sesión editada, para detectar
+            conflictos si la escritura queda en cola
         
     Returns:
-        bool: True si se guardó correctamente, False en caso contrario
+        bool: True si se guardó (o quedó en cola), False en caso contrario
     """
+    # Con escrituras pendientes, esta debe ir detrás para respetar el orden
+    if pending_writes_count() > 0:
+        if not _queue_write(OP_UPSERT, session_data['id'], session_data, base_updated_at):
+            return False
+        replay_pending_writes()
+        return True
+    
     try:
         supabase = init_supabase()
         if not supabase:
-            return False
+            return _queue_write(OP_UPSERT, session_data['id'], session_data, base_updated_at)
             
         # Upsert maneja tanto insert como update si el ID existe
-        response = supabase.table("study_sessions").upsert(session_data).execute()
+        response = _execute(supabase.table("study_sessions").upsert(session_data))
+        get_search_index().add(session_data)
         
         # Recalcular días para asegurar orden cronológico
         # Esto es importante si se cambió la fecha
         recalculate_days()
+        invalidate_sessions_cache()
         
         # Verificar si hubo respuesta exitosa (data no vacía)
         return bool(response.data)
     except Exception as e:
         print(f"Error al guardar sesión: {e}")
+        if _should_queue(e):
+            return _queue_write(OP_UPSERT, session_data['id'], session_data, base_updated_at)
+        return False
+
+
+def upsert_sessions_batch(sessions: List[Dict]) -> bool:
+    """
+    Insertar o actualizar muchas sesiones en una sola petición.
+    
+    Pensado para importaciones: no recalcula los días ni invalida la caché,
+    así que al terminar hay que llamar a recalculate_days() y a
+    invalidate_sessions_cache() una vez. No usa la cola offline.
+    
+    Args:
+        sessions: Sesiones completas, con ID
+        
+    Returns:
+        bool: True si Supabase aceptó el lote
+    """
+    if not sessions:
+        return True
+    try:
+        supabase = init_supabase()
+        if not supabase:
+            return False
+        _execute(supabase.table("study_sessions").upsert(sessions))
+        return True
+    except Exception as e:
+        print(f"Error al guardar lote de {len(sessions)} sesiones: {e}")
+        return False
+
+
+def delete_sessions_batch(session_ids: List[str]) -> bool:
+    """
+    Eliminar muchas sesiones en una sola petición.
+    
+    Igual que upsert_sessions_batch(): no recalcula días, no invalida la
+    caché y no usa la cola offline.
+    
+    Args:
+        session_ids: IDs de las sesiones a eliminar
+        
+    Returns:
+        bool: True si Supabase aceptó el borrado
+    """
+    if not session_ids:
+        return True
+    try:
+        supabase = init_supabase()
+        if not supabase:
+            return False
+        _execute(supabase.table("study_sessions").delete().in_("id", session_ids))
+        return True
+    except Exception as e:
+        print(f"Error al eliminar lote de {len(session_ids)} sesiones: {e}")
         return False
 
 
@@ -150,8 +1053,7 @@ def add_session(session_data: Dict) -> bool:
         bool: True si se agregó correctamente
     """
     # Calcular número de día
-    sessions = load_sessions()
-    session_data['day'] = len(sessions) + 1
+    session_data['day'] = get_sessions_count() + 1
     
     # Generar ID único si no existe
     if 'id' not in session_data:
@@ -164,29 +1066,43 @@ def add_session(session_data: Dict) -> bool:
     return save_session(session_data)
 
 
-def delete_session(session_id: str) -> bool:
+def delete_session(session_id: str, base_updated_at: Optional[str] = None) -> bool:
     """
     Eliminar una sesión por ID.
     
+    Si Supabase no está disponible el borrado queda en la cola offline.
+    
     Args:
         session_id: ID de la sesión a eliminar
+        base_updated_at: updated_at de la sesión vista por el usuario, para
+            detectar conflictos si el borrado queda en cola
         
     Returns:
-        bool: True si se eliminó correctamente
+        bool: True si se eliminó (o quedó en cola) correctamente
     """
+    if pending_writes_count() > 0:
+        if not _queue_write(OP_DELETE, session_id, None, base_updated_at):
+            return False
+        replay_pending_writes()
+        return True
+    
     try:
         supabase = init_supabase()
         if not supabase:
-            return False
+            return _queue_write(OP_DELETE, session_id, None, base_updated_at)
             
-        supabase.table("study_sessions").delete().eq("id", session_id).execute()
+        _execute(supabase.table("study_sessions").delete().eq("id", session_id))
+        get_search_index().remove(session_id)
         
         # Recalcular números de día
         recalculate_days()
+        invalidate_sessions_cache()
         
         return True
     except Exception as e:
         print(f"Error al eliminar sesión: {e}")
+        if _should_queue(e):
+            return _queue_write(OP_DELETE, session_id, None, base_updated_at)
         return False
 
 
@@ -205,7 +1121,7 @@ def get_session_by_id(session_id: str) -> Optional[Dict]:
         if not supabase:
             return None
             
-        response = supabase.table("study_sessions").select("*").eq("id", session_id).execute()
+        response = _execute(supabase.table("study_sessions").select(SESSION_COLUMNS).eq("id", session_id))
         
         if response.data:
             return response.data[0]
@@ -222,39 +1138,51 @@ def get_sessions_count() -> int:
     Returns:
         int: Número total de sesiones
     """
+    version = get_data_version()
+    if version is not None and version[0] is not None:
+        return version[0]
+    
     try:
-        supabase = init_supabase()
-        if not supabase:
-            return 0
-        
-        # Usar count exacto es más eficiente
-        response = supabase.table("study_sessions").select("*", count="exact").execute()
-        return response.count if response.count is not None else len(response.data)
-    except:
-        return len(load_sessions())
+        return _cache.get(
+            "sessions_count",
+            lambda: _shared_load("sessions_count", fetch_sessions_count, SESSIONS_CACHE_TTL),
+            ttl=SESSIONS_CACHE_TTL
+        )
+    except Exception as e:
+        print(f"Error al contar sesiones: {e}")
+        _mark_degraded(e)
+        # Modo degradado: contar la última instantánea buena
+        stale = _stale_sessions()
+        return len(stale) if stale is not None else 0
 
 
-def get_current_streak() -> int:
+def get_current_streak(sessions: Optional[Sequence[Mapping]] = None) -> int:
     """
     Calcular la racha actual de días consecutivos estudiando.
     
+    Args:
+        sessions: Sesiones ya cargadas; si se omite se cargan de Supabase
+        
     Returns:
         int: Número de días consecutivos
     """
-    sessions = load_sessions()
+    if sessions is None:
+        sessions = load_sessions()
     
     if not sessions:
         return 0
     
-    # Ordenar por fecha descendente
-    sessions_sorted = sorted(sessions, key=lambda x: x.get('date', ''), reverse=True)
+    # Fechas ya parseadas (Session), de la más reciente a la más antigua
+    dates = sorted((d for d in map(session_date, sessions) if d is not None), reverse=True)
+    if not dates:
+        return 0
     
     # Verificar si el último día estudiado es hoy
     # Si la última sesión no es de hoy, no hay racha
     # MODIFICACIÓN: Permitir que la última sesión sea de ayer para manejar diferencias de zona horaria
     # (ej. usuario en UTC-4 estudia "hoy", servidor en UTC ya es "mañana")
     from datetime import date
-    last_session_date = datetime.fromisoformat(sessions_sorted[0]['date']).date()
+    last_session_date = dates[0]
     today_date = date.today()
     
     if (today_date - last_session_date).days > 1:
@@ -262,9 +1190,9 @@ def get_current_streak() -> int:
     
     # Contar días consecutivos
     streak = 1
-    for i in range(len(sessions_sorted) - 1):
-        current_date = datetime.fromisoformat(sessions_sorted[i]['date']).date()
-        next_date = datetime.fromisoformat(sessions_sorted[i + 1]['date']).date()
+    for i in range(len(dates) - 1):
+        current_date = dates[i]
+        next_date = dates[i + 1]
         
         if (current_date - next_date).days == 1:
             streak += 1
@@ -274,26 +1202,31 @@ def get_current_streak() -> int:
     return streak
 
 
-def get_days_since_last_study() -> int:
+def get_days_since_last_study(sessions: Optional[Sequence[Mapping]] = None) -> int:
     """
     Obtener los días transcurridos desde la última sesión de estudio.
     
+    Args:
+        sessions: Sesiones ya cargadas; si se omite se cargan de Supabase
+        
     Returns:
         int: Número de días desde última sesión
     """
-    sessions = load_sessions()
+    if sessions is None:
+        sessions = load_sessions()
     
     if not sessions:
         # Si nunca ha estudiado, retornar un número alto
         return 999
     
-    # Ordenar por fecha descendente
-    sessions_sorted = sorted(sessions, key=lambda x: x.get('date', ''), reverse=True)
-    last_study_date = sessions_sorted[0].get('date')
-    
     from datetime import date, datetime, timedelta
+    
+    # Sesión más reciente, con la fecha ya parseada (Session)
+    last_session = max(sessions, key=lambda s: session_date(s) or date.min)
+    last_date = session_date(last_session)
+    if last_date is None:
+        return 999
     today = date.today()
-    last_date = datetime.fromisoformat(last_study_date).date()
     
     diff = (today - last_date).days
     
@@ -301,9 +1234,8 @@ def get_days_since_last_study() -> int:
     if diff == 1:
         try:
             # Intentar obtener created_at para verificar si fue hace poco
-            created_at_str = sessions_sorted[0].get('created_at')
-            if created_at_str:
-                created_at = datetime.fromisoformat(created_at_str)
+            created_at = session_created_at(last_session)
+            if created_at:
                 
                 # Obtener ahora en UTC si created_at tiene timezone, o naive si no
                 if created_at.tzinfo is not None:
@@ -322,34 +1254,25 @@ def get_days_since_last_study() -> int:
     return diff
 
 
-def get_total_hours_studied() -> str:
+def get_total_hours_studied(sessions: Optional[Sequence[Mapping]] = None) -> str:
     """
     Calcular el total de horas de estudio (aproximado).
     
+    Interpreta duraciones como "2 horas", "1h 30min" o "45 minutos" con
+    utils/facets.py, una vez por texto distinto. No usa el almacén columnar
+    para que la barra lateral del formulario y del historial no cargue
+    pyarrow.
+    
+    Args:
+        sessions: Sesiones ya cargadas; si se omite se cargan de Supabase
+        
     Returns:
         str: Total de horas formateado
     """
-    sessions = load_sessions()
-    total_minutes = 0
-    
-    for session in sessions:
-        duration = session.get('duration', '0 minutos')
-        
-        # Extraer números de la duración
-        try:
-            # Buscar patrones como "2 horas", "45 minutos", etc.
-            if 'hora' in duration.lower() or 'hour' in duration.lower():
-                import re
-                numbers = re.findall(r'\d+', duration)
-                if numbers:
-                    total_minutes += int(numbers[0]) * 60
-            elif 'minuto' in duration.lower() or 'minute' in duration.lower():
-                import re
-                numbers = re.findall(r'\d+', duration)
-                if numbers:
-                    total_minutes += int(numbers[0])
-        except:
-            pass
+    if sessions is None:
+        sessions = load_sessions()
+    durations = Counter(session.get('duration') for session in sessions)
+    total_minutes = sum((duration_minutes(text) or 0) * count for text, count in durations.items())
     
     hours = total_minutes // 60
     minutes = total_minutes % 60
@@ -0,0 +1,180 @@
+import unicodedata
+from enum import IntEnum
+from typing import Any, Dict, List, Mapping, Type
+
+"""
+Valores canónicos de categoría, dificultad y concentración.
+
+Cada valor es un IntEnum con tres datos:
+- un código entero pequeño (desde 1; el 0 queda para "sin dato"), que es lo
+  que guardan Session y la tabla columnar y sobre lo que se cuenta con
+  np.bincount;
+- key, el texto que se guarda en la columna de la base (la migración
+  normalize_enums deja todas las filas así);
+- label, la etiqueta en español que se muestra en la interfaz.
+
+parse() acepta la clave, la etiqueta, el código o alias en inglés/español
+(sin distinguir mayúsculas ni tildes), así que los datos antiguos e
+importados se leen igual.
+"""
+
+
+class CodedEnum(IntEnum):
+    """Valor enumerado con código entero, clave guardada y etiqueta."""
+
+    def __new__(cls, code: int, key: str, label: str):
+        member = int.__new__(cls, code)
+        member._value_ = code
+        member.key = key
+        member.label = label
+        return member
+
+    # Al formatearse (f-strings, PostgREST) se comporta como su clave
+    def __str__(self) -> str:
+        return self.key
+
+    def __format__(self, spec: str) -> str:
+        return format(self.key, spec)
+
+    @classmethod
+    def parse(cls, value: Any) -> Any:
+        """
+        Convertir un valor guardado o importado en un miembro.
+
+        Args:
+            value: Miembro, clave, etiqueta, alias o código
+
+        Returns:
+            El miembro; None si falta; el valor tal cual si no se reconoce
+            o es un miembro de otro enumerado
+        """
+        if value is None or value == "":
+            return None
+        # Los IntEnum se comparan por código (Category.PHYSICS ==
+        # Difficulty.MEDIUM): un miembro ajeno no debe buscarse en la tabla
+        if isinstance(value, CodedEnum) and not isinstance(value, cls):
+            return value
+        lookup = _LOOKUP[cls]
+        try:
+            return lookup[value]
+        except (KeyError, TypeError):
+            pass
+        member = lookup.get(_normalize(value))
+        return member if member is not None else value
+
+    @classmethod
+    def keys(cls) -> List[str]:
+        """Claves en orden de código (las opciones del formulario)."""
+        return [member.key for member in cls]
+
+
+class Category(CodedEnum):
+    DATA_ANALYSIS = (1, "Data Analysis", "Análisis de datos")
+    PHYSICS = (2, "Physics", "Física")
+    STATISTICS = (3, "Statistics", "Estadística")
+    SQL = (4, "SQL", "SQL")
+    VISUALIZATION = (5, "Visualization", "Visualización")
+    MIXED = (6, "Mixed", "Mixto")
+
+
+class Difficulty(CodedEnum):
+    EASY = (1, "Easy", "Fácil")
+    MEDIUM = (2, "Medium", "Medio")
+    HARD = (3, "Hard", "Difícil")
+    VERY_HARD = (4, "Very Hard", "Muy difícil")
+
+
+class FocusLevel(CodedEnum):
+    VERY_LOW = (1, "Muy bajo", "Muy bajo")
+    LOW = (2, "Bajo", "Bajo")
+    MEDIUM = (3, "Medio", "Medio")
+    HIGH = (4, "Alto", "Alto")
+    EXCELLENT = (5, "Excelente", "Excelente")
+
+
+# Valores por defecto del formulario y del importador
+DEFAULT_CATEGORY = Category.MIXED
+DEFAULT_DIFFICULTY = Difficulty.MEDIUM
+DEFAULT_FOCUS = FocusLevel.MEDIUM
+
+# Columna de la sesión -> enumeración
+FIELD_ENUMS: Mapping[str, Type[CodedEnum]] = {
+    "category": Category,
+    "difficulty": Difficulty,
+    "focus_level": FocusLevel,
+}
+
+# Columna -> valor para lo que no se reconoce (importador y restauración)
+FIELD_DEFAULTS: Mapping[str, CodedEnum] = {
+    "category": DEFAULT_CATEGORY,
+    "difficulty": DEFAULT_DIFFICULTY,
+    "focus_level": DEFAULT_FOCUS,
+}
+
+# Otras formas de escribir cada valor, además de clave y etiqueta
+_EXTRA_ALIASES = {
+    Category: {
+        "data analytics": Category.DATA_ANALYSIS, "analisis": Category.DATA_ANALYSIS,
+        "fisica": Category.PHYSICS, "estadistica": Category.STATISTICS,
+        "visualizacion": Category.VISUALIZATION, "mixto": Category.MIXED, "mixta": Category.MIXED,
+    },
+    Difficulty: {
+        "muy facil": Difficulty.EASY, "very easy": Difficulty.EASY, "facil": Difficulty.EASY,
+        "media": Difficulty.MEDIUM, "intermedio": Difficulty.MEDIUM,
+        "dificil": Difficulty.HARD, "muy dificil": Difficulty.VERY_HARD,
+    },
+    FocusLevel: {
+        "very low": FocusLevel.VERY_LOW, "low": FocusLevel.LOW, "medium": FocusLevel.MEDIUM,
+        "media": FocusLevel.MEDIUM, "high": FocusLevel.HIGH, "alta": FocusLevel.HIGH,
+        "excellent": FocusLevel.EXCELLENT, "muy alto": FocusLevel.EXCELLENT,
+    },
+}
+
+
+def _normalize(value: Any) -> str:
+    """Texto en minúsculas, sin tildes ni espacios extra ("1.0" -> "1")."""
+    text = unicodedata.normalize("NFKD", str(value).strip().lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = " ".join(text.split())
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _build_lookup(enum: Type[CodedEnum]) -> Dict[Any, CodedEnum]:
+    # Claves exactas y códigos primero: es el camino rápido de parse()
+    lookup: Dict[Any, CodedEnum] = {}
+    for member in enum:
+        lookup[member.key] = member
+        lookup[int(member)] = member
+        lookup[str(int(member))] = member
+        lookup[_normalize(member.key)] = member
+        lookup[_normalize(member.label)] = member
+    for alias, member in _EXTRA_ALIASES[enum].items():
+        lookup[_normalize(alias)] = member
+    return lookup
+
+
+_LOOKUP = {enum: _build_lookup(enum) for enum in FIELD_ENUMS.values()}
+
+
+def label(value: Any, default: str = "N/A") -> str:
+    """
+    Etiqueta para mostrar de un valor enumerado.
+
+    Args:
+        value: Miembro, o texto sin reconocer que se muestra tal cual
+        default: Texto si falta
+
+    Returns:
+        str: Etiqueta en español
+    """
+    if isinstance(value, CodedEnum):
+        return value.label
+    if value is None or value == "":
+        return default
+    return str(value)
+
+
+def field_label(field: str, value: Any, default: str = "N/A") -> str:
+    """Etiqueta de un valor guardado en una columna (clave o texto antiguo)."""
+    enum = FIELD_ENUMS.get(field)
+    return label(enum.parse(value) if enum else value, default)
@@ -0,0 +1,255 @@
+import atexit
+import csv
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from typing import Iterable, Iterator, List, Mapping
+
+from utils import content_generator
+
+"""
+Exportación del historial completo en CSV, JSON-lines, Parquet o un zip de
+artículos Markdown.
+
+Cada formato es un generador que recibe sesiones una a una y produce el
+archivo en trozos de bytes: nunca se construye el archivo entero en memoria,
+así que se puede escribir a disco o enviar mientras se lee de Supabase
+(ver data_manager.iter_sessions). El CSV y el JSON-lines se pueden volver a
+cargar con utils/importer.py.
+"""
+
+FORMATS = ("csv", "jsonl", "parquet", "markdown")
+
+FILE_EXTENSIONS = {"csv": "csv", "jsonl": "jsonl", "parquet": "parquet", "markdown": "zip"}
+MIME_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "markdown": "application/zip",
+}
+
+# Mismas columnas que acepta la importación
+EXPORT_COLUMNS = [
+    "id", "day", "date", "category", "topic", "duration", "daily_win",
+    "key_learnings", "resources", "obstacles", "next_steps", "practical_application",
+    "difficulty", "focus_level", "created_at", "updated_at",
+]
+
+# Sesiones por trozo emitido (CSV, JSON-lines) o por row group (Parquet)
+ROWS_PER_CHUNK = 500
+
+# Las exportaciones preparadas van a una carpeta temporal por proceso, que
+# se borra al salir. Lo que deja un proceso que no terminó limpio (o una
+# sesión abandonada) se borra pasado STALE_EXPORT_SECONDS.
+EXPORT_PREFIX = "study_sessions_"
+STALE_EXPORT_SECONDS = 24 * 3600
+
+_export_dir = None
+_export_dir_lock = threading.Lock()
+
+
+class _Drain:
+    """
+    Archivo de solo escritura que acumula bytes hasta que se vacía.
+
+    Permite usar escritores que esperan un archivo (zipfile, pyarrow) desde
+    un generador: tras cada escritura se recoge lo acumulado con take().
+    No admite seek, así que zipfile escribe en modo streaming.
+    """
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._buffer.write(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self) -> bytes:
+        data = self._buffer.getvalue()
+        self._buffer = io.BytesIO()
+        return data
+
+
+def _chunked(sessions: Iterable[Mapping], size: int = ROWS_PER_CHUNK) -> Iterator[List[Mapping]]:
+    chunk = []
+    for session in sessions:
+        chunk.append(session)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_csv(sessions: Iterable[Mapping]) -> Iterator[bytes]:
+    """Exportar a CSV (UTF-8 con BOM para que Excel respete los acentos)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+
+    for chunk in _chunked(sessions):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_jsonl(sessions: Iterable[Mapping]) -> Iterator[bytes]:
+    """Exportar a JSON-lines: una sesión por línea."""
+    for chunk in _chunked(sessions):
+        lines = (json.dumps({c: s.get(c) for c in EXPORT_COLUMNS}, ensure_ascii=False, default=str)
+                 for s in chunk)
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def iter_parquet(sessions: Iterable[Mapping]) -> Iterator[bytes]:
+    """Exportar a Parquet, un row group por trozo de sesiones."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (c, pa.int64() if c == "day" else pa.string()) for c in EXPORT_COLUMNS
+    ])
+    sink = _Drain()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for chunk in _chunked(sessions):
+            columns = {
+                c: [s.get(c) if c == "day" or s.get(c) is None else str(s.get(c)) for s in chunk]
+                for c in EXPORT_COLUMNS
+            }
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            yield sink.take()
+    yield sink.take()
+
+
+def _markdown_name(session: Mapping) -> str:
+    """Nombre de archivo legible y único para el artículo de una sesión."""
+    slug = re.sub(r"[^\w]+", "_", str(session.get('topic', '')).lower()).strip("_")[:50]
+    return f"day_{int(session.get('day') or 0):03d}_{session.get('date', '')}_{slug or session.get('id')}.md"
+
+
+def iter_markdown_zip(sessions: Iterable[Mapping]) -> Iterator[bytes]:
+    """Exportar un zip con un artículo Markdown por sesión."""
+    sink = _Drain()
+    names = set()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for session in sessions:
+            name = _markdown_name(session)
+            if name in names:
+                name = name[:-3] + f"_{session.get('id')}.md"
+            names.add(name)
+            archive.writestr(name, content_generator.generate_medium_article(session))
+            yield sink.take()
+    yield sink.take()
+
+
+_WRITERS = {
+    "csv": iter_csv,
+    "jsonl": iter_jsonl,
+    "parquet": iter_parquet,
+    "markdown": iter_markdown_zip,
+}
+
+
+def export_sessions(sessions: Iterable[Mapping], fmt: str) -> Iterator[bytes]:
+    """
+    Exportar sesiones en el formato pedido.
+
+    Args:
+        sessions: Sesiones, por ejemplo data_manager.iter_sessions()
+        fmt: "csv", "jsonl", "parquet" o "markdown"
+
+    Returns:
+        Iterator[bytes]: Trozos del archivo, listos para escribir o enviar
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Formato no soportado: {fmt}")
+    for data in _WRITERS[fmt](sessions):
+        if data:
+            yield data
+
+
+def _sweep_stale_exports(directory: str) -> None:
+    """Borrar las exportaciones de directory más antiguas que STALE_EXPORT_SECONDS."""
+    cutoff = time.time() - STALE_EXPORT_SECONDS
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.startswith(EXPORT_PREFIX):
+            continue
+        try:
+            if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _get_export_dir() -> str:
+    """Carpeta temporal de este proceso; la primera vez limpia las antiguas."""
+    global _export_dir
+    with _export_dir_lock:
+        if _export_dir is None:
+            _sweep_stale_exports(tempfile.gettempdir())
+            _export_dir = tempfile.mkdtemp(prefix=f"{EXPORT_PREFIX}export_")
+            atexit.register(shutil.rmtree, _export_dir, True)
+        else:
+            _sweep_stale_exports(_export_dir)
+            os.makedirs(_export_dir, exist_ok=True)
+        return _export_dir
+
+
+def export_to_file(sessions: Iterable[Mapping], fmt: str) -> str:
+    """
+    Escribir la exportación en un archivo temporal, trozo a trozo.
+
+    El archivo queda en la carpeta temporal del proceso: se borra al salir
+    o, si nadie lo borra antes, pasado STALE_EXPORT_SECONDS.
+
+    Args:
+        sessions: Sesiones, por ejemplo data_manager.iter_sessions()
+        fmt: "csv", "jsonl", "parquet" o "markdown"
+
+    Returns:
+        str: Ruta del archivo; quien lo pide puede borrarlo antes
+    """
+    fd, path = tempfile.mkstemp(prefix=EXPORT_PREFIX, suffix=f".{FILE_EXTENSIONS[fmt]}",
+                                dir=_get_export_dir())
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for data in export_sessions(sessions, fmt):
+                f.write(data)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+def export_filename(fmt: str, stem: str = "study_sessions") -> str:
+    """Nombre de archivo sugerido para un formato."""
+    return f"{stem}.{FILE_EXTENSIONS[fmt]}"
+
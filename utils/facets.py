@@ -0,0 +1,223 @@
+import bisect
+import re
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+"""
+Filtros por facetas del historial: rango de fechas, categoría, dificultad,
+concentración y duración.
+
+Para cada instantánea de sesiones se construye una sola vez un FacetIndex
+con un código entero por sesión y faceta, un mapa de bits (array booleano
+de NumPy) por cada valor y las fechas ordenadas para buscar rangos con
+bisect. Filtrar es combinar mapas con AND/OR vectorizados, y los conteos de
+cada valor son un np.bincount de los códigos de las sesiones filtradas, sin
+recorrer las sesiones.
+
+Los valores de categoría, dificultad y concentración son las claves
+guardadas (utils/enums.py); la vista muestra su etiqueta.
+"""
+
+# Facetas de valor y campo de la sesión del que salen
+FACET_FIELDS = {
+    "category": "category",
+    "difficulty": "difficulty",
+    "focus_level": "focus_level",
+    "duration_band": "duration",
+}
+
+MISSING_VALUE = "Sin dato"
+
+# Franjas de duración: (etiqueta, minutos desde, minutos hasta sin incluir)
+DURATION_BANDS = [
+    ("< 30 min", 0, 30),
+    ("30-60 min", 30, 60),
+    ("1-2 h", 60, 120),
+    ("2-3 h", 120, 180),
+    ("3 h o más", 180, None),
+]
+
+_HOURS_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*h")
+_MINUTES_RE = re.compile(r"(\d+)\s*m")
+
+
+def duration_minutes(text) -> Optional[int]:
+    """
+    Interpretar una duración como "1h 30min", "1.5 horas", "45 minutos" o "90".
+
+    Returns:
+        Optional[int]: Minutos, o None si no se entiende
+    """
+    if not text:
+        return None
+    lower = str(text).lower()
+    hours = _HOURS_RE.search(lower)
+    minutes = _MINUTES_RE.search(lower)
+    if hours or minutes:
+        total = 0.0
+        if hours:
+            total += float(hours.group(1).replace(",", ".")) * 60
+        if minutes:
+            total += int(minutes.group(1))
+        return round(total)
+    try:
+        return round(float(lower.replace(",", ".")))
+    except ValueError:
+        return None
+
+
+def duration_band(text) -> str:
+    """Franja de DURATION_BANDS a la que pertenece una duración."""
+    minutes = duration_minutes(text)
+    if minutes is None:
+        return MISSING_VALUE
+    for label, low, high in DURATION_BANDS:
+        if minutes >= low and (high is None or minutes < high):
+            return label
+    return MISSING_VALUE
+
+
+def _facet_value(session: Mapping, facet: str) -> str:
+    value = session.get(FACET_FIELDS[facet])
+    if facet == "duration_band":
+        return duration_band(value)
+    if value is None or value == "":
+        return MISSING_VALUE
+    return str(value)
+
+
+class FacetIndex:
+    """Mapas de bits por valor de faceta y fechas ordenadas de una instantánea."""
+
+    def __init__(self, sessions: Sequence[Mapping]):
+        self.sessions = sessions
+        self.size = len(sessions)
+
+        # faceta -> código por sesión, valores en orden de código y
+        # {valor: array booleano con True en las sesiones que lo tienen}
+        self.codes: Dict[str, np.ndarray] = {}
+        self.labels: Dict[str, List[str]] = {}
+        self.bitmaps: Dict[str, Dict[str, np.ndarray]] = {}
+        for facet in FACET_FIELDS:
+            codes: Dict[str, int] = {}
+            column = np.fromiter(
+                (codes.setdefault(_facet_value(s, facet), len(codes)) for s in sessions),
+                dtype=np.int32,
+                count=self.size
+            )
+            self.codes[facet] = column
+            self.labels[facet] = list(codes)
+            self.bitmaps[facet] = {value: column == code for value, code in codes.items()}
+
+        # Posiciones ordenadas por fecha y fechas en ese orden, para bisect
+        dates = [str(s.get('date') or "") for s in sessions]
+        self._date_order = np.array(sorted(range(self.size), key=dates.__getitem__), dtype=np.int64)
+        self._sorted_dates = [dates[i] for i in self._date_order]
+
+        days = np.fromiter((int(s.get('day') or 0) for s in sessions), dtype=np.int64, count=self.size)
+        self.milestones = (days > 0) & (days % 10 == 0)
+
+    def values(self, facet: str) -> List[str]:
+        """Valores de una faceta, del más frecuente al menos."""
+        bitmaps = self.bitmaps[facet]
+        return sorted(bitmaps, key=lambda v: (-int(bitmaps[v].sum()), v))
+
+    def date_bounds(self) -> Tuple[Optional[str], Optional[str]]:
+        """Primera y última fecha (YYYY-MM-DD), sin contar sesiones sin fecha."""
+        first = bisect.bisect_right(self._sorted_dates, "")
+        if first >= self.size:
+            return None, None
+        return self._sorted_dates[first][:10], self._sorted_dates[-1][:10]
+
+    def all(self) -> np.ndarray:
+        return np.ones(self.size, dtype=bool)
+
+    def date_mask(self, start: Optional[str] = None, end: Optional[str] = None) -> np.ndarray:
+        """
+        Sesiones con fecha dentro de [start, end] (ambos incluidos).
+
+        Args:
+            start: Fecha inicial YYYY-MM-DD; None para no limitar
+            end: Fecha final YYYY-MM-DD; None para no limitar
+        """
+        if start is None and end is None:
+            return self.all()
+        low = bisect.bisect_left(self._sorted_dates, start) if start else 0
+        # "\uffff" deja dentro las fechas con hora del mismo día
+        high = bisect.bisect_right(self._sorted_dates, end + "\uffff") if end else self.size
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self._date_order[low:high]] = True
+        return mask
+
+    def value_mask(self, facet: str, selected: Iterable[str]) -> np.ndarray:
+        """Sesiones con cualquiera de los valores elegidos; todas si no hay ninguno."""
+        selected = list(selected)
+        if not selected:
+            return self.all()
+        mask = np.zeros(self.size, dtype=bool)
+        for value in selected:
+            bitmap = self.bitmaps[facet].get(value)
+            if bitmap is not None:
+                mask |= bitmap
+        return mask
+
+    def filter(self, selection: Mapping[str, Iterable[str]], base: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Combinar filtros: OR entre valores de una faceta, AND entre facetas.
+
+        Args:
+            selection: faceta -> valores elegidos
+            base: Máscara previa (rango de fechas, período...)
+
+        Returns:
+            np.ndarray: Máscara booleana sobre la instantánea
+        """
+        mask = self.all() if base is None else base.copy()
+        for facet, selected in selection.items():
+            mask &= self.value_mask(facet, selected)
+        return mask
+
+    def counts(self, selection: Mapping[str, Iterable[str]],
+               base: Optional[np.ndarray] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Cuántas sesiones quedarían al elegir cada valor.
+
+        El conteo de una faceta aplica todos los demás filtros menos el suyo,
+        así los valores de la misma faceta siguen mostrando cuántas sesiones
+        añadirían.
+
+        Returns:
+            Dict[str, Dict[str, int]]: faceta -> {valor: sesiones}
+        """
+        result = {}
+        for facet, labels in self.labels.items():
+            others = {f: v for f, v in selection.items() if f != facet}
+            mask = self.filter(others, base)
+            counts = np.bincount(self.codes[facet][mask], minlength=len(labels))
+            result[facet] = {value: int(count) for value, count in zip(labels, counts)}
+        return result
+
+    def select(self, mask: np.ndarray) -> List[Mapping]:
+        """Sesiones de la máscara, en el orden de la instantánea."""
+        sessions = self.sessions
+        return [sessions[i] for i in np.flatnonzero(mask)]
+
+
+_lock = threading.Lock()
+_current: Optional[FacetIndex] = None
+
+
+def get_facets(sessions: Sequence[Mapping]) -> FacetIndex:
+    """
+    Índice de facetas de una instantánea.
+
+    load_sessions() devuelve la misma instantánea mientras no cambie la
+    versión de los datos, así que el índice se construye una vez por versión.
+    """
+    global _current
+    with _lock:
+        if _current is None or _current.sessions is not sessions:
+            _current = FacetIndex(sessions)
+        return _current
@@ -0,0 +1,225 @@
+import os
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from utils import data_manager
+from utils.enums import FIELD_DEFAULTS, CodedEnum
+
+"""
+Importación masiva de sesiones desde CSV, JSON-lines o Parquet.
+
+El archivo se lee por bloques y cada bloque se valida y normaliza con
+operaciones vectorizadas de pandas (fechas, duración, categoría, dificultad
+y foco). Cada bloque válido se envía a Supabase en un único upsert, y los
+días se renumeran una sola vez al final.
+"""
+
+FORMATS = ("csv", "jsonl", "parquet")
+
+# Filas por bloque leído y por upsert
+DEFAULT_CHUNK_SIZE = 1000
+
+# Motivos de rechazo que se guardan para mostrar al usuario
+MAX_REPORTED_ERRORS = 20
+
+# Mismas opciones que el formulario de sesión (ver utils/enums.py)
+ENUM_DEFAULTS = FIELD_DEFAULTS
+
+REQUIRED_TEXT = ["topic", "duration", "daily_win"]
+OPTIONAL_TEXT = ["key_learnings", "resources", "obstacles", "next_steps", "practical_application"]
+OUTPUT_COLUMNS = (["id", "day", "date", "category"] + REQUIRED_TEXT + OPTIONAL_TEXT
+                  + ["difficulty", "focus_level", "created_at"])
+
+
+def detect_format(name: str) -> Optional[str]:
+    """
+    Deducir el formato por la extensión del archivo.
+
+    Returns:
+        Optional[str]: "csv", "jsonl", "parquet" o None si no se reconoce
+    """
+    ext = os.path.splitext(name.lower())[1]
+    return {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl",
+            ".parquet": "parquet", ".pq": "parquet"}.get(ext)
+
+
+def read_chunks(source: Union[str, IO], fmt: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Leer el archivo por bloques sin cargarlo entero en memoria.
+
+    Args:
+        source: Ruta o archivo abierto en binario (ej. st.file_uploader)
+        fmt: "csv", "jsonl" o "parquet"
+        chunk_size: Filas por bloque
+
+    Returns:
+        Iterator[pd.DataFrame]: Bloques con todas las columnas como texto
+    """
+    if fmt == "csv":
+        yield from pd.read_csv(source, chunksize=chunk_size, dtype=str, keep_default_na=False)
+    elif fmt == "jsonl":
+        # Sin convert_dates, date y created_at llegan como el texto original
+        for chunk in pd.read_json(source, lines=True, chunksize=chunk_size, dtype=False,
+                                  convert_dates=False):
+            yield chunk.astype("string")
+    elif fmt == "parquet":
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas().astype("string")
+    else:
+        raise ValueError(f"Formato no soportado: {fmt}")
+
+
+def _text(df: pd.DataFrame, column: str) -> pd.Series:
+    """Columna como texto sin espacios sobrantes; vacía si no existe."""
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype="string")
+    return df[column].astype("string").fillna("").str.strip()
+
+
+def _normalize_duration(text: pd.Series) -> pd.Series:
+    """
+    Pasar duraciones como "1h 30min", "1.5 horas" o "90" a "90 minutes".
+
+    Un número sin unidad se toma como minutos. Los textos que no se
+    entienden se conservan tal cual.
+    """
+    lower = text.str.lower()
+    hours = pd.to_numeric(lower.str.extract(r"(\d+(?:[.,]\d+)?)\s*h", expand=False)
+                          .str.replace(",", ".", regex=False), errors="coerce")
+    minutes = pd.to_numeric(lower.str.extract(r"(\d+)\s*m", expand=False), errors="coerce")
+    plain = pd.to_numeric(lower, errors="coerce")
+
+    total = (hours.fillna(0) * 60 + minutes.fillna(0)).where(hours.notna() | minutes.notna(), plain)
+    total = total.round().astype("Int64")
+    parsed = (total > 0).fillna(False).astype(bool)
+    whole_hours = parsed & (total % 60 == 0).fillna(False).astype(bool)
+
+    rendered = text.mask(parsed, total.astype("string") + " minutes")
+    rendered = rendered.mask(whole_hours, (total // 60).astype("string") + " hours")
+    return rendered.mask(whole_hours & (total == 60).fillna(False).astype(bool), "1 hour")
+
+
+def _normalize_enum(text: pd.Series, default: CodedEnum) -> Tuple[pd.Series, int]:
+    """
+    Traducir variantes (idioma, mayúsculas, números) a la clave canónica.
+
+    Cada valor distinto se interpreta una sola vez con parse().
+
+    Args:
+        text: Columna como texto
+        default: Valor para lo que falta o no se reconoce
+
+    Returns:
+        Tuple[pd.Series, int]: Claves normalizadas y cuántos tomaron el valor por defecto
+    """
+    keys = {}
+    for value in text.unique():
+        member = default.parse(value)
+        keys[value] = member.key if isinstance(member, type(default)) else None
+    mapped = text.map(keys)
+    return mapped.fillna(default.key).astype("string"), int(mapped.isna().sum())
+
+
+def normalize_chunk(df: pd.DataFrame) -> Tuple[List[Dict], List[str], int]:
+    """
+    Validar y normalizar un bloque de sesiones.
+
+    Args:
+        df: Bloque leído con read_chunks
+
+    Returns:
+        Tuple[List[Dict], List[str], int]: Filas válidas listas para upsert,
+            motivos de rechazo y número de valores que tomaron un valor por defecto
+    """
+    out = pd.DataFrame(index=df.index)
+
+    dates = pd.to_datetime(_text(df, "date"), errors="coerce", format="mixed")
+    out["date"] = dates.dt.strftime("%Y-%m-%d")
+
+    for column in REQUIRED_TEXT + OPTIONAL_TEXT:
+        out[column] = _text(df, column)
+    out["duration"] = _normalize_duration(out["duration"])
+
+    defaulted = 0
+    for column, default in ENUM_DEFAULTS.items():
+        out[column], d = _normalize_enum(_text(df, column), default)
+        defaulted += d
+
+    # Validación: fecha legible y campos obligatorios del formulario
+    problems = pd.Series("", index=df.index, dtype="string")
+    problems = problems.mask(dates.isna(), "fecha inválida")
+    for column in REQUIRED_TEXT:
+        problems = problems.mask((problems == "") & (out[column] == ""), f"falta {column}")
+    valid = problems == ""
+
+    # ID estable para que reimportar el mismo archivo no duplique sesiones
+    ids = _text(df, "id")
+    hashed = pd.util.hash_pandas_object(out[["date", "topic"]], index=False)
+    generated = "import_" + pd.Series(hashed.map("{:016x}".format), index=df.index, dtype="string")
+    out["id"] = ids.where(ids != "", generated)
+
+    # Un upsert no puede escribir dos veces la misma fila (PostgREST rechaza
+    # el bloque entero): de cada id repetido queda la última fila
+    repeated = valid & out["id"].where(valid).duplicated(keep="last")
+    problems = problems.mask(repeated, "id repetido en el bloque, se usa la última fila")
+    valid = valid & ~repeated
+
+    created_at = _text(df, "created_at")
+    out["created_at"] = created_at.where(created_at != "", out["date"] + "T00:00:00")
+    # Provisional: recalculate_days() asigna el número definitivo al final
+    out["day"] = 0
+
+    rows = out.loc[valid, OUTPUT_COLUMNS].astype(object).to_dict("records")
+
+    errors = [f"Fila {index + 1}: {reason}" for index, reason in problems[~valid].items()]
+    return rows, errors, defaulted
+
+
+def import_sessions(source: Union[str, IO], fmt: Optional[str] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    progress: Optional[Callable[[int], None]] = None) -> Dict:
+    """
+    Importar sesiones desde un archivo.
+
+    Args:
+        source: Ruta o archivo abierto en binario
+        fmt: Formato; por defecto se deduce del nombre
+        chunk_size: Filas por bloque y por upsert
+        progress: Función llamada con el total de filas leídas tras cada bloque
+
+    Returns:
+        Dict: imported, rejected, defaulted, failed_batches y errors (primeros motivos)
+    """
+    if fmt is None:
+        fmt = detect_format(source if isinstance(source, str) else getattr(source, "name", ""))
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato no reconocido; usa uno de: {', '.join(FORMATS)}")
+
+    result = {'imported': 0, 'rejected': 0, 'defaulted': 0, 'failed_batches': 0, 'errors': []}
+    read = 0
+
+    for chunk in read_chunks(source, fmt, chunk_size):
+        # Numerar filas desde el inicio del archivo en los mensajes
+        chunk.index = pd.RangeIndex(read, read + len(chunk))
+        read += len(chunk)
+
+        rows, errors, defaulted = normalize_chunk(chunk)
+        result['rejected'] += len(errors)
+        result['defaulted'] += defaulted
+        result['errors'].extend(errors[:MAX_REPORTED_ERRORS - len(result['errors'])])
+
+        if data_manager.upsert_sessions_batch(rows):
+            result['imported'] += len(rows)
+        else:
+            result['failed_batches'] += 1
+
+        if progress:
+            progress(read)
+
+    if result['imported']:
+        data_manager.recalculate_days()
+        data_manager.invalidate_sessions_cache()
+
+    return result
@@ -0,0 +1,325 @@
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from utils import migrations
+from utils.models import FIELDS
+
+"""
+Backend local que imita el subconjunto del cliente de supabase-py que usa la
+app, sobre SQLite. Sirve para pruebas de carga y desarrollo sin conexión.
+
+Se activa con la variable de entorno STUDY_TRACKER_BACKEND:
+
+- memory: base de datos en memoria compartida por todo el proceso
+- sqlite:///ruta/archivo.db: base de datos en un archivo
+
+Soporta table().select/insert/upsert/update/delete con eq, in_, gte, lte,
+order y limit, count="exact" y las RPC registradas en RPC_FUNCTIONS. Como
+en Supabase, update y delete sin filtros fallan en lugar de tocar toda la
+tabla.
+"""
+
+TABLE = "study_sessions"
+
+
+class LocalBackendError(Exception):
+    """Error con la misma forma que postgrest.APIError (code y message)."""
+
+    def __init__(self, message: str, code: str = "PGRST000"):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+
+class LocalResponse:
+    """Respuesta con los atributos data y count de supabase-py."""
+
+    def __init__(self, data: List[Dict], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class LocalDatabase:
+    """Conexión SQLite compartida entre hilos, protegida por un lock."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        # Mismo esquema e índices que en Postgres (migrations/sqlite)
+        migrations.migrate(self.conn, "sqlite")
+        # Las columnas de la sesión salen de utils/models.py; las migraciones
+        # deben crearlas todas
+        existing = {row["name"] for row in self.conn.execute(f"PRAGMA table_info({TABLE})")}
+        missing = [field for field in FIELDS if field not in existing]
+        if missing:
+            raise LocalBackendError(f"Faltan columnas en {TABLE}: {', '.join(missing)}", "42703")
+        self.columns = {TABLE: list(FIELDS)}
+        self._last_stamp = datetime.min.replace(tzinfo=timezone.utc)
+
+    def stamp(self) -> str:
+        """updated_at estrictamente creciente, como el trigger de Postgres."""
+        stamp = max(datetime.now(timezone.utc), self._last_stamp + timedelta(microseconds=1))
+        self._last_stamp = stamp
+        return stamp.isoformat()
+
+    def check_columns(self, table: str, columns: Sequence[str]) -> None:
+        known = self.columns.get(table)
+        if known is None:
+            raise LocalBackendError(f"relation \"{table}\" does not exist", "42P01")
+        for column in columns:
+            if column not in known:
+                raise LocalBackendError(f"Could not find the '{column}' column of '{table}'", "PGRST204")
+
+
+class _Query:
+    """Constructor de consultas encadenable, como el de postgrest-py."""
+
+    def __init__(self, db: LocalDatabase, table: str):
+        self._db = db
+        self._table = table
+        self._op = "select"
+        self._columns: List[str] = ["*"]
+        self._count: Optional[str] = None
+        self._filters: List[tuple] = []
+        self._order: List[str] = []
+        self._limit: Optional[int] = None
+        self._payload: Any = None
+
+    # Operaciones
+    def select(self, columns: str = "*", count: Optional[str] = None) -> "_Query":
+        self._op = "select"
+        self._columns = [c.strip() for c in columns.split(",")]
+        self._count = count
+        return self
+
+    def insert(self, payload: Union[Dict, List[Dict]], **kwargs) -> "_Query":
+        self._op = "insert"
+        self._payload = payload
+        return self
+
+    def upsert(self, payload: Union[Dict, List[Dict]], **kwargs) -> "_Query":
+        self._op = "upsert"
+        self._payload = payload
+        return self
+
+    def update(self, values: Dict) -> "_Query":
+        self._op = "update"
+        self._payload = values
+        return self
+
+    def delete(self) -> "_Query":
+        self._op = "delete"
+        return self
+
+    # Filtros
+    def _filter(self, column: str, sql_op: str, value: Any) -> "_Query":
+        self._filters.append((column, sql_op, value))
+        return self
+
+    def eq(self, column: str, value: Any) -> "_Query":
+        return self._filter(column, "=", value)
+
+    def neq(self, column: str, value: Any) -> "_Query":
+        return self._filter(column, "!=", value)
+
+    def gt(self, column: str, value: Any) -> "_Query":
+        return self._filter(column, ">", value)
+
+    def gte(self, column: str, value: Any) -> "_Query":
+        return self._filter(column, ">=", value)
+
+    def lt(self, column: str, value: Any) -> "_Query":
+        return self._filter(column, "<", value)
+
+    def lte(self, column: str, value: Any) -> "_Query":
+        return self._filter(column, "<=", value)
+
+    def in_(self, column: str, values: Sequence[Any]) -> "_Query":
+        return self._filter(column, "IN", list(values))
+
+    def order(self, column: str, desc: bool = False) -> "_Query":
+        self._db.check_columns(self._table, [column])
+        self._order.append(f'"{column}" {"DESC" if desc else "ASC"}')
+        return self
+
+    def limit(self, size: int) -> "_Query":
+        self._limit = size
+        return self
+
+    # Ejecución
+    def _where(self) -> tuple:
+        self._db.check_columns(self._table, [f[0] for f in self._filters])
+        clauses, params = [], []
+        for column, sql_op, value in self._filters:
+            if sql_op == "IN":
+                if not value:
+                    clauses.append("0")
+                    continue
+                clauses.append(f'"{column}" IN ({", ".join("?" for _ in value)})')
+                params.extend(value)
+            else:
+                clauses.append(f'"{column}" {sql_op} ?')
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _where_required(self, statement: str) -> tuple:
+        """Como _where(), pero sin filtros falla igual que Supabase (pg-safeupdate)."""
+        if not self._filters:
+            raise LocalBackendError(f"{statement} requires a WHERE clause", "21000")
+        return self._where()
+
+    def execute(self) -> LocalResponse:
+        with self._db.lock:
+            return getattr(self, f"_execute_{self._op}")()
+
+    def _execute_select(self) -> LocalResponse:
+        columns = self._db.columns[self._table] if self._columns == ["*"] else self._columns
+        self._db.check_columns(self._table, columns)
+        where, params = self._where()
+
+        sql = f'SELECT {", ".join(f"{chr(34)}{c}{chr(34)}" for c in columns)} FROM {self._table}{where}'
+        if self._order:
+            sql += " ORDER BY " + ", ".join(self._order)
+        if self._limit is not None:
+            sql += f" LIMIT {int(self._limit)}"
+        rows = [dict(r) for r in self._db.conn.execute(sql, params)]
+
+        count = None
+        if self._count:
+            count = self._db.conn.execute(f"SELECT COUNT(*) FROM {self._table}{where}", params).fetchone()[0]
+        return LocalResponse(rows, count)
+
+    def _rows(self) -> List[Dict]:
+        return self._payload if isinstance(self._payload, list) else [self._payload]
+
+    def _write_rows(self, on_conflict_update: bool) -> LocalResponse:
+        written = []
+        self._db.conn.execute("BEGIN")
+        try:
+            for row in self._rows():
+                row = {k: v for k, v in row.items() if k != "updated_at"}
+                row["updated_at"] = self._db.stamp()
+                self._db.check_columns(self._table, row.keys())
+                cols = list(row.keys())
+                sql = (f'INSERT INTO {self._table} ({", ".join(f"{chr(34)}{c}{chr(34)}" for c in cols)}) '
+                       f'VALUES ({", ".join("?" for _ in cols)})')
+                if on_conflict_update:
+                    updates = ", ".join(f'"{c}" = excluded."{c}"' for c in cols if c != "id")
+                    sql += f" ON CONFLICT(id) DO UPDATE SET {updates}"
+                try:
+                    self._db.conn.execute(sql, [row[c] for c in cols])
+                except sqlite3.IntegrityError as e:
+                    raise LocalBackendError(str(e), "23505")
+                written.append(row["id"])
+            self._db.conn.execute("COMMIT")
+        except BaseException:
+            self._db.conn.execute("ROLLBACK")
+            raise
+        return _Query(self._db, self._table).select("*").in_("id", written).execute()
+
+    def _execute_insert(self) -> LocalResponse:
+        return self._write_rows(on_conflict_update=False)
+
+    def _execute_upsert(self) -> LocalResponse:
+        return self._write_rows(on_conflict_update=True)
+
+    def _execute_update(self) -> LocalResponse:
+        values = {k: v for k, v in self._payload.items() if k != "updated_at"}
+        # Como el trigger de Postgres (0008): renumerar day no es un cambio
+        if set(values) - {"day"}:
+            values["updated_at"] = self._db.stamp()
+        self._db.check_columns(self._table, values.keys())
+        where, params = self._where_required("UPDATE")
+        ids = [r[0] for r in self._db.conn.execute(f"SELECT id FROM {self._table}{where}", params)]
+        sets = ", ".join(f'"{c}" = ?' for c in values)
+        self._db.conn.execute(f"UPDATE {self._table} SET {sets}{where}", list(values.values()) + params)
+        return _Query(self._db, self._table).select("*").in_("id", ids).execute()
+
+    def _execute_delete(self) -> LocalResponse:
+        where, params = self._where_required("DELETE")
+        columns = ", ".join(f'"{c}"' for c in self._db.columns[self._table])
+        rows = [dict(r) for r in self._db.conn.execute(f"SELECT {columns} FROM {self._table}{where}", params)]
+        self._db.conn.execute(f"DELETE FROM {self._table}{where}", params)
+        return LocalResponse(rows)
+
+
+def _rpc_study_sessions_version(db: LocalDatabase, params: Dict) -> List[Dict]:
+    row = db.conn.execute(f"SELECT COUNT(*), MAX(updated_at) FROM {TABLE}").fetchone()
+    return [{'row_count': row[0], 'max_updated_at': row[1]}]
+
+
+def _rpc_renumber_study_sessions(db: LocalDatabase, params: Dict) -> int:
+    rows = db.conn.execute(
+        f"SELECT id, day, ROW_NUMBER() OVER (ORDER BY date, created_at) AS new_day FROM {TABLE}"
+    ).fetchall()
+    changed = [(row["new_day"], row["id"]) for row in rows if row["day"] != row["new_day"]]
+    db.conn.executemany(f"UPDATE {TABLE} SET day = ? WHERE id = ?", changed)
+    return len(changed)
+
+
+# Funciones RPC disponibles, equivalentes a las de migrations/postgres
+RPC_FUNCTIONS: Dict[str, Callable[[LocalDatabase, Dict], Any]] = {
+    "study_sessions_version": _rpc_study_sessions_version,
+    "renumber_study_sessions": _rpc_renumber_study_sessions,
+}
+
+
+class _RpcCall:
+    def __init__(self, db: LocalDatabase, name: str, params: Optional[Dict]):
+        self._db = db
+        self._name = name
+        self._params = params or {}
+
+    def execute(self) -> LocalResponse:
+        fn = RPC_FUNCTIONS.get(self._name)
+        if fn is None:
+            raise LocalBackendError(f"Could not find the function public.{self._name}", "PGRST202")
+        with self._db.lock:
+            return LocalResponse(fn(self._db, self._params))
+
+
+class LocalClient:
+    """Cliente con la interfaz table()/rpc() de supabase-py."""
+
+    def __init__(self, db: LocalDatabase):
+        self.db = db
+
+    def table(self, name: str) -> _Query:
+        return _Query(self.db, name)
+
+    def rpc(self, name: str, params: Optional[Dict] = None) -> _RpcCall:
+        return _RpcCall(self.db, name, params)
+
+
+_databases: Dict[str, LocalDatabase] = {}
+_databases_lock = threading.Lock()
+
+
+def create_local_client(backend: str) -> LocalClient:
+    """
+    Crear un cliente local a partir del valor de STUDY_TRACKER_BACKEND.
+
+    Todas las llamadas con el mismo valor comparten la misma base de datos,
+    incluida la de memoria.
+
+    Args:
+        backend: "memory" o "sqlite:///ruta/archivo.db"
+
+    Returns:
+        LocalClient: Cliente compatible con la app
+    """
+    if backend == "memory":
+        path = ":memory:"
+    elif backend.startswith("sqlite:///"):
+        path = backend[len("sqlite:///"):]
+    else:
+        raise ValueError(f"Backend local no soportado: {backend}")
+
+    with _databases_lock:
+        if backend not in _databases:
+            _databases[backend] = LocalDatabase(path)
+        return LocalClient(_databases[backend])
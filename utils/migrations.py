@@ -0,0 +1,220 @@
+import hashlib
+import os
+import re
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+"""
+Migraciones versionadas del esquema de study_sessions.
+
+Los archivos SQL viven en migrations/<dialecto>/NNNN_nombre.sql: "postgres"
+para Supabase o un Postgres local, "sqlite" para el backend local. Cada
+migración se aplica en su propia transacción y queda registrada en la tabla
+schema_migrations con su versión y un checksum, así que volver a ejecutar el
+runner solo aplica las pendientes y avisa si un archivo ya aplicado cambió.
+
+Para Postgres hace falta psycopg (opcional, no está en requirements.txt):
+    pip install "psycopg[binary]"
+"""
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+DIALECTS = ("postgres", "sqlite")
+
+_FILE_RE = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    applied_at TEXT NOT NULL
+)
+"""
+
+# Consultas frecuentes de la app, para revisar su plan con explain()
+HOT_QUERIES = {
+    "load_sessions": "SELECT * FROM study_sessions ORDER BY date",
+    "recalculate_days": "SELECT id, day, date, created_at FROM study_sessions ORDER BY date, created_at",
+    "last_30": "SELECT * FROM study_sessions ORDER BY date DESC, created_at DESC LIMIT 30",
+    "category_range": ("SELECT * FROM study_sessions WHERE category = 'SQL' "
+                       "AND date >= '2025-01-01' AND date <= '2025-03-31' ORDER BY date"),
+    "data_version": "SELECT count(*), max(updated_at) FROM study_sessions",
+}
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    path: str
+    sql: str
+
+    @property
+    def checksum(self) -> str:
+        return hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+
+def discover(dialect: str, directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """
+    Leer las migraciones de un dialecto, ordenadas por versión.
+
+    Args:
+        dialect: "postgres" o "sqlite"
+        directory: Carpeta raíz de las migraciones
+
+    Returns:
+        List[Migration]: Migraciones encontradas
+    """
+    if dialect not in DIALECTS:
+        raise ValueError(f"Dialecto no soportado: {dialect}")
+
+    folder = os.path.join(directory, dialect)
+    migrations = []
+    for filename in sorted(os.listdir(folder)):
+        match = _FILE_RE.match(filename)
+        if not match:
+            continue
+        path = os.path.join(folder, filename)
+        with open(path, encoding="utf-8") as f:
+            migrations.append(Migration(int(match.group(1)), match.group(2), path, f.read()))
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Versiones repetidas en {folder}")
+    return sorted(migrations)
+
+
+def connect(target: str):
+    """
+    Abrir una conexión a partir de una URL.
+
+    Args:
+        target: "sqlite:///ruta.db", "sqlite:///:memory:" o una URL de Postgres
+            (postgresql://...), por ejemplo la de Supabase en
+            Project Settings → Database
+
+    Returns:
+        Tuple: (conexión, dialecto)
+    """
+    if target.startswith("sqlite:///"):
+        conn = sqlite3.connect(target[len("sqlite:///"):], isolation_level=None)
+        return conn, "sqlite"
+    if target.startswith(("postgres://", "postgresql://")):
+        try:
+            import psycopg
+        except ImportError:
+            raise RuntimeError('Para migrar Postgres instala psycopg: pip install "psycopg[binary]"')
+        return psycopg.connect(target, autocommit=True), "postgres"
+    raise ValueError(f"URL no soportada: {target}")
+
+
+def _param(dialect: str) -> str:
+    return "?" if dialect == "sqlite" else "%s"
+
+
+def applied_migrations(conn, dialect: str) -> Dict[int, Dict]:
+    """
+    Migraciones ya aplicadas en una base.
+
+    Returns:
+        Dict[int, Dict]: versión -> name, checksum y applied_at
+    """
+    conn.execute(_CREATE_TABLE)
+    rows = conn.execute(
+        "SELECT version, name, checksum, applied_at FROM schema_migrations ORDER BY version"
+    ).fetchall()
+    return {row[0]: {'name': row[1], 'checksum': row[2], 'applied_at': row[3]} for row in rows}
+
+
+def _apply(conn, dialect: str, migration: Migration) -> None:
+    """Ejecutar una migración y registrarla en la misma transacción."""
+    p = _param(dialect)
+    record = (f"INSERT INTO schema_migrations (version, name, checksum, applied_at) "
+              f"VALUES ({p}, {p}, {p}, {p})")
+    params = (migration.version, migration.name, migration.checksum,
+              datetime.now(timezone.utc).isoformat())
+
+    if dialect == "sqlite":
+        # executescript confirma lo pendiente antes de empezar: abrir la
+        # transacción dentro del propio script
+        try:
+            conn.executescript("BEGIN;\n" + migration.sql)
+            conn.execute(record, params)
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    else:
+        with conn.transaction():
+            conn.execute(migration.sql)
+            conn.execute(record, params)
+
+
+def migrate(conn, dialect: str, target_version: Optional[int] = None,
+            directory: str = MIGRATIONS_DIR, verbose: bool = False) -> List[Migration]:
+    """
+    Aplicar las migraciones pendientes, en orden.
+
+    Args:
+        conn: Conexión de connect() (o sqlite3 en autocommit)
+        dialect: "postgres" o "sqlite"
+        target_version: Última versión a aplicar; por defecto todas
+        directory: Carpeta raíz de las migraciones
+        verbose: Imprimir cada migración aplicada
+
+    Returns:
+        List[Migration]: Migraciones aplicadas en esta ejecución
+    """
+    applied = applied_migrations(conn, dialect)
+    done = []
+    for migration in discover(dialect, directory):
+        if target_version is not None and migration.version > target_version:
+            break
+        previous = applied.get(migration.version)
+        if previous is not None:
+            if previous['checksum'] != migration.checksum:
+                print(f"⚠️ La migración {migration.version:04d}_{migration.name} cambió después de aplicarse")
+            continue
+        if verbose:
+            print(f"⏳ Aplicando {migration.version:04d}_{migration.name}...")
+        _apply(conn, dialect, migration)
+        done.append(migration)
+    return done
+
+
+def status(conn, dialect: str, directory: str = MIGRATIONS_DIR) -> List[Dict]:
+    """
+    Estado de cada migración del dialecto.
+
+    Returns:
+        List[Dict]: version, name, applied_at (None si está pendiente) y changed
+    """
+    applied = applied_migrations(conn, dialect)
+    result = []
+    for migration in discover(dialect, directory):
+        previous = applied.get(migration.version)
+        result.append({
+            'version': migration.version,
+            'name': migration.name,
+            'applied_at': previous['applied_at'] if previous else None,
+            'changed': bool(previous) and previous['checksum'] != migration.checksum,
+        })
+    return result
+
+
+def explain(conn, dialect: str) -> Dict[str, str]:
+    """
+    Plan de ejecución de las consultas frecuentes (HOT_QUERIES).
+
+    Returns:
+        Dict[str, str]: nombre de la consulta -> plan en texto
+    """
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    plans = {}
+    for name, sql in HOT_QUERIES.items():
+        rows = conn.execute(prefix + sql).fetchall()
+        # SQLite: (id, parent, notused, detalle); Postgres: una línea por fila
+        plans[name] = "\n".join(str(row[-1]) for row in rows)
+    return plans
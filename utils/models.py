@@ -0,0 +1,190 @@
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from utils.enums import FIELD_ENUMS, CodedEnum
+
+"""
+Registro tipado de una sesión de estudio.
+
+Session guarda los campos en __slots__ en lugar de un dict por fila, con la
+fecha y created_at ya convertidos a date/datetime al cargar y categoría,
+dificultad y concentración como códigos enteros (utils/enums.py), los mismos
+objetos para todas las sesiones. Así cada sesión ocupa varias veces menos
+memoria y nadie vuelve a llamar a fromisoformat.
+
+También es un Mapping de solo lectura con el formato de Supabase, así que el
+código que usa session.get('date') o session['topic'] sigue funcionando sin
+cambios: session['date'] devuelve "YYYY-MM-DD" y session.date un date;
+session['difficulty'] devuelve la clave guardada ("Medium") y
+session.difficulty el miembro Difficulty.MEDIUM.
+"""
+
+# Columnas de study_sessions en el orden de la tabla
+FIELDS = (
+    "id", "day", "date", "category", "topic", "duration", "daily_win",
+    "key_learnings", "resources", "difficulty", "focus_level", "obstacles",
+    "next_steps", "practical_application", "created_at", "updated_at",
+)
+
+
+def parse_date(value: Any) -> Union[date, str, None]:
+    """Fecha "YYYY-MM-DD" (o con hora) a date; el texto tal cual si no se entiende."""
+    if value is None or isinstance(value, date):
+        return value.date() if isinstance(value, datetime) else value
+    try:
+        return date.fromisoformat(value[:10])
+    except (TypeError, ValueError):
+        return value
+
+
+def parse_datetime(value: Any) -> Union[datetime, str, None]:
+    """Marca ISO 8601 a datetime; el texto tal cual si no se entiende."""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _wire(value: Any) -> Any:
+    """date/datetime a texto ISO y enumerados a su clave, como los devuelve Supabase."""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, CodedEnum):
+        return value.key
+    return value
+
+
+class Session(Mapping):
+    """
+    Sesión de estudio con campos tipados y vista de solo lectura tipo dict.
+
+    Attributes:
+        date: date (o el texto original si no es una fecha válida)
+        created_at: datetime (o el texto original)
+        category, difficulty, focus_level: Miembro de utils/enums.py (o el
+            texto original si no se reconoce)
+        updated_at: Texto tal cual lo devuelve Supabase, para comparar
+            versiones en las escrituras
+        day: int
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, **fields):
+        for field in FIELDS:
+            setattr(self, field, fields.get(field))
+
+    @classmethod
+    def from_wire(cls, row: Mapping) -> "Session":
+        """
+        Crear una sesión desde una fila de Supabase.
+
+        Las columnas que no son de la sesión (por ejemplo search_vector) se
+        descartan.
+        """
+        session = cls.__new__(cls)
+        for field in FIELDS:
+            setattr(session, field, row.get(field))
+        session.date = parse_date(session.date)
+        session.created_at = parse_datetime(session.created_at)
+        for field, enum in FIELD_ENUMS.items():
+            setattr(session, field, enum.parse(getattr(session, field)))
+        return session
+
+    @classmethod
+    def from_columns(cls, columns: Mapping) -> List["Session"]:
+        """
+        Crear sesiones desde columnas (p. ej. de una tabla Arrow) sin pasar
+        por un dict por fila.
+
+        Args:
+            columns: Columna -> lista de valores, todas del mismo largo; las
+                que falten quedan a None
+
+        Returns:
+            List[Session]: Una sesión por posición
+        """
+        size = len(next(iter(columns.values()), ()))
+        values = []
+        for field in FIELDS:
+            column = columns.get(field)
+            if column is None:
+                column = [None] * size
+            elif field == "date":
+                column = [parse_date(v) for v in column]
+            elif field == "created_at":
+                column = [parse_datetime(v) for v in column]
+            elif field in FIELD_ENUMS:
+                # Pocos valores distintos: interpretar cada uno una vez
+                parsed = {}
+                parse = FIELD_ENUMS[field].parse
+                column = [parsed[v] if v in parsed else parsed.setdefault(v, parse(v)) for v in column]
+            values.append(column)
+
+        sessions = []
+        new = cls.__new__
+        for row in zip(*values):
+            session = new(cls)
+            # Una asignación por slot en el orden de FIELDS, sin setattr
+            (session.id, session.day, session.date, session.category, session.topic,
+             session.duration, session.daily_win, session.key_learnings, session.resources,
+             session.difficulty, session.focus_level, session.obstacles, session.next_steps,
+             session.practical_application, session.created_at, session.updated_at) = row
+            sessions.append(session)
+        return sessions
+
+    def to_wire(self) -> Dict[str, Any]:
+        """Fila con el formato de Supabase, lista para upsert o JSON."""
+        return {field: _wire(getattr(self, field)) for field in FIELDS}
+
+    # Vista Mapping con el formato de Supabase
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return _wire(getattr(self, key))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __contains__(self, key) -> bool:
+        return key in _FIELD_SET
+
+    def __repr__(self) -> str:
+        return f"Session(id={self.id!r}, day={self.day!r}, date={self['date']!r}, topic={self.topic!r})"
+
+    # Mapping define __eq__ por contenido y anula __hash__: las sesiones se
+    # comparan como filas y no sirven como clave
+
+
+_FIELD_SET = frozenset(FIELDS)
+
+
+def as_session(session: Mapping) -> Session:
+    """Aceptar tanto una Session como una fila dict."""
+    return session if isinstance(session, Session) else Session.from_wire(session)
+
+
+def session_date(session: Mapping) -> Optional[date]:
+    """
+    Fecha de una sesión como date, sin volver a parsearla si es una Session.
+
+    Returns:
+        Optional[date]: Fecha, o None si falta o no es válida
+    """
+    value = session.date if isinstance(session, Session) else parse_date(session.get('date'))
+    return value if isinstance(value, date) else None
+
+
+def session_created_at(session: Mapping) -> Optional[datetime]:
+    """created_at como datetime, o None si falta o no es válido."""
+    if isinstance(session, Session):
+        value = session.created_at
+    else:
+        value = parse_datetime(session.get('created_at'))
+    return value if isinstance(value, datetime) else None
@@ -0,0 +1,182 @@
+import cProfile
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+import streamlit as st
+
+"""
+Profiler opcional para una ejecución (rerun) de una página.
+
+Se activa con la variable de entorno STUDY_TRACKER_PROFILE=1 (todos los
+reruns) o abriendo la página con ?profile=1, que solo se atiende si el
+servidor arrancó con STUDY_TRACKER_PROFILE_QUERY=1: así un visitante
+cualquiera no puede llenar el disco de perfiles. Por cada rerun perfilado
+escribe en STUDY_TRACKER_PROFILE_DIR (por defecto ./profiles):
+
+- <página>_<timestamp>.pstats: estadísticas de cProfile (snakeviz, pstats)
+- <página>_<timestamp>.collapsed: pilas muestreadas en formato "collapsed",
+  compatible con flamegraph.pl y speedscope
+
+Solo se guardan los últimos STUDY_TRACKER_PROFILE_KEEP perfiles (por
+defecto MAX_PROFILES); los más antiguos se borran al escribir uno nuevo.
+
+Desactivado, el coste es leer una variable de entorno y un query param.
+"""
+
+PROFILE_ENV = "STUDY_TRACKER_PROFILE"
+PROFILE_DIR_ENV = "STUDY_TRACKER_PROFILE_DIR"
+PROFILE_QUERY_PARAM = "profile"
+PROFILE_QUERY_ENV = "STUDY_TRACKER_PROFILE_QUERY"
+PROFILE_KEEP_ENV = "STUDY_TRACKER_PROFILE_KEEP"
+
+# Perfiles (pares .pstats/.collapsed) que se conservan en el directorio
+MAX_PROFILES = 20
+
+_PROFILE_EXTENSIONS = (".pstats", ".collapsed")
+
+# Intervalo de muestreo de pilas, en segundos
+SAMPLE_INTERVAL = 0.005
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "") not in ("", "0")
+
+
+def profiling_enabled() -> bool:
+    """Indicar si este rerun debe perfilarse."""
+    if _env_flag(PROFILE_ENV):
+        return True
+    if not _env_flag(PROFILE_QUERY_ENV):
+        return False
+    try:
+        return st.query_params.get(PROFILE_QUERY_PARAM, "") not in ("", "0")
+    except Exception:
+        # Fuera de un script de Streamlit no hay query params
+        return False
+
+
+def _profile_dir() -> str:
+    return os.environ.get(PROFILE_DIR_ENV, os.path.join(os.getcwd(), "profiles"))
+
+
+def _max_profiles() -> int:
+    try:
+        return max(1, int(os.environ.get(PROFILE_KEEP_ENV, MAX_PROFILES)))
+    except ValueError:
+        return MAX_PROFILES
+
+
+def _prune_profiles(out_dir: str, keep: int) -> None:
+    """Borrar los perfiles más antiguos y dejar solo los últimos keep."""
+    profiles = {}
+    for entry in os.scandir(out_dir):
+        base, ext = os.path.splitext(entry.path)
+        if entry.is_file() and ext in _PROFILE_EXTENSIONS:
+            profiles[base] = max(profiles.get(base, 0), entry.stat().st_mtime)
+    # Los nombres llevan la hora con microsegundos: desempatan el mtime
+    for base in sorted(profiles, key=lambda b: (profiles[b], b))[:-keep]:
+        for ext in _PROFILE_EXTENSIONS:
+            try:
+                os.remove(base + ext)
+            except FileNotFoundError:
+                pass
+
+
+class _StackSampler:
+    """Muestrea la pila de un hilo y cuenta las pilas en formato collapsed."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            # Formato collapsed: raíz primero, separado por ';'
+            self.stacks[";".join(reversed(names))] += 1
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profile_run(name: str, enabled: Optional[bool] = None) -> Iterator[None]:
+    """
+    Perfilar el bloque y volcar .pstats y .collapsed al terminar.
+
+    Args:
+        name: Nombre de la página, usado en los archivos generados
+        enabled: Forzar activado/desactivado; por defecto profiling_enabled()
+    """
+    if enabled is None:
+        enabled = profiling_enabled()
+    if not enabled:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    sampler = _StackSampler(threading.get_ident())
+    start = time.perf_counter()
+
+    sampler.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        sampler.stop()
+        elapsed = time.perf_counter() - start
+
+        out_dir = _profile_dir()
+        os.makedirs(out_dir, exist_ok=True)
+        base = os.path.join(out_dir, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}")
+        profiler.dump_stats(f"{base}.pstats")
+        sampler.write(f"{base}.collapsed")
+        _prune_profiles(out_dir, _max_profiles())
+        print(f"⏱️ Perfil de {name}: {elapsed * 1000:.0f} ms -> {base}.pstats / .collapsed")
+
+
+def profiled(fn: Callable) -> Callable:
+    """
+    Decorador para el main() de una página: perfila cada rerun si está activo.
+
+    Args:
+        fn: Función main de la página
+
+    Returns:
+        Callable: Función envuelta
+    """
+    name = os.path.splitext(os.path.basename(fn.__code__.co_filename))[0]
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with profile_run(name):
+            return fn(*args, **kwargs)
+
+    return wrapper
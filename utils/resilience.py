@@ -0,0 +1,137 @@
+import threading
+import time
+from typing import Any, Callable
+
+import httpx
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+"""
+Reintentos y circuit breaker para las llamadas a Supabase.
+
+Los errores transitorios (red, timeouts, 5xx, 429) se reintentan con backoff
+exponencial con jitter. Si el backend sigue fallando, el circuit breaker se
+abre y las llamadas fallan al instante durante un tiempo, en lugar de
+bloquear cada rerun esperando timeouts.
+"""
+
+# Intentos por llamada (incluye el primero)
+RETRY_ATTEMPTS = 3
+# Espera máxima entre reintentos, en segundos
+RETRY_MAX_WAIT = 2.0
+
+# Fallos seguidos que abren el circuito
+BREAKER_FAILURE_THRESHOLD = 3
+# Segundos que el circuito permanece abierto antes de probar de nuevo
+BREAKER_RESET_TIMEOUT = 30.0
+
+
+class CircuitOpenError(RuntimeError):
+    """El backend se considera caído y la llamada no se intentó."""
+
+
+def is_transient(exc: BaseException) -> bool:
+    """
+    Decidir si un error merece reintento.
+
+    Args:
+        exc: Excepción lanzada por la llamada
+
+    Returns:
+        bool: True para errores de red, timeouts, 5xx y 429
+    """
+    if isinstance(exc, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+
+    # postgrest.APIError guarda el código HTTP o de Postgres como texto
+    code = str(getattr(exc, 'code', '') or '')
+    return code.isdigit() and (int(code) >= 500 or int(code) == 429)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker thread-safe con estados cerrado, abierto y semiabierto.
+
+    Tras BREAKER_FAILURE_THRESHOLD fallos seguidos se abre. Pasado
+    BREAKER_RESET_TIMEOUT deja pasar una llamada de prueba: si funciona se
+    cierra y si falla vuelve a abrirse.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """True si el circuito está abierto y aún no toca probar."""
+        with self._lock:
+            return (self._opened_at is not None
+                    and time.monotonic() - self._opened_at < self.reset_timeout)
+
+    def allow(self) -> bool:
+        """Indicar si una llamada puede intentarse ahora."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            # Semiabierto: solo una llamada de prueba a la vez
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Ejecutar una función con reintentos, protegida por el circuito.
+
+        Args:
+            fn: Llamada a Supabase (ej. query.execute)
+
+        Returns:
+            Any: Resultado de la llamada
+
+        Raises:
+            CircuitOpenError: Si el circuito está abierto
+        """
+        if not self.allow():
+            raise CircuitOpenError("Supabase no disponible (circuito abierto)")
+
+        retrying = Retrying(
+            stop=stop_after_attempt(RETRY_ATTEMPTS),
+            wait=wait_random_exponential(multiplier=0.2, max=RETRY_MAX_WAIT),
+            retry=retry_if_exception(is_transient),
+            reraise=True
+        )
+        try:
+            result = retrying(fn)
+        except Exception as e:
+            if is_transient(e):
+                self.record_failure()
+            else:
+                # Error de la petición (ej. validación): el backend responde
+                self.record_success()
+            raise
+
+        self.record_success()
+        return result
@@ -0,0 +1,260 @@
+import bisect
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+"""
+Índice invertido en memoria para buscar sesiones por cualquier campo de texto.
+
+Los textos se tokenizan sin acentos ni mayúsculas ("Estadística" y
+"estadistica" son el mismo término) y sin palabras vacías en español e
+inglés. Los resultados se ordenan con BM25, dando más peso al tema y a la
+victoria del día. La última palabra de la búsqueda también vale como
+prefijo, para que los resultados aparezcan mientras se escribe.
+
+Hay un índice por proceso (get_index()). Se sincroniza con cada nueva
+instantánea de sesiones re-tokenizando solo las que cambiaron, y
+data_manager lo actualiza al guardar o borrar una sesión.
+"""
+
+# Campos indexados y su peso en la puntuación
+FIELD_WEIGHTS = {
+    "topic": 3,
+    "daily_win": 2,
+    "key_learnings": 1,
+    "resources": 1,
+    "obstacles": 1,
+    "next_steps": 1,
+    "practical_application": 1,
+}
+
+# Parámetros de BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Términos como máximo en que se expande la palabra usada como prefijo
+MAX_PREFIX_EXPANSIONS = 50
+
+STOPWORDS = frozenset("""
+a al algo como con de del e el en entre es esta este esto la las lo los me mi mas muy
+no o para pero por que se sin sobre su sus un una uno y ya
+an and are as at be by for from has have i in is it its of on or so that the this
+to was were what when which with you
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_text(text: str) -> str:
+    """Quitar acentos y pasar a minúsculas ("Análisis" -> "analisis")."""
+    if text.isascii():
+        return text.lower()
+    # Separar las tildes de las letras y descartarlas ("á" -> "a" + "´" -> "a")
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Dividir un texto en términos indexables.
+
+    Args:
+        text: Texto libre en español o inglés
+
+    Returns:
+        List[str]: Términos sin acentos, en minúsculas y sin palabras vacías
+    """
+    if not text:
+        return []
+    return [t for t in _TOKEN_RE.findall(normalize_text(str(text))) if t not in STOPWORDS]
+
+
+def _document_terms(session: Mapping) -> Counter:
+    """Frecuencia ponderada de cada término en los campos de una sesión."""
+    # Repetir los términos según el peso del campo y contarlos de una vez
+    tokens = []
+    for field, weight in FIELD_WEIGHTS.items():
+        text = session.get(field)
+        if text:
+            tokens.extend(tokenize(text) * weight)
+    return Counter(tokens)
+
+
+def _fingerprint(session: Mapping) -> int:
+    return hash(tuple(session.get(field) or "" for field in FIELD_WEIGHTS))
+
+
+class SearchIndex:
+    """Índice invertido con ranking BM25, actualizable sesión a sesión."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # término -> {id de sesión: frecuencia ponderada}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        # id de sesión -> términos, para poder quitarla del índice
+        self._documents: Dict[str, Counter] = {}
+        self._lengths: Dict[str, int] = {}
+        self._fingerprints: Dict[str, int] = {}
+        self._total_length = 0
+        # Vocabulario ordenado para buscar por prefijo con bisect
+        self._vocabulary: List[str] = []
+        self._synced_snapshot: Optional[Sequence[Mapping]] = None
+        self._snapshot_by_id: Dict[str, Mapping] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, session: Mapping) -> None:
+        """Indexar una sesión nueva o reemplazar la versión anterior."""
+        session_id = session.get('id')
+        if session_id is None:
+            return
+        with self._lock:
+            self._remove(session_id)
+            terms = _document_terms(session)
+            for term, frequency in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    bisect.insort(self._vocabulary, term)
+                postings[session_id] = frequency
+            length = sum(terms.values())
+            self._documents[session_id] = terms
+            self._lengths[session_id] = length
+            self._fingerprints[session_id] = _fingerprint(session)
+            self._total_length += length
+
+    def remove(self, session_id: str) -> None:
+        """Quitar una sesión del índice."""
+        with self._lock:
+            self._remove(session_id)
+
+    def _remove(self, session_id: str) -> None:
+        terms = self._documents.pop(session_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[session_id]
+            if not postings:
+                del self._postings[term]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, term)]
+        self._total_length -= self._lengths.pop(session_id)
+        del self._fingerprints[session_id]
+
+    def sync(self, sessions: Sequence[Mapping]) -> None:
+        """
+        Poner el índice al día con una instantánea de sesiones.
+
+        Solo se re-tokenizan las sesiones nuevas o con texto distinto, y se
+        quitan las que ya no están. Con la misma instantánea no hace nada.
+
+        Args:
+            sessions: Instantánea de data_manager.load_sessions()
+        """
+        with self._lock:
+            if sessions is self._synced_snapshot:
+                return
+            by_id = {}
+            for session in sessions:
+                session_id = session.get('id')
+                by_id[session_id] = session
+                if self._fingerprints.get(session_id) != _fingerprint(session):
+                    self.add(session)
+            for session_id in [i for i in self._documents if i not in by_id]:
+                self._remove(session_id)
+            self._synced_snapshot = sessions
+            self._snapshot_by_id = by_id
+
+    def search_snapshot(self, sessions: Sequence[Mapping], query: str) -> List[Mapping]:
+        """
+        Filtrar y ordenar una instantánea por relevancia para una búsqueda.
+
+        Args:
+            sessions: Instantánea de sesiones
+            query: Texto de búsqueda
+
+        Returns:
+            List[Mapping]: Sesiones que coinciden, la más relevante primero
+        """
+        with self._lock:
+            self.sync(sessions)
+            by_id = self._snapshot_by_id
+            ranked = self.search(query)
+        return [by_id[i] for i, _ in ranked if i in by_id]
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "\uffff")
+        return self._vocabulary[start:min(end, start + MAX_PREFIX_EXPANSIONS)]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Buscar sesiones que contengan todas las palabras de la consulta.
+
+        Args:
+            query: Texto de búsqueda; la última palabra vale como prefijo
+            limit: Número máximo de resultados
+
+        Returns:
+            List[Tuple[str, float]]: (id de sesión, puntuación), de mayor a menor
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+
+        with self._lock:
+            n_docs = len(self._documents)
+            if n_docs == 0:
+                return []
+            avg_length = self._total_length / n_docs
+
+            # Cada palabra es un grupo de términos: ella misma o sus prefijos
+            groups = [[w] for w in words[:-1]]
+            groups.append(self._expand_prefix(words[-1]) or [words[-1]])
+
+            scores: Optional[Dict[str, float]] = None
+            # Empezar por el grupo más selectivo reduce los candidatos antes
+            for group in sorted(groups, key=lambda g: sum(len(self._postings.get(t, ())) for t in g)):
+                group_scores: Dict[str, float] = {}
+                for term in group:
+                    postings = self._postings.get(term)
+                    if not postings:
+                        continue
+                    idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                    # Recorrer el lado más corto: la lista del término o los candidatos
+                    if scores is None or len(postings) <= len(scores):
+                        matches = postings.items()
+                    else:
+                        matches = ((i, postings[i]) for i in scores if i in postings)
+                    for session_id, frequency in matches:
+                        if scores is not None and session_id not in scores:
+                            continue
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[session_id] / avg_length)
+                        score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                        if score > group_scores.get(session_id, 0.0):
+                            group_scores[session_id] = score
+                if scores is None:
+                    scores = group_scores
+                else:
+                    scores = {i: scores[i] + s for i, s in group_scores.items()}
+                if not scores:
+                    return []
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit else ranked
+
+
+_index = SearchIndex()
+
+
+def get_index() -> SearchIndex:
+    """Índice compartido por todas las páginas del proceso."""
+    return _index
+
+
+def search_sessions(sessions: Sequence[Mapping], query: str) -> List[Mapping]:
+    """Buscar en una instantánea con el índice compartido (ver SearchIndex.search_snapshot)."""
+    return _index.search_snapshot(sessions, query)
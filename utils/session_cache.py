@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Iterable, Mapping, Optional, Tuple
+
+from utils.models import Session, as_session
+
+"""
+Caché de proceso compartida por todas las sesiones de Streamlit.
+
+Las lecturas concurrentes de la misma clave se agrupan en una sola carga
+(single-flight): el primer hilo consulta Supabase y el resto espera su
+resultado. Los valores se guardan como instantáneas inmutables, así que se
+entregan sin copiar.
+"""
+
+
+def freeze_sessions(rows: Iterable[Mapping]) -> Tuple[Session, ...]:
+    """
+    Convertir filas de sesión en una instantánea inmutable.
+
+    Args:
+        rows: Filas tal como las devuelve Supabase, o sesiones ya creadas
+            (la lectura en CSV las devuelve como Session)
+
+    Returns:
+        Tuple[Session, ...]: Tupla de sesiones tipadas (Mapping de solo lectura)
+    """
+    return tuple(as_session(row) for row in rows)
+
+
+class _Entry:
+    """Valor guardado junto con su versión y momento de carga."""
+
+    __slots__ = ('value', 'version', 'loaded_at')
+
+    def __init__(self, value: Any, version: Hashable, loaded_at: float):
+        self.value = value
+        self.version = version
+        self.loaded_at = loaded_at
+
+
+class SharedCache:
+    """
+    Caché thread-safe con TTL, versión por clave y carga single-flight.
+
+    Cada clave guarda un único valor: al cargar una versión nueva se
+    descarta la anterior.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._inflight: Dict[Tuple[str, Hashable], Future] = {}
+        # Se incrementa en cada invalidación; una carga iniciada antes no
+        # debe guardar su resultado
+        self._generation = 0
+
+    def get(self, key: str, loader: Callable[[], Any], ttl: float,
+            version: Hashable = None) -> Any:
+        """
+        Obtener un valor de la caché o cargarlo una sola vez.
+
+        Args:
+            key: Nombre del valor (ej. "sessions")
+            loader: Función que carga el valor si no está en caché
+            ttl: Segundos que el valor se considera vigente
+            version: Versión de los datos; si cambia, el valor se recarga
+
+        Returns:
+            Any: Valor en caché o recién cargado
+        """
+        flight_key = (key, version)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is not None and entry.version == version
+                    and time.monotonic() - entry.loaded_at < ttl):
+                return entry.value
+
+            future = self._inflight.get(flight_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[flight_key] = future
+                generation = self._generation
+
+        if not is_leader:
+            # Otro hilo ya está cargando esta versión
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                if self._inflight.get(flight_key) is future:
+                    del self._inflight[flight_key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if self._inflight.get(flight_key) is future:
+                del self._inflight[flight_key]
+            if generation == self._generation:
+                self._entries[key] = _Entry(value, version, time.monotonic())
+
+        future.set_result(value)
+        return value
+
+    def peek(self, key: str, ttl: float) -> Optional[Tuple[Any, Hashable]]:
+        """
+        Consultar un valor vigente sin cargarlo.
+
+        Returns:
+            Optional[Tuple[Any, Hashable]]: (valor, versión), o None si no hay
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry.loaded_at >= ttl:
+                return None
+            return entry.value, entry.version
+
+    def put(self, key: str, value: Any, version: Hashable = None) -> None:
+        """Guardar un valor cargado fuera de get() (ej. en paralelo)."""
+        with self._lock:
+            self._entries[key] = _Entry(value, version, time.monotonic())
+
+    def invalidate(self) -> None:
+        """Descartar todos los valores y las cargas en curso."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._inflight.clear()
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import Any, List, Mapping, Optional, Sequence
+
+"""
+Filtros tipados para leer solo las sesiones que una vista necesita.
+
+Un SessionFilter se traduce a cláusulas de PostgREST (gte/lte/eq/order/limit)
+para que Supabase devuelva únicamente esas filas, apoyándose en los índices
+de migrations/postgres/0005_session_indexes.sql. El mismo filtro se puede
+aplicar en memoria sobre una instantánea ya cargada, con idéntico resultado.
+"""
+
+# Columnas por las que se puede ordenar
+ORDER_COLUMNS = ("date", "created_at", "day")
+
+
+@dataclass(frozen=True)
+class SessionFilter:
+    """
+    Criterios de una lectura de sesiones.
+
+    Es inmutable y comparable, así que sirve como clave de caché.
+
+    Attributes:
+        date_from: Fecha inicial YYYY-MM-DD, incluida
+        date_to: Fecha final YYYY-MM-DD, incluida
+        category: Solo esta categoría (clave de utils/enums.py, ej. "SQL")
+        difficulty: Solo esta dificultad (clave, ej. "Medium")
+        limit: Número máximo de sesiones
+        order: Columna de orden ("date", "created_at" o "day")
+        descending: Orden descendente (las más recientes primero)
+    """
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    category: Optional[str] = None
+    difficulty: Optional[str] = None
+    limit: Optional[int] = None
+    order: str = "date"
+    descending: bool = False
+
+    def __post_init__(self):
+        if self.order not in ORDER_COLUMNS:
+            raise ValueError(f"Orden no soportado: {self.order}")
+        if self.limit is not None and self.limit <= 0:
+            raise ValueError("limit debe ser positivo")
+
+    def to_query(self, query) -> Any:
+        """
+        Añadir el filtro a una consulta de supabase-py (o del backend local).
+
+        Args:
+            query: Resultado de table("study_sessions").select(...)
+
+        Returns:
+            La misma consulta con filtros, orden y límite
+        """
+        if self.date_from:
+            query = query.gte("date", self.date_from)
+        if self.date_to:
+            query = query.lte("date", self.date_to)
+        if self.category:
+            query = query.eq("category", self.category)
+        if self.difficulty:
+            query = query.eq("difficulty", self.difficulty)
+        # created_at desempata las sesiones del mismo día
+        query = query.order(self.order, desc=self.descending)
+        if self.order != "created_at":
+            query = query.order("created_at", desc=self.descending)
+        if self.limit:
+            query = query.limit(self.limit)
+        return query
+
+    def matches(self, session: Mapping) -> bool:
+        """Si una sesión cumple los criterios (sin contar orden ni límite)."""
+        date = str(session.get('date') or "")
+        if self.date_from and date < self.date_from:
+            return False
+        if self.date_to and date[:10] > self.date_to:
+            return False
+        if self.category and session.get('category') != self.category:
+            return False
+        if self.difficulty and session.get('difficulty') != self.difficulty:
+            return False
+        return True
+
+    def apply(self, sessions: Sequence[Mapping]) -> List[Mapping]:
+        """
+        Aplicar el filtro en memoria a una instantánea.
+
+        Args:
+            sessions: Sesiones ya cargadas
+
+        Returns:
+            List[Mapping]: Sesiones que cumplen el filtro, ordenadas y limitadas
+        """
+        selected = [s for s in sessions if self.matches(s)]
+        selected.sort(key=self._sort_key, reverse=self.descending)
+        return selected[:self.limit] if self.limit else selected
+
+    def _sort_key(self, session: Mapping):
+        value = session.get(self.order)
+        value = int(value or 0) if self.order == "day" else str(value or "")
+        return value, str(session.get('created_at') or "")
@@ -0,0 +1,194 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from collections.abc import Mapping
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueo entre procesos
+    fcntl = None
+
+"""
+Caché compartida entre procesos de Streamlit en la misma máquina.
+
+Los datos se guardan en un archivo SQLite con su versión. Todos los workers
+leen la misma copia, y un contador de generación permite que una escritura
+en un worker invalide las cachés en memoria de los demás. Un lock de
+archivo agrupa las descargas simultáneas de varios procesos en una sola.
+"""
+
+# Directorio por defecto de la caché compartida
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "study_tracker_cache")
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Lock exclusivo entre procesos basado en un archivo.
+
+    Args:
+        path: Ruta del archivo de lock (se crea si no existe)
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _json_default(value: Any) -> Any:
+    """Serializar lo que json no conoce: Mapping (p. ej. Session) como dict, el resto como texto."""
+    return dict(value) if isinstance(value, Mapping) else str(value)
+
+
+def _encode_version(version: Hashable) -> str:
+    """Serializar una versión para compararla en SQL."""
+    return json.dumps(version, default=str)
+
+
+class SharedStore:
+    """
+    Almacén clave-valor en SQLite con versión, TTL y generación global.
+
+    Los errores de disco se registran y se tratan como fallo de caché: la
+    app sigue funcionando contra Supabase.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    version TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    payload TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            conn.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('generation', 0)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexión reutilizable por hilo."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, ttl: float, version: Hashable = None) -> Optional[Any]:
+        """
+        Leer un valor si existe, coincide la versión y sigue vigente.
+
+        Args:
+            key: Nombre del valor
+            ttl: Segundos que el valor se considera vigente
+            version: Versión esperada de los datos
+
+        Returns:
+            Optional[Any]: Valor deserializado, o None si no hay acierto
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT payload FROM entries WHERE key = ? AND version = ? AND stored_at > ?",
+                (key, _encode_version(version), time.time() - ttl)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error al leer la caché compartida: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def get_latest(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Leer el último valor guardado, sin importar versión ni antigüedad.
+
+        Sirve como respaldo cuando el backend no responde.
+
+        Returns:
+            Optional[Tuple[Any, float]]: (valor, timestamp de guardado), o None
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT payload, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error al leer la caché compartida: {e}")
+            return None
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def put(self, key: str, value: Any, version: Hashable = None) -> None:
+        """
+        Guardar un valor para que lo lean los demás procesos.
+
+        Args:
+            key: Nombre del valor
+            value: Valor serializable a JSON
+            version: Versión de los datos
+        """
+        try:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO entries (key, version, stored_at, payload) VALUES (?, ?, ?, ?)",
+                (key, _encode_version(version), time.time(), json.dumps(value, default=_json_default))
+            )
+        except sqlite3.Error as e:
+            print(f"Error al escribir la caché compartida: {e}")
+
+    def generation(self) -> int:
+        """Leer el contador de invalidaciones compartido."""
+        try:
+            row = self._connect().execute(
+                "SELECT value FROM meta WHERE name = 'generation'"
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error al leer la caché compartida: {e}")
+            return -1
+        return row[0] if row else 0
+
+    def invalidate(self) -> int:
+        """
+        Borrar todos los valores e incrementar la generación.
+
+        Returns:
+            int: Nueva generación
+        """
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM entries")
+                conn.execute("UPDATE meta SET value = value + 1 WHERE name = 'generation'")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            print(f"Error al invalidar la caché compartida: {e}")
+        return self.generation()
+
+    def lock(self, key: str):
+        """
+        Lock exclusivo entre procesos para cargar una clave una sola vez.
+
+        Args:
+            key: Nombre del valor que se va a cargar
+        """
+        return file_lock(f"{self.path}.{key}.lock")
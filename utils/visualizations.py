@@ -1,21 +1,26 @@
 import plotly.graph_objects as go
-import plotly.express as px
-from typing import List, Dict
-from collections import Counter
-from datetime import datetime
-import pandas as pd
+from typing import Mapping, Sequence
+
+from utils import columnar, enums
+from utils.enums import Category, Difficulty, FocusLevel
 
 """
 Módulo para visualizaciones con Plotly.
 Incluye gráficos de progreso, distribución, y análisis de patrones.
+
+Los conteos y fechas salen del almacén columnar de la instantánea
+(utils/columnar.py), que se construye una vez y comparten todos los
+gráficos, sin recorrer las sesiones ni construir un DataFrame por gráfico.
+Categoría, dificultad y concentración se cuentan por código del enumerado
+(utils/enums.py) y la etiqueta en español se pone al dibujar.
 """
 
-def create_progress_chart(sessions: List[Dict]) -> go.Figure:
+def create_progress_chart(sessions: Sequence[Mapping]) -> go.Figure:
     """
     Crear gráfico de progreso en el tiempo.
     
     Args:
-        sessions: Lista de sesiones
+        sessions: Lista de sesiones (Session o dict)
         
     Returns:
         go.Figure: Gráfico de línea con progreso
@@ -23,19 +28,15 @@ def create_progress_chart(sessions: List[Dict]) -> go.Figure:
     if not sessions:
         return _create_empty_chart("No hay datos disponibles")
     
-    # Preparar datos
-    df = pd.DataFrame(sessions)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')
-    
-    # Calcular progreso acumulado
-    df['cumulative_days'] = range(1, len(df) + 1)
+    dates = columnar.get_store(sessions).sorted_dates()
+    if len(dates) == 0:
+        return _create_empty_chart("No hay fechas registradas")
     
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
-        x=df['date'],
-        y=df['cumulative_days'],
+        x=dates,
+        y=list(range(1, len(dates) + 1)),
         mode='lines+markers',
         name='Progreso',
         line=dict(color='#4F46E5', width=3),
@@ -61,12 +62,12 @@ def create_progress_chart(sessions: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_weekday_distribution(sessions: List[Dict]) -> go.Figure:
+def create_weekday_distribution(sessions: Sequence[Mapping]) -> go.Figure:
     """
     Crear gráfico de barras con distribución de días de la semana.
     
     Args:
-        sessions: Lista de sesiones
+        sessions: Lista de sesiones (Session o dict)
         
     Returns:
         go.Figure: Gráfico de barras
@@ -80,20 +81,18 @@ def create_weekday_distribution(sessions: List[Dict]) -> go.Figure:
         4: 'Viernes', 5: 'Sábado', 6: 'Domingo'
     }
     
-    # Contar sesiones por día de la semana
-    df = pd.DataFrame(sessions)
-    df['date'] = pd.to_datetime(df['date'])
-    df['weekday'] = df['date'].dt.dayofweek.map(weekdays_es)
-    
-    weekday_counts = df['weekday'].value_counts().sort_index()
+    # Contar sesiones por día de la semana, de lunes a domingo
+    counts = columnar.get_store(sessions).weekday_counts()
+    labels = [weekdays_es[w] for w, _ in counts]
+    values = [c for _, c in counts]
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=weekday_counts.index,
-        y=weekday_counts.values,
+        x=labels,
+        y=values,
         marker_color='#10B981',
-        text=weekday_counts.values,
+        text=values,
         textposition='outside'
     ))
     
@@ -113,12 +112,12 @@ def create_weekday_distribution(sessions: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_category_distribution(sessions: List[Dict]) -> go.Figure:
+def create_category_distribution(sessions: Sequence[Mapping]) -> go.Figure:
     """
     Crear gráfico pie con distribución por categoría.
     
     Args:
-        sessions: Lista de sesiones
+        sessions: Lista de sesiones (Session o dict)
         
     Returns:
         go.Figure: Gráfico pie
@@ -126,13 +125,14 @@ def create_category_distribution(sessions: List[Dict]) -> go.Figure:
     if not sessions:
         return _create_empty_chart("No hay datos disponibles")
     
-    categories = [s.get('category', 'Sin categoría') for s in sessions]
-    category_counts = Counter(categories)
+    category_counts = sorted(columnar.get_store(sessions).enum_counts('category'), key=lambda item: -item[1])
     
-    labels = list(category_counts.keys())
-    values = list(category_counts.values())
+    labels = [enums.label(value, 'Sin categoría') for value, _ in category_counts]
+    values = [count for _, count in category_counts]
     
-    colors = px.colors.qualitative.Set3
+    from plotly.colors import qualitative
+
+    colors = qualitative.Set3
     
     fig = go.Figure(data=[go.Pie(
         labels=labels,
@@ -156,12 +156,12 @@ def create_category_distribution(sessions: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_difficulty_pie(sessions: List[Dict]) -> go.Figure:
+def create_difficulty_pie(sessions: Sequence[Mapping]) -> go.Figure:
     """
     Crear gráfico pie con distribución de dificultad.
     
     Args:
-        sessions: Lista de sesiones
+        sessions: Lista de sesiones (Session o dict)
         
     Returns:
         go.Figure: Gráfico pie
@@ -169,29 +169,29 @@ def create_difficulty_pie(sessions: List[Dict]) -> go.Figure:
     if not sessions:
         return _create_empty_chart("No hay datos disponibles")
     
-    difficulties = [s.get('difficulty', 'Sin especificar') for s in sessions]
-    difficulty_counts = Counter(difficulties)
+    difficulty_counts = columnar.get_store(sessions).enum_counts('difficulty')
     
-    labels = list(difficulty_counts.keys())
-    values = list(difficulty_counts.values())
+    labels = [enums.label(value, 'Sin especificar') for value, _ in difficulty_counts]
+    values = [count for _, count in difficulty_counts]
     
     # Colores por dificultad
     color_map = {
-        'Muy fácil': '#10B981',
-        'Fácil': '#34D399',
-        'Medio': '#F59E0B',
-        'Difícil': '#F97316',
-        'Muy difícil': '#EF4444'
+        Difficulty.EASY: '#34D399',
+        Difficulty.MEDIUM: '#F59E0B',
+        Difficulty.HARD: '#F97316',
+        Difficulty.VERY_HARD: '#EF4444'
     }
     
-    colors = [color_map.get(label, '#94A3B8') for label in labels]
+    colors = [color_map.get(value, '#94A3B8') for value, _ in difficulty_counts]
     
+    # sort=False: porciones en orden de dificultad
     fig = go.Figure(data=[go.Pie(
         labels=labels,
         values=values,
         hole=0.5,
         marker_colors=colors,
-        textinfo='label+percent'
+        textinfo='label+percent',
+        sort=False
     )])
     
     fig.update_layout(
@@ -207,12 +207,12 @@ def create_difficulty_pie(sessions: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_focus_pie(sessions: List[Dict]) -> go.Figure:
+def create_focus_pie(sessions: Sequence[Mapping]) -> go.Figure:
     """
     Crear gráfico pie con distribución de nivel de concentración.
     
     Args:
-        sessions: Lista de sesiones
+        sessions: Lista de sesiones (Session o dict)
         
     Returns:
         go.Figure: Gráfico pie
@@ -220,29 +220,30 @@ def create_focus_pie(sessions: List[Dict]) -> go.Figure:
     if not sessions:
         return _create_empty_chart("No hay datos disponibles")
     
-    focus_levels = [s.get('focus_level', 'Sin especificar') for s in sessions]
-    focus_counts = Counter(focus_levels)
+    focus_counts = columnar.get_store(sessions).enum_counts('focus_level')
     
-    labels = list(focus_counts.keys())
-    values = list(focus_counts.values())
+    labels = [enums.label(value, 'Sin especificar') for value, _ in focus_counts]
+    values = [count for _, count in focus_counts]
     
     # Colores por nivel de concentración
     color_map = {
-        'Excelente': '#10B981',
-        'Alto': '#34D399',
-        'Medio': '#F59E0B',
-        'Bajo': '#F97316',
-        'Muy bajo': '#EF4444'
+        FocusLevel.EXCELLENT: '#10B981',
+        FocusLevel.HIGH: '#34D399',
+        FocusLevel.MEDIUM: '#F59E0B',
+        FocusLevel.LOW: '#F97316',
+        FocusLevel.VERY_LOW: '#EF4444'
     }
     
-    colors = [color_map.get(label, '#94A3B8') for label in labels]
+    colors = [color_map.get(value, '#94A3B8') for value, _ in focus_counts]
     
+    # sort=False: porciones en orden de concentración
     fig = go.Figure(data=[go.Pie(
         labels=labels,
         values=values,
         hole=0.5,
         marker_colors=colors,
-        textinfo='label+percent'
+        textinfo='label+percent',
+        sort=False
     )])
     
     fig.update_layout(
@@ -258,12 +259,12 @@ def create_focus_pie(sessions: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_topic_frequency(sessions: List[Dict]) -> go.Figure:
+def create_topic_frequency(sessions: Sequence[Mapping]) -> go.Figure:
     """
     Crear gráfico de barras con los temas más frecuentes.
     
     Args:
-        sessions: Lista de sesiones
+        sessions: Lista de sesiones (Session o dict)
         
     Returns:
         go.Figure: Gráfico de barras horizontal
@@ -271,11 +272,8 @@ def create_topic_frequency(sessions: List[Dict]) -> go.Figure:
     if not sessions:
         return _create_empty_chart("No hay datos disponibles")
     
-    topics = [s.get('topic', 'Sin tema') for s in sessions]
-    topic_counts = Counter(topics)
-    
     # Obtener top 10 temas más frecuentes
-    top_topics = topic_counts.most_common(10)
+    top_topics = columnar.get_store(sessions).value_counts('topic', 'Sin tema')[:10]
     
     if not top_topics:
         return _create_empty_chart("No hay temas registrados")
@@ -311,12 +309,12 @@ def create_topic_frequency(sessions: List[Dict]) -> go.Figure:
     return fig
 
 
-def create_balance_chart(sessions: List[Dict]) -> go.Figure:
+def create_balance_chart(sessions: Sequence[Mapping]) -> go.Figure:
     """
     Crear gráfico que muestre el balance entre Data Analytics y Physics.
     
     Args:
-        sessions: Lista de sesiones
+        sessions: Lista de sesiones (Session o dict)
         
     Returns:
         go.Figure: Gráfico de barras apiladas
@@ -325,11 +323,12 @@ def create_balance_chart(sessions: List[Dict]) -> go.Figure:
         return _create_empty_chart("No hay datos disponibles")
     
     # Categorizar sesiones
-    data_categories = ['Data Analysis', 'SQL', 'Statistics', 'Visualization']
-    physics_categories = ['Physics']
+    data_categories = [Category.DATA_ANALYSIS, Category.SQL, Category.STATISTICS, Category.VISUALIZATION]
+    physics_categories = [Category.PHYSICS]
     
-    data_count = sum(1 for s in sessions if s.get('category') in data_categories)
-    physics_count = sum(1 for s in sessions if s.get('category') in physics_categories)
+    category_counts = dict(columnar.get_store(sessions).enum_counts('category'))
+    data_count = sum(category_counts.get(c, 0) for c in data_categories)
+    physics_count = sum(category_counts.get(c, 0) for c in physics_categories)
     other_count = len(sessions) - data_count - physics_count
     
     fig = go.Figure()
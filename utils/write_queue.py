@@ -0,0 +1,169 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils.shared_store import file_lock
+
+"""
+Cola de escrituras offline.
+
+Cuando Supabase no responde, save_session y delete_session guardan la
+operación en un diario SQLite local en lugar de perderla. Al volver la
+conexión se reenvían en orden, agrupando varias ediciones de la misma sesión
+en una sola petición. Si la sesión cambió en el servidor desde que el usuario
+empezó a editarla, la operación se registra como conflicto en vez de
+sobrescribir esos cambios.
+"""
+
+OP_UPSERT = "upsert"
+OP_DELETE = "delete"
+
+
+class WriteJournal:
+    """Diario persistente de escrituras pendientes y conflictos detectados."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS pending_writes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                op TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                payload TEXT,
+                base_updated_at TEXT,
+                queued_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS write_conflicts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                op TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                payload TEXT,
+                base_updated_at TEXT,
+                server_updated_at TEXT,
+                reason TEXT NOT NULL,
+                detected_at REAL NOT NULL
+            )
+        """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexión reutilizable por hilo."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def lock(self):
+        """Lock entre procesos para que un solo proceso reenvíe la cola."""
+        return file_lock(f"{self.path}.replay.lock")
+
+    def append(self, op: str, session_id: str, payload: Optional[Dict] = None,
+               base_updated_at: Optional[str] = None) -> None:
+        """
+        Añadir una escritura al final del diario.
+
+        Args:
+            op: OP_UPSERT u OP_DELETE
+            session_id: ID de la sesión afectada
+            payload: Datos completos de la sesión (solo upsert)
+            base_updated_at: updated_at de la sesión cuando se empezó a
+                editar; None si es una sesión nueva
+        """
+        self._connect().execute(
+            "INSERT INTO pending_writes (op, session_id, payload, base_updated_at, queued_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (op, session_id, json.dumps(payload) if payload is not None else None,
+             base_updated_at, time.time())
+        )
+
+    def pending_count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM pending_writes").fetchone()[0]
+
+    def pending(self) -> List[Dict]:
+        """Escrituras pendientes en orden de llegada."""
+        rows = self._connect().execute(
+            "SELECT seq, op, session_id, payload, base_updated_at FROM pending_writes ORDER BY seq"
+        ).fetchall()
+        return [
+            {
+                'seq': row['seq'],
+                'op': row['op'],
+                'session_id': row['session_id'],
+                'payload': json.loads(row['payload']) if row['payload'] else None,
+                'base_updated_at': row['base_updated_at'],
+            }
+            for row in rows
+        ]
+
+    def remove_through(self, seq: int) -> None:
+        """Borrar las escrituras ya procesadas hasta seq inclusive."""
+        self._connect().execute("DELETE FROM pending_writes WHERE seq <= ?", (seq,))
+
+    def record_conflict(self, write: Dict, server_updated_at: Optional[str], reason: str) -> None:
+        """Guardar una escritura que no se aplicó por conflicto."""
+        self._connect().execute(
+            "INSERT INTO write_conflicts "
+            "(op, session_id, payload, base_updated_at, server_updated_at, reason, detected_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (write['op'], write['session_id'],
+             json.dumps(write['payload']) if write['payload'] is not None else None,
+             write['base_updated_at'], server_updated_at, reason, time.time())
+        )
+
+    def conflicts(self) -> List[Dict]:
+        """Conflictos detectados que el usuario aún no descartó."""
+        rows = self._connect().execute(
+            "SELECT id, op, session_id, payload, base_updated_at, server_updated_at, reason, detected_at "
+            "FROM write_conflicts ORDER BY id"
+        ).fetchall()
+        return [
+            {
+                'id': row['id'],
+                'op': row['op'],
+                'session_id': row['session_id'],
+                'payload': json.loads(row['payload']) if row['payload'] else None,
+                'base_updated_at': row['base_updated_at'],
+                'server_updated_at': row['server_updated_at'],
+                'reason': row['reason'],
+                'detected_at': row['detected_at'],
+            }
+            for row in rows
+        ]
+
+    def clear_conflicts(self) -> None:
+        self._connect().execute("DELETE FROM write_conflicts")
+
+
+def coalesce(writes: List[Dict]) -> List[Dict]:
+    """
+    Agrupar las escrituras pendientes en una por sesión.
+
+    La última operación de cada sesión es la que cuenta, pero conserva el
+    base_updated_at de la primera: es la versión del servidor que el usuario
+    vio antes de empezar a editar offline.
+
+    Args:
+        writes: Escrituras en orden de llegada
+
+    Returns:
+        List[Dict]: Una escritura por sesión, ordenadas por su última llegada
+    """
+    merged: Dict[str, Dict] = {}
+    for write in writes:
+        first = merged.pop(write['session_id'], None)
+        merged[write['session_id']] = {
+            **write,
+            'base_updated_at': first['base_updated_at'] if first else write['base_updated_at'],
+        }
+    return list(merged.values())
@@ -0,0 +1,55 @@
+import sys
+
+from utils.bulk_read import parse_sessions_csv, table_to_sessions
+from utils.models import FIELDS, Session
+
+# Textos que pyarrow trata como nulos por defecto y que una sesión puede
+# contener tal cual; la lectura en CSV debe devolverlos igual que la de JSON
+NULL_LIKE_TEXTS = ["N/A", "n/a", "NULL", "null", "nan", "NaN", "NA", "#N/A", "None", "-nan"]
+
+
+def _record_field(value) -> str:
+    """Campo como en la salida de texto de un registro de Postgres: comillas solo si hacen falta."""
+    if value is None:
+        return ""
+    text = str(value)
+    if text == "" or any(c in text for c in '",()\\') or any(c.isspace() for c in text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def postgrest_csv(rows):
+    """CSV como lo escribe PostgREST: NULL es un campo vacío sin comillas y un texto vacío es ""."""
+    lines = [",".join(FIELDS)]
+    lines += [",".join(_record_field(row.get(field)) for field in FIELDS) for row in rows]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def verify_bulk_read():
+    print("🚀 Checking that the CSV read keeps the same values as the JSON read...")
+    rows = []
+    for i, text in enumerate(NULL_LIKE_TEXTS + ["", 'con "comillas"\ny salto']):
+        rows.append({
+            "id": f"s{i}", "day": i + 1, "date": "2025-01-01", "category": "Mixed",
+            "topic": text, "duration": text, "daily_win": text, "key_learnings": text,
+            "resources": None, "difficulty": "Medium", "focus_level": "Medio",
+            "obstacles": text, "next_steps": None, "practical_application": text,
+            "created_at": "2025-01-01T10:00:00+00:00", "updated_at": "2025-01-01T10:00:00+00:00",
+        })
+
+    from_csv = table_to_sessions(parse_sessions_csv(postgrest_csv(rows)))
+    ok = True
+    for row, session in zip(rows, from_csv):
+        expected = Session.from_wire(row)
+        for field in FIELDS:
+            if session[field] != expected[field]:
+                print(f"❌ {row['id']}.{field}: CSV gave {session[field]!r}, JSON gives {expected[field]!r}")
+                ok = False
+
+    if ok:
+        print(f"✅ {len(rows)} rows round-trip through CSV unchanged.")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_bulk_read() else 1)
@@ -0,0 +1,98 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from load_test import seed_sessions
+
+# Presupuesto de arranque en frío de cada página (en segundos): importar el
+# script y dibujarlo una vez con AppTest, sin contar el propio import de
+# streamlit. Se mide en un proceso nuevo para que ningún módulo esté ya en
+# caché.
+IMPORT_BUDGET_SECONDS = 2.0
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Páginas que no deben cargar gráficos: el inicio, el formulario y el historial
+SCRIPTS = ["app.py", os.path.join("pages", "2_New_session.py"), os.path.join("pages", "3_History.py")]
+
+# Módulos que no deben cargarse hasta que una página dibuje gráficos.
+# streamlit ya importa parte de plotly y pandas, así que solo cuentan los que
+# no carga un "import streamlit" a secas.
+HEAVY_MODULES = ["utils.visualizations", "utils.columnar", "plotly.express", "plotly.graph_objects",
+                 "pandas", "pyarrow"]
+
+# Sesiones de prueba: con la base vacía la barra lateral no suma horas y
+# no recorre el mismo código que con datos
+SEED_SESSIONS = 200
+
+PROBE = """
+import sys, time
+sys.path.insert(0, {root!r})
+import streamlit
+from streamlit.testing.v1 import AppTest
+baseline = set(sys.modules)
+start = time.perf_counter()
+at = AppTest.from_file({script!r}, default_timeout=60).run()
+elapsed = time.perf_counter() - start
+if at.exception:
+    sys.exit("\\n".join(e.message for e in at.exception))
+loaded = [m for m in {heavy!r} if m in sys.modules and m not in baseline]
+print(f"{{elapsed:.3f}}|{{','.join(loaded)}}")
+"""
+
+
+def measure(script: str, env: dict):
+    """Dibujar una página en un proceso nuevo; devuelve (segundos, módulos pesados) o None."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(root=ROOT, script=os.path.join(ROOT, script), heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+    )
+    if result.returncode != 0:
+        print(f"❌ Could not render {script}:\n{result.stderr}")
+        return None
+
+    elapsed_str, loaded_str = result.stdout.strip().splitlines()[-1].split("|")
+    return float(elapsed_str), [m for m in loaded_str.split(",") if m]
+
+
+def verify_import_time():
+    # Backend local y cachés aisladas para no tocar Supabase ni la caché real
+    work_dir = tempfile.mkdtemp(prefix="study_tracker_import_")
+    backend = f"sqlite:///{os.path.join(work_dir, 'sessions.db')}"
+    env = dict(os.environ,
+               STUDY_TRACKER_BACKEND=backend,
+               STUDY_TRACKER_CACHE_DIR=os.path.join(work_dir, "cache"),
+               STUDY_TRACKER_JOURNAL_DIR=os.path.join(work_dir, "offline"))
+    try:
+        seed_sessions(backend, SEED_SESSIONS)
+        ok = True
+        for script in SCRIPTS:
+            print(f"🚀 Measuring cold render of {script}...")
+            measured = measure(script, env)
+            if measured is None:
+                ok = False
+                continue
+            elapsed, loaded = measured
+
+            print(f"⏱️ Render time: {elapsed:.3f}s (budget {IMPORT_BUDGET_SECONDS:.1f}s)")
+            if elapsed > IMPORT_BUDGET_SECONDS:
+                print("❌ Render time is over budget!")
+                ok = False
+            if loaded:
+                print(f"❌ Heavy modules imported eagerly: {', '.join(loaded)}")
+                ok = False
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if ok:
+        print("✅ Cold start is within budget and charts load lazily.")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_import_time() else 1)
@@ -19,10 +19,10 @@ def verify_reordering():
         "id": f"test_s1_{timestamp}",
         "date": "2025-01-01",
         "topic": "Test Session 1",
-        "category": "Test",
+        "category": "Mixed",
         "duration": "1h",
         "daily_win": "Win 1",
-        "difficulty": "Medio",
+        "difficulty": "Medium",
         "focus_level": "Medio"
     }
     
@@ -30,10 +30,10 @@ def verify_reordering():
         "id": f"test_s2_{timestamp}",
         "date": "2025-01-03", # Later date
         "topic": "Test Session 2",
-        "category": "Test",
+        "category": "Mixed",
         "duration": "1h",
         "daily_win": "Win 2",
-        "difficulty": "Medio",
+        "difficulty": "Medium",
         "focus_level": "Medio"
     }
     
@@ -41,10 +41,10 @@ def verify_reordering():
         "id": f"test_s3_{timestamp}",
         "date": "2025-01-02", # Middle date, should be inserted between 1 and 2
         "topic": "Test Session 3",
-        "category": "Test",
+        "category": "Mixed",
         "duration": "1h",
         "daily_win": "Win 3",
-        "difficulty": "Medio",
+        "difficulty": "Medium",
         "focus_level": "Medio"
     }
     
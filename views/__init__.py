@@ -0,0 +1,3 @@
+"""
+Views package for Study Tracker 100 Days
+"""
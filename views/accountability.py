@@ -0,0 +1,152 @@
+import streamlit as st
+from utils import data_manager
+
+"""
+Página de accountability partner: diagnóstico y estrategias.
+"""
+
+
+def show_accountability_partner(sessions):
+    """Mostrar página de accountability partner."""
+    
+    st.markdown("## 🤝 Tu Accountability Partner")
+    
+    days_since = data_manager.get_days_since_last_study(sessions)
+    total_sessions = len(sessions)
+    
+    # Diagnóstico
+    if total_sessions == 0:
+        st.info("🎯 Comienza tu desafío registrando tu primera sesión.")
+        return
+    
+    # Alertas
+    if days_since == 0:
+        st.success("✅ ¡Excelente! Has estudiado hoy. Mantén la consistencia.")
+    elif days_since == 1:
+        st.warning("⚠️ No estudiaste ayer. ¿Qué pasó?")
+    elif days_since >= 2:
+        st.error(f"🚨 Llevas {days_since} días sin estudiar. Es momento de retomar.")
+    
+    # Sistema de detección de procrastinación
+    st.markdown("---")
+    st.markdown("### 🔍 Detector de Procrastinación")
+    
+    if days_since == 0:
+        status_color = "#10B981"  # Verde
+        status_emoji = "✅"
+        status_text = "Todo bien"
+    elif days_since == 1:
+        status_color = "#F59E0B"  # Amarillo
+        status_emoji = "⚠️"
+        status_text = "Atención"
+    else:
+        status_color = "#EF4444"  # Rojo
+        status_emoji = "🚨"
+        status_text = "Acción requerida"
+    
+    st.markdown(f"""
+    <div style='background-color: {status_color}; padding: 1rem; border-radius: 8px; text-align: center;'>
+        <h2 style='color: white; margin: 0;'>{status_emoji} {status_text}</h2>
+        <p style='color: white; margin: 0.5rem 0 0 0;'>
+            Días sin estudiar: <strong>{days_since}</strong>
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Diagnóstico interactivo
+    if days_since > 0:
+        st.markdown("---")
+        st.markdown("### 🤔 ¿Por qué no has estudiado?")
+        
+        blockages = st.multiselect(
+            "Selecciona lo que resuena contigo:",
+            [
+                "Miedo al fracaso o ansiedad",
+                "Sobreestimado/a",
+                "Distraído/a",
+                "Sin energía física",
+                "No sé por dónde empezar",
+                "No tengo tiempo",
+                "Prefiero hacer otras cosas",
+                "Otro"
+            ]
+        )
+        
+        if blockages:
+            st.markdown("### 💡 Estrategias Específicas")
+            
+            strategies = {
+                "Miedo al fracaso o ansiedad": """
+                **🎯 Rompe el ciclo del miedo:**
+                - Estudia por solo 15 minutos. Nadie falla en 15 minutos.
+                - Define un "fallo tolerable": el peor escenario realista.
+                - Anota 3 cosas que pasarán SI estudias (no si no lo haces).
+                """,
+                "Sobreestimado/a": """
+                **🎯 Simplifica:**
+                - Reduce tu meta: ¿Qué es lo MÍNIMO que te haría sentir bien hoy?
+                - Usa la regla de 2 minutos: "Solo voy a abrir el libro/laptop"
+                - Divide en micro-tareas: ver un video de 10 min, no una clase entera.
+                """,
+                "Distraído/a": """
+                **🎯 Control del ambiente:**
+                - Modo avión en el teléfono durante 25 minutos.
+                - Usa pomodoro: 25 min estudiar, 5 min descanso.
+                - Ambient noise (puedo recomendarte sitios).
+                - Un solo programa abierto (poca opción = menos decisiones).
+                """,
+                "Sin energía física": """
+                **🎯 Energía física vs mental:**
+                - Diferencia entre cansancio físico (cuerpo) y mental (cerebro).
+                - Si es físico: descansa 20 min con timer, luego intenta.
+                - Si es mental: haz algo sencillo primero (revisar apuntes, no crear nuevo contenido).
+                - Hidrátate, come ligero, y observa: ¿en qué horario ESTOY más concentrado?
+                """,
+                "No sé por dónde empezar": """
+                **🎯 Define el punto de entrada:**
+                - Haz una lista de 3 temas posibles.
+                - Usa una ruleta para decidir.
+                - O elige el que suene MENOS apetecible (lo importante es empezar, no la perfección).
+                - Meta tipo "investigar X" en vez de "dominar X".
+                """,
+                "No tengo tiempo": """
+                **🎯 Revisa tu agenda real:**
+                - Anota durante 3 días en qué pierdes tiempo (sin juzgar).
+                - Identifica gaps de 15 min: en el transporte, antes de almorzar, etc.
+                - Acuérdate: 15 min de 100 días = 25 horas acumuladas.
+                """,
+                "Prefiero hacer otras cosas": """
+                **🎯 Honestidad primero:**
+                - ¿Es realmente que prefieres no estudiar, o es resistencia interna?
+                - Formula: "Haré 10 minutos, y luego puedo hacer lo otro"
+                - O asume el costo real: "¿Cuánto va a doler en 3 meses si NO lo hago?"
+                """,
+                "Otro": """
+                **🎯 Personaliza:**
+                - Escribe libremente durante 10 minutos POR QUÉ no lo haces (sin autocensura).
+                - Identifica el patrón detrás del rechazo.
+                - Prueba la estrategia de "contrato contigo mismo": 
+                  "Hoy haré X, y si lo cumplo, [recompensa específica].
+                """
+            }
+            
+            for blockage in blockages:
+                st.markdown(f"#### {blockage}")
+                st.markdown(strategies.get(blockage, "Estrategia personalizada pendiente."))
+                st.markdown("---")
+    
+    # Análisis de patrones
+    if total_sessions >= 5:
+        st.markdown("### 📈 Análisis de Patrones")
+        
+        # Día más productivo
+        from utils import visualizations
+
+        weekday_data = visualizations.create_weekday_distribution(sessions)
+        st.plotly_chart(weekday_data, width='stretch')
+        
+        st.info("""
+        **💡 Consejo:** 
+        Identifica en qué días de la semana eres más productivo.
+        Planifica tus sesiones de estudio intensas en esos días.
+        """)
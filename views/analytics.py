@@ -0,0 +1,61 @@
+import streamlit as st
+from utils import visualizations
+
+"""
+Página de análisis y visualizaciones.
+"""
+
+
+def show_analytics(sessions):
+    """Show analytics and visualizations."""
+    
+    st.markdown("## 📊 Analytics and Visualizations")
+    
+    if not sessions:
+        st.info("No data to visualize yet. Register your first session to start.")
+        return
+    
+    # Layout of charts
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(
+            visualizations.create_weekday_distribution(sessions),
+            width='stretch'
+        )
+    
+    with col2:
+        st.plotly_chart(
+            visualizations.create_category_distribution(sessions),
+            width='stretch'
+        )
+    
+    st.markdown("---")
+    
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        st.plotly_chart(
+            visualizations.create_difficulty_pie(sessions),
+            width='stretch'
+        )
+    
+    with col4:
+        st.plotly_chart(
+            visualizations.create_focus_pie(sessions),
+            width='stretch'
+        )
+    
+    st.markdown("---")
+    
+    st.plotly_chart(
+        visualizations.create_balance_chart(sessions),
+        width='stretch'
+    )
+    
+    st.markdown("---")
+    
+    st.plotly_chart(
+        visualizations.create_topic_frequency(sessions),
+        width='stretch'
+    )
@@ -0,0 +1,123 @@
+import streamlit as st
+from utils import data_manager
+
+"""
+Página principal: métricas, última sesión y progreso.
+"""
+
+
+def show_dashboard(sessions):
+    """Show main dashboard with metrics and summary."""
+    
+    st.markdown("## 🎯 Main Dashboard")
+    
+    if not sessions:
+        # Initial state without sessions
+        st.info("""
+        👋 Hello! Welcome to your Study Tracker.
+        
+        This is your space to document your learning during the next 100 days.
+        From data analysis to physics, here you can keep a complete record of your progress.
+        
+        **To start:**
+        1. Click on "New session" in the sidebar
+        2. Register your first study session
+        3. Start your challenge!
+        """)
+        
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                    padding: 2rem; border-radius: 10px; text-align: center; margin-top: 2rem;'>
+            <h2 style='color: white;'>🏆 Let's complete this challenge!</h2>
+            <p style='color: white; font-size: 1.2rem;'>
+                Each day counts. Each session brings you closer to your goal.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        return
+    
+    # Métricas principales
+    col1, col2, col3, col4 = st.columns(4)
+    
+    total_sessions = len(sessions)
+    progress_percent = (total_sessions / 100 * 100) if total_sessions <= 100 else 100
+    
+    with col1:
+        st.metric("📊 Days Completed", f"{total_sessions}/100", f"{progress_percent:.1f}%")
+    
+    with col2:
+        streak = data_manager.get_current_streak(sessions)
+        st.metric("🔥 Current Streak", f"{streak} days")
+    
+    with col3:
+        total_hours = data_manager.get_total_hours_studied(sessions)
+        st.metric("⏱️ Total Studied", total_hours)
+    
+    with col4:
+        days_since = data_manager.get_days_since_last_study(sessions)
+        if days_since == 0:
+            st.metric("✅ Last Study", "Today")
+        else:
+            st.metric("⏰ Last Study", f"{days_since} day(s)")
+    
+    st.markdown("---")
+    
+    # Alerts and feedback
+    if total_sessions > 0:
+        days_since = data_manager.get_days_since_last_study(sessions)
+        
+        if days_since == 0:
+            st.success("✅ ¡Excellent! You studied today. Keep it up.")
+        elif days_since == 1:
+            st.warning("⚠️ You didn't study yesterday. Return to the routine today.")
+        elif days_since > 1:
+            st.error(f"🚨 {days_since} days have passed since your last study. It's time to resume the challenge.")
+    
+    # Messages motivational milestones
+    if total_sessions == 10:
+        st.balloons()
+        st.success("🎉 ¡First milestone! You've completed 10 days. Keep it up!")
+    elif total_sessions == 25:
+        st.snow()
+        st.success("🎊 ¡25 days completed! You're in the fourth of the journey.")
+    elif total_sessions == 50:
+        st.balloons()
+        st.success("🏆 ¡50 days! You've reached the middle of the challenge!")
+    elif total_sessions == 75:
+        st.snow()
+        st.success("🔥 ¡75 days! You're in the final stretch.")
+    elif total_sessions == 100:
+        st.balloons()
+        st.success("🎉🎉🎉 ¡Congratulations! You've completed 100 days. You're incredible!")    
+    
+    # Last session
+    if sessions:
+        st.markdown("### 📝 Last Session Registered")
+        last_session = sessions[-1]
+        
+        with st.container():
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                st.markdown(f"""
+                **📅 Day {last_session.get('day', '?')}/100** - {last_session.get('date', 'Sin fecha')}  
+                **📚 Topic:** {last_session.get('topic', 'Sin tema')}  
+                **🏷️ Category:** {last_session.get('category', 'Sin categoría')}  
+                **⏱️ Duration:** {last_session.get('duration', 'Sin duración')}
+                """)
+                
+                if last_session.get('daily_win'):
+                    st.markdown(f"**🏆 Daily win:** {last_session.get('daily_win')}")
+            with col2:
+                if last_session.get('practical_application'):
+                    st.info(f"💼 **Practical application:** {last_session.get('practical_application')}")
+    
+    # Progress chart
+    # Import diferido: Plotly y pandas solo se cargan en páginas con gráficos
+    from utils import visualizations
+
+    st.markdown("---")
+    st.markdown("### 📈 Your Progress Over Time")
+    progress_chart = visualizations.create_progress_chart(sessions)
+    st.plotly_chart(progress_chart, width='stretch')
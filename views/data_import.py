@@ -0,0 +1,62 @@
+import streamlit as st
+from utils import importer
+
+"""
+Importación masiva de sesiones desde un archivo.
+"""
+
+
+def show_import():
+    """Mostrar el formulario de importación y el resultado."""
+    
+    st.markdown("## 📥 Importar sesiones")
+    
+    st.info("""
+    Carga tu historial desde otra herramienta en **CSV**, **JSON-lines** o **Parquet**.
+    
+    Columnas obligatorias: `date`, `topic`, `duration`, `daily_win`.
+    Opcionales: `id`, `category`, `difficulty`, `focus_level`, `key_learnings`, `resources`,
+    `obstacles`, `next_steps`, `practical_application`, `created_at`.
+    
+    Las sesiones con el mismo `id` se actualizan; sin `id`, la misma fecha y tema
+    cuentan como la misma sesión, así que puedes importar el archivo varias veces.
+    """)
+    
+    uploaded = st.file_uploader(
+        "Archivo de sesiones",
+        type=["csv", "jsonl", "ndjson", "json", "parquet"]
+    )
+    
+    if uploaded is None:
+        return
+    
+    if not st.button("📥 Importar", type="primary"):
+        return
+    
+    status = st.empty()
+    
+    def on_progress(rows_read: int) -> None:
+        status.caption(f"Procesadas {rows_read} filas...")
+    
+    try:
+        with st.spinner("Importando sesiones..."):
+            result = importer.import_sessions(uploaded, progress=on_progress)
+    except Exception as e:
+        st.error(f"❌ No se pudo leer el archivo: {e}")
+        return
+    
+    status.empty()
+    
+    if result['imported']:
+        st.success(f"✅ {result['imported']} sesiones importadas")
+    if result['failed_batches']:
+        st.error(f"❌ {result['failed_batches']} lotes no se pudieron guardar. Vuelve a importar el archivo para reintentarlo.")
+    if result['defaulted']:
+        st.caption(f"ℹ️ {result['defaulted']} valores de categoría, dificultad o foco no reconocidos se cambiaron por el valor por defecto.")
+    if result['rejected']:
+        st.warning(f"⚠️ {result['rejected']} filas rechazadas")
+        with st.expander("Ver motivos"):
+            for error in result['errors']:
+                st.markdown(f"- {error}")
+            if result['rejected'] > len(result['errors']):
+                st.caption(f"... y {result['rejected'] - len(result['errors'])} más")
@@ -0,0 +1,426 @@
+import os
+import streamlit as st
+from datetime import date
+from utils import async_data_manager, data_manager, content_generator, enums, exporter, facets, search_index
+from utils.session_cache import freeze_sessions
+from utils.session_filter import SessionFilter
+
+"""
+Historial de sesiones con filtros y acciones por sesión.
+"""
+
+# Página del formulario, relativa al script principal
+SESSION_FORM_PAGE = "pages/2_New_session.py"
+
+# Sesiones por página del historial
+HISTORY_PAGE_SIZE = 20
+
+# Períodos que se piden a Supabase ya filtrados, en lugar de leer todo
+PERIOD_FILTERS = {
+    "Últimas 7": SessionFilter(limit=7, descending=True),
+    "Últimas 30": SessionFilter(limit=30, descending=True),
+}
+
+FACET_LABELS = {
+    "category": "🏷️ Categoría",
+    "difficulty": "📊 Dificultad",
+    "focus_level": "🎯 Concentración",
+    "duration_band": "⏱️ Duración",
+}
+
+
+EXPORT_FORMAT_LABELS = {
+    "csv": "CSV",
+    "jsonl": "JSON-lines",
+    "parquet": "Parquet",
+    "markdown": "Artículos Markdown (.zip)",
+}
+
+
+def discard_export():
+    """Borrar el archivo de exportación preparado, si lo hay."""
+    prepared = st.session_state.pop("export_file", None)
+    if prepared is not None:
+        try:
+            os.remove(prepared["path"])
+        except OSError:
+            pass
+
+
+def show_export(sessions, complete=True):
+    """Exportar el historial completo bajo demanda."""
+    
+    with st.expander("📦 Exportar historial completo"):
+        fmt = st.selectbox(
+            "Formato:",
+            exporter.FORMATS,
+            format_func=EXPORT_FORMAT_LABELS.get,
+            key="export_format"
+        )
+        
+        # El archivo se prepara una vez y se sirve desde disco en los
+        # reruns siguientes, hasta que cambian el formato o los datos
+        version = data_manager.get_data_version()
+        prepared = st.session_state.get("export_file")
+        if prepared is not None and (prepared["format"] != fmt or prepared["version"] != version):
+            discard_export()
+            prepared = None
+        
+        # Solo se genera al pedirlo, no en cada rerun del historial
+        if st.button("Preparar descarga", key="export_prepare"):
+            discard_export()
+            with st.spinner("Generando archivo..."):
+                # Una vista parcial no tiene todas las sesiones: leerlas por páginas
+                source = sessions if complete else data_manager.iter_sessions()
+                path = exporter.export_to_file(source, fmt)
+            prepared = {"format": fmt, "version": version, "path": path}
+            st.session_state.export_file = prepared
+        
+        if prepared is not None and os.path.exists(prepared["path"]):
+            with open(prepared["path"], "rb") as f:
+                st.download_button(
+                    label=f"📥 Descargar {exporter.export_filename(fmt)}",
+                    data=f,
+                    file_name=exporter.export_filename(fmt),
+                    mime=exporter.MIME_TYPES[fmt],
+                    key="export_download"
+                )
+
+
+def facet_selection():
+    """Valores elegidos en cada faceta (de los widgets del rerun actual)."""
+    return {facet: st.session_state.get(f"facet_{facet}", []) for facet in FACET_LABELS}
+
+
+def show_facet_filters(facet_index, base):
+    """
+    Filtros por fecha, categoría, dificultad, concentración y duración.
+    
+    Cada opción muestra cuántas sesiones quedarían al elegirla con el resto
+    de filtros actuales.
+    
+    Returns:
+        Tuple: Fechas inicial y final elegidas (YYYY-MM-DD o None)
+    """
+    first, last = facet_index.date_bounds()
+    selection = facet_selection()
+    
+    with st.expander("🎛️ Filtros", expanded=any(selection.values())):
+        date_range = (None, None)
+        if first:
+            first_date = date.fromisoformat(first)
+            last_date = date.fromisoformat(last)
+            picked = st.date_input(
+                "📅 Rango de fechas:",
+                value=(first_date, last_date),
+                min_value=first_date,
+                max_value=last_date,
+                key="facet_dates"
+            )
+            # Mientras se elige el rango solo hay una fecha
+            if isinstance(picked, (tuple, list)) and len(picked) == 2:
+                date_range = (picked[0].isoformat(), picked[1].isoformat())
+        
+        counts = facet_index.counts(selection, base & facet_index.date_mask(*date_range))
+        
+        columns = st.columns(len(FACET_LABELS))
+        for column, (facet, label) in zip(columns, FACET_LABELS.items()):
+            options = facet_index.values(facet)
+            # Valores elegidos que ya no existen tras cambiar los datos
+            options += [v for v in selection[facet] if v not in options]
+            with column:
+                st.multiselect(
+                    label,
+                    options,
+                    format_func=lambda v, f=facet, c=counts[facet]: f"{enums.field_label(f, v)} ({c.get(v, 0)})",
+                    key=f"facet_{facet}"
+                )
+    
+    return date_range
+
+
+def load_history_sessions():
+    """
+    Cargar las sesiones que necesita el período elegido.
+    
+    Para las últimas 7 o 30 sesiones se leen solo esas filas. Con una
+    búsqueda en el resto de períodos, solo las sesiones que encuentra
+    Postgres (si la RPC de búsqueda está disponible); si no, la instantánea
+    completa.
+    
+    Returns:
+        Tuple: (sesiones en orden cronológico, si es el historial completo,
+        resultados de la búsqueda en Postgres o None)
+    """
+    period_filter = PERIOD_FILTERS.get(st.session_state.get("history_period"))
+    if period_filter is not None:
+        return tuple(reversed(data_manager.load_filtered_sessions(period_filter))), False, None
+    
+    search_term = st.session_state.get("history_search", "")
+    if search_term:
+        results = data_manager.search_sessions_remote(search_term)
+        if results is not None:
+            # Las filas de la RPC son sesiones completas: no hace falta la tabla
+            by_date = sorted(results, key=lambda r: (r.get('date') or '', r.get('created_at') or ''))
+            return freeze_sessions(by_date), False, results
+    
+    return async_data_manager.load_page_sessions(), True, None
+
+
+def show_history(sessions, complete=True, search_results=None):
+    """
+    Mostrar historial de sesiones con filtros.
+    
+    Args:
+        sessions: Sesiones en orden cronológico
+        complete: False si solo son las del período elegido o las encontradas
+        search_results: Resultados de search_sessions_remote() de los que
+            salen las sesiones, o None
+    """
+    
+    st.markdown("## 📝 Historial de Sesiones")
+    
+    # Una búsqueda sin resultados sigue mostrando los filtros para cambiarla
+    if not sessions and search_results is None:
+        st.info("No hay sesiones registradas aún.")
+        return
+    
+    show_export(sessions, complete)
+    
+    # Filtros
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        filter_option = st.selectbox(
+            "Filtrar por período:",
+            ["Todas", "Últimas 7", "Últimas 30", "Hitos (10, 20, 30...)"],
+            key="history_period"
+        )
+    
+    with col2:
+        search_term = st.text_input(
+            "🔍 Buscar:",
+            "",
+            key="history_search",
+            help="Busca en tema, aprendizajes, victoria, recursos, obstáculos, próximos pasos y aplicación"
+        )
+    
+    with col3:
+        sort_option = st.selectbox(
+            "Ordenar por:",
+            ["Más reciente", "Más antigua", "Por día", "Relevancia"]
+        )
+    
+    # Filtros por facetas sobre mapas de bits precalculados
+    # Una vista parcial no reemplaza los índices compartidos del historial completo
+    facet_index = facets.get_facets(sessions) if complete else facets.FacetIndex(sessions)
+    
+    if filter_option == "Últimas 7":
+        base = facet_index.all()
+        base[:-7] = False
+    elif filter_option == "Últimas 30":
+        base = facet_index.all()
+        base[:-30] = False
+    elif filter_option == "Hitos (10, 20, 30...)":
+        base = facet_index.milestones
+    else:
+        base = facet_index.all()
+    
+    date_range = show_facet_filters(facet_index, base)
+    mask = facet_index.filter(facet_selection(), base & facet_index.date_mask(*date_range))
+    filtered_sessions = facet_index.select(mask)
+    
+    snippets = {}
+    if search_term:
+        # Búsqueda en Postgres (índice GIN) o, si no está disponible, en el
+        # índice invertido local. Resultados de más a menos relevante.
+        if search_results is not None:
+            # Las sesiones ya son las encontradas: solo falta su orden por relevancia
+            rank = {r['id']: i for i, r in enumerate(search_results)}
+            matches = sorted(sessions, key=lambda s: rank[s.get('id')])
+            snippets = {r['id']: r.get('snippet') for r in search_results}
+        elif complete:
+            matches = search_index.search_sessions(sessions, search_term)
+        else:
+            matches = search_index.SearchIndex().search_snapshot(sessions, search_term)
+        in_period = {id(s) for s in filtered_sessions}
+        ranked = [s for s in matches if id(s) in in_period]
+        if sort_option == "Relevancia":
+            filtered_sessions = ranked
+        else:
+            # Conservar el orden cronológico para los demás criterios
+            matched = {id(s) for s in ranked}
+            filtered_sessions = [s for s in filtered_sessions if id(s) in matched]
+    
+    # Ordenar
+    if sort_option == "Relevancia":
+        if not search_term:
+            filtered_sessions = list(reversed(filtered_sessions))
+    elif sort_option == "Más reciente":
+        filtered_sessions = list(reversed(filtered_sessions))
+    elif sort_option == "Por día":
+        filtered_sessions = sorted(filtered_sessions, key=lambda x: x.get('day', 0))
+    
+    # Volver a la primera página cuando cambian los filtros
+    filters = (filter_option, search_term, sort_option, date_range,
+               tuple(tuple(v) for v in facet_selection().values()))
+    if st.session_state.get("history_filters") != filters:
+        st.session_state.history_filters = filters
+        st.session_state.history_page = 0
+    
+    total = len(filtered_sessions)
+    pages = max(1, -(-total // HISTORY_PAGE_SIZE))
+    page = min(st.session_state.get("history_page", 0), pages - 1)
+    first = page * HISTORY_PAGE_SIZE
+    page_sessions = filtered_sessions[first:first + HISTORY_PAGE_SIZE]
+    
+    if total:
+        st.caption(f"Mostrando {first + 1}-{first + len(page_sessions)} de {total} sesiones "
+                   f"({len(sessions)} en total)")
+    else:
+        st.caption(f"Mostrando 0 de {len(sessions)} sesiones")
+    st.markdown("---")
+    
+    # Solo la sesión abierta se dibuja completa; el resto es una fila compacta
+    open_id = st.session_state.get("history_open")
+    for session in page_sessions:
+        session_id = session.get('id')
+        is_open = session_id == open_id
+        
+        col_row, col_toggle = st.columns([6, 1])
+        with col_row:
+            st.markdown(
+                f"📅 **Día {session.get('day', '?')}/100** - {session.get('date', 'Sin fecha')} | "
+                f"{session.get('topic', 'Sin tema')}"
+            )
+        with col_toggle:
+            st.button(
+                "🔼 Cerrar" if is_open else "🔽 Ver",
+                key=f"open_{session_id}",
+                on_click=_toggle_session,
+                args=(session_id,)
+            )
+        
+        if is_open:
+            show_session_detail(session, snippets.get(session_id))
+    
+    if pages > 1:
+        show_pagination(page, pages)
+
+
+def _toggle_session(session_id):
+    """Abrir una sesión del historial, o cerrarla si ya estaba abierta."""
+    if st.session_state.get("history_open") == session_id:
+        st.session_state.history_open = None
+    else:
+        st.session_state.history_open = session_id
+
+
+def _go_to_page(page):
+    st.session_state.history_page = page
+    st.session_state.history_open = None
+
+
+def show_pagination(page, pages):
+    """Botones para moverse entre páginas del historial."""
+    
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    
+    with col_prev:
+        st.button("⬅️ Anterior", key="history_prev", disabled=page == 0,
+                  on_click=_go_to_page, args=(page - 1,))
+    
+    with col_info:
+        st.caption(f"Página {page + 1} de {pages}")
+    
+    with col_next:
+        st.button("Siguiente ➡️", key="history_next", disabled=page >= pages - 1,
+                  on_click=_go_to_page, args=(page + 1,))
+
+
+def show_session_detail(session, snippet=None):
+    """Detalle completo y acciones de una sesión."""
+        
+    with st.container(border=True):
+        if snippet:
+            st.markdown(f"🔎 {snippet}")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"""
+            **🏷️ Categoría:** {enums.field_label('category', session.get('category'))}  
+            **⏱️ Duración:** {session.get('duration', 'N/A')}  
+            **📊 Dificultad:** {enums.field_label('difficulty', session.get('difficulty'))}  
+            **🎯 Concentración:** {enums.field_label('focus_level', session.get('focus_level'))}
+            """)
+        
+        with col2:
+            st.markdown(f"""
+            **✨ Aprendizajes clave:**  
+            {session.get('key_learnings', 'N/A')}
+            """)
+        
+        st.markdown(f"**🏆 Victoria del día:** {session.get('daily_win', 'N/A')}")
+        
+        if session.get('resources'):
+            st.markdown(f"**📖 Recursos:** {session.get('resources')}")
+        
+        if session.get('obstacles'):
+            st.markdown(f"**🤔 Obstáculos:** {session.get('obstacles')}")
+        
+        if session.get('next_steps'):
+            st.markdown(f"**🚀 Próximos pasos:** {session.get('next_steps')}")
+        
+        if session.get('practical_application'):
+            st.info(f"**💼 Aplicación:** {session.get('practical_application')}")
+        
+        # Botones de acción
+        col_btn1, col_btn2, col_btn3, col_btn4 = st.columns(4)
+        
+        with col_btn1:
+            if st.button("✏️ Editar", key=f"edit_{session.get('id')}"):
+                # switch_page no funciona dentro de un callback
+                st.session_state.edit_session = session
+                st.switch_page(SESSION_FORM_PAGE)
+
+        with col_btn2:
+            if st.button("📱 Post Social", key=f"post_{session.get('id')}"):
+                post_es = content_generator.generate_social_post(session, language="es")
+                post_en = content_generator.generate_social_post(session, language="en")
+            
+                tabs = st.tabs(["🇪🇸 Español", "🇺🇸 English"])
+            
+                with tabs[0]:
+                    st.text_area(
+                        "📝 Post para Redes Sociales (ES):",
+                        post_es,
+                        height=220,
+                        key=f"post_es_{session.get('id')}"
+                    )
+            
+                with tabs[1]:
+                    st.text_area(
+                        "📝 Social Post (EN):",
+                        post_en,
+                        height=220,
+                        key=f"post_en_{session.get('id')}"
+                    )
+        
+        with col_btn3:
+            if st.button("📄 Artículo Medium", key=f"article_{session.get('id')}"):
+                article = content_generator.generate_medium_article(session)
+                st.download_button(
+                    label="📥 Descargar .md",
+                    data=article,
+                    file_name=f"día_{session.get('day')}_{session.get('date')}_medium.md",
+                    mime="text/markdown"
+                )
+        
+        with col_btn4:
+            if st.button("🗑️ Eliminar", key=f"delete_{session.get('id')}"):
+                if data_manager.delete_session(session.get('id'), base_updated_at=session.get('updated_at')):
+                    st.success("✅ Sesión eliminada")
+                    st.rerun()
+                else:
+                    st.error("❌ Error al eliminar")
@@ -0,0 +1,107 @@
+import streamlit as st
+from typing import Mapping, Optional, Sequence
+from utils import data_manager
+
+"""
+Elementos comunes a todas las páginas: configuración, cabecera y
+progreso en la barra lateral.
+"""
+
+
+def setup_page(title: str = "Study Tracker 100 Days") -> None:
+    """
+    Configurar la página e inicializar el session_state compartido.
+
+    Debe llamarse antes que cualquier otro comando de Streamlit.
+
+    Args:
+        title: Título de la pestaña del navegador
+    """
+    st.set_page_config(title, page_icon='📚', layout='wide')
+
+    # Inicialización de session_state
+    if 'show_form' not in st.session_state:
+        st.session_state.show_form = False
+    if 'edit_session' not in st.session_state:
+        st.session_state.edit_session = None
+
+
+def render_header() -> None:
+    """Mostrar la cabecera principal de la aplicación."""
+    st.markdown("""
+    <div style='background: linear-gradient(90deg, #4F46E5 0%, #7C3AED 100%);
+                padding: 2rem; border-radius: 10px; margin-bottom: 2rem;'>
+        <h1 style='color: white; text-align: center; margin: 0;'>📚 Study Tracker 100 Days</h1>
+        <p style='color: white; text-align: center; margin: 0.5rem 0 0 0; opacity: 0.9;'>
+            Getting better as Data Analyst | Physics Review | Preparing for Master's
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def render_sidebar_progress(sessions: Optional[Sequence[Mapping]] = None) -> None:
+    """
+    Mostrar el progreso del desafío en la barra lateral.
+
+    Las páginas que ya cargaron las sesiones las pasan para reutilizarlas.
+    Sin sesiones (formulario, inicio) solo se consulta el total, que no
+    requiere descargar la tabla.
+
+    Args:
+        sessions: Sesiones ya cargadas por la página, si las hay
+    """
+    with st.sidebar:
+        # Estadísticas rápidas
+        if sessions is not None:
+            total_sessions = len(sessions)
+        else:
+            total_sessions = data_manager.get_sessions_count()
+        progress_percent = min(total_sessions, 100) / 100 * 100
+
+        st.markdown("### 📈 Progress")
+        st.progress(progress_percent / 100)
+        st.caption(f"{total_sessions}/100 days")
+
+        if sessions:
+            streak = data_manager.get_current_streak(sessions)
+            total_hours = data_manager.get_total_hours_studied(sessions)
+
+            st.markdown(f"**🔥 Current streak:** {streak} days")
+            st.markdown(f"**⏱️ Total studied:** {total_hours}")
+
+
+def render_data_status() -> None:
+    """
+    Avisar si los datos mostrados están desactualizados o no se cargaron, si
+    hay escrituras en la cola offline y si alguna terminó en conflicto.
+    """
+    pending = data_manager.pending_writes_count()
+    if pending:
+        st.info(f"📴 {pending} cambio(s) pendientes de enviar a Supabase. "
+                "Se enviarán automáticamente al volver la conexión.")
+    
+    conflicts = data_manager.get_write_conflicts()
+    if conflicts:
+        with st.expander(f"⚠️ {len(conflicts)} cambio(s) offline no se aplicaron por conflicto", expanded=True):
+            for conflict in conflicts:
+                payload = conflict['payload'] or {}
+                action = "Editar" if conflict['op'] == "upsert" else "Eliminar"
+                st.markdown(
+                    f"- **{action}** `{conflict['session_id']}` "
+                    f"{payload.get('topic', '')}: {conflict['reason']}"
+                )
+            if st.button("Descartar conflictos", key="dismiss_write_conflicts"):
+                data_manager.dismiss_write_conflicts()
+                st.rerun()
+    
+    status = data_manager.get_data_status()
+    if not status['stale']:
+        return
+    
+    if status['as_of']:
+        st.warning(
+            f"⚠️ No se pudo conectar con Supabase. Mostrando datos guardados del "
+            f"{status['as_of'].strftime('%Y-%m-%d %H:%M')}; pueden estar desactualizados."
+        )
+    else:
+        st.error(f"❌ No se pudo conectar con Supabase: {status['error']}")
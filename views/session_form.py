@@ -0,0 +1,220 @@
+import streamlit as st
+from datetime import datetime
+from utils import data_manager
+from utils.enums import Category, Difficulty, FocusLevel, DEFAULT_DIFFICULTY, DEFAULT_FOCUS
+
+"""
+Formulario para registrar o editar una sesión de estudio.
+No carga el historial ni importa librerías de gráficos.
+"""
+
+
+def _current_value(session, field, enum, default):
+    """Valor de la sesión editada como miembro del enumerado, o el por defecto."""
+    value = enum.parse(session.get(field))
+    return value if isinstance(value, enum) else default
+
+
+def show_session_form():
+    """Show form for new session or editing."""
+    
+    is_edit = st.session_state.edit_session is not None
+    session_to_edit = st.session_state.edit_session if is_edit else {}
+    
+    title = "✏️ Edit Session" if is_edit else "➕ Register your Study Session"
+    st.markdown(f"## {title}")
+    
+    if is_edit:
+        st.info(f"Editing session for day {session_to_edit.get('day')}")
+    else:
+        st.info("""
+        📝 Completa este formulario para registrar tu sesión de estudio.
+        Todos los campos marcados con (*) son obligatorios.
+        """)
+    
+    with st.form("session_form", clear_on_submit=not is_edit):
+        # Fecha
+        default_date = datetime.now()
+        if is_edit and session_to_edit.get('date'):
+            default_date = datetime.fromisoformat(session_to_edit.get('date'))
+            
+        date_input = st.date_input("Fecha (*)", value=default_date, disabled=False) # Permitir editar fecha si es necesario
+        date_str = date_input.strftime('%Y-%m-%d')
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Categoría: se guarda la clave, se muestra la etiqueta
+            categories = list(Category)
+            cat_value = _current_value(session_to_edit, 'category', Category, categories[0])
+                
+            category = st.selectbox(
+                "Categoría (*)",
+                categories,
+                index=categories.index(cat_value),
+                format_func=lambda c: c.label
+            )
+        
+        with col2:
+            # Dificultad
+            diff_value = _current_value(session_to_edit, 'difficulty', Difficulty, DEFAULT_DIFFICULTY)
+                
+            difficulty = st.select_slider(
+                "Difficulty (*)",
+                options=list(Difficulty),
+                value=diff_value,
+                format_func=lambda d: d.label
+            )
+        
+        # Tema
+        topic = st.text_input(
+            "Topic studied (*)",
+            value=session_to_edit.get('topic', ''),
+            placeholder="Ej: Window Functions in SQL, Time Series Analysis, etc.",
+            help="Briefly describe the topic you studied"
+        )
+        
+        # Duration
+        duration = st.text_input(
+            "Duration (*)",
+            value=session_to_edit.get('duration', ''),
+            placeholder="Ej: 2 hours, 45 minutes, 1h 30min",
+            help="Free format: you can write as you prefer (2 hours, 90 minutes, etc.)"
+        )
+        
+        # Daily win
+        daily_win = st.text_area(
+            "Daily win (*)",
+            value=session_to_edit.get('daily_win', ''),
+            placeholder="What specific achievement did you get today? Ej: Finally understood how CTEs work",
+            help="The most important or satisfying achievement of this session",
+            height=80
+        )
+        
+        # Key learnings
+        key_learnings = st.text_area(
+            "Key learnings",
+            value=session_to_edit.get('key_learnings', ''),
+            placeholder="What did you learn today? What concepts or ideas were the most important?",
+            help="The most important or satisfying achievement of this session",
+            height=100
+        )
+        
+        # Resources used
+        resources = st.text_area(
+            "Resources used",
+            value=session_to_edit.get('resources', ''),
+            placeholder="Links, books, courses, videos, articles you used...",
+            help="Resources you consulted during the session",
+            height=100
+        )
+        
+        # Focus level
+        focus_value = _current_value(session_to_edit, 'focus_level', FocusLevel, DEFAULT_FOCUS)
+            
+        focus_level = st.select_slider(
+            "Focus level",
+            options=list(FocusLevel),
+            value=focus_value,
+            format_func=lambda f: f.label
+        )
+        
+        # Obstacles
+        obstacles = st.text_area(
+            "Obstacles faced",
+            value=session_to_edit.get('obstacles', ''),
+            placeholder="What difficulties did you face? (optional)",
+            help="Problems, blocks or challenges you faced",
+            height=80
+        )
+        
+        # Next steps
+        next_steps = st.text_area(
+            "Next steps",
+            value=session_to_edit.get('next_steps', ''),
+            placeholder="What do you plan to study in your next session? (optional)",
+            help="What you want to review or learn next",
+            height=80
+        )
+        
+        # Practical application
+        practical_application = st.text_area(
+            "Practical application",
+            value=session_to_edit.get('practical_application', ''),
+            placeholder="How can you apply this in your work as an analyst? (optional)",
+            help="Connection between what you learned and your current job",
+            height=80
+        )
+        
+        # Submit button
+        btn_label = "💾 Update Session" if is_edit else "💾 Save Session"
+        submitted = st.form_submit_button(
+            btn_label,
+            use_container_width=True,
+            type="primary"
+        )
+        
+        if submitted:
+            # Validate required fields
+            if not topic:
+                st.error("❌ Please complete the 'Topic studied' field")
+            elif not duration:
+                st.error("❌ Please complete the 'Duration' field")
+            elif not daily_win:
+                st.error("❌ Please complete the 'Daily win' field")
+            else:
+                # Create session object
+                session_data = {
+                    'date': date_str,
+                    'category': category.key,
+                    'topic': topic,
+                    'duration': duration,
+                    'daily_win': daily_win,
+                    'key_learnings': key_learnings if key_learnings else "",
+                    'resources': resources if resources else "",
+                    'difficulty': difficulty.key,
+                    'focus_level': focus_level.key,
+                    'obstacles': obstacles if obstacles else "",
+                    'next_steps': next_steps if next_steps else "",
+                    'practical_application': practical_application if practical_application else ""
+                }
+                
+                if is_edit:
+                    # Maintain ID and other fields
+                    session_data['id'] = session_to_edit['id']
+                    session_data['day'] = session_to_edit['day']
+                    session_data['created_at'] = session_to_edit['created_at']
+                    
+                    if data_manager.save_session(session_data, base_updated_at=session_to_edit.get('updated_at')):
+                        st.success("✅ ¡Session updated successfully!")
+                        st.session_state.edit_session = None # Limpiar estado
+                        st.balloons()
+                        show_offline_notice()
+                    else:
+                        st.error("❌ Error updating session.")
+                else:
+                    # Guardar nueva sesión
+                    if data_manager.add_session(session_data):
+                        st.success("✅ ¡Session saved successfully!")
+                        st.balloons()
+                        
+                        # Show summary
+                        st.info(f"""
+                        📊 **Session registered:**
+                        - Day {session_data['day']}/100
+                        - Topic: {topic}
+                        - Category: {category.label}
+                        
+                        You can generate a post for social media in the "History" section
+                        """)
+                        show_offline_notice()
+                    else:
+                        st.error("❌ Error saving session. Please try again.")
+
+
+def show_offline_notice():
+    """Avisar si la sesión quedó en la cola offline en lugar de en Supabase."""
+    pending = data_manager.pending_writes_count()
+    if pending:
+        st.info(f"📴 No connection to Supabase: {pending} change(s) saved locally. "
+                "They will be sent automatically when the connection is back.")